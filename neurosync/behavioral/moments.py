@@ -356,6 +356,21 @@ class InsightDetector:
             (t, s) for t, s in self._frustration_history if t >= cutoff
         ]
 
+    def record_frustration_batch(self, samples: list[tuple[float, float]]) -> None:
+        """
+        Record several ``(timestamp_sec, score)`` samples in chronological order.
+
+        Equivalent to calling :meth:`record_frustration` for each sample, but the
+        5-minute window is pruned once against the latest timestamp.
+        """
+        if not samples:
+            return
+        self._frustration_history.extend(samples)
+        cutoff = samples[-1][0] - 300
+        self._frustration_history = [
+            (t, s) for t, s in self._frustration_history if t >= cutoff
+        ]
+
     def check_insight(
         self,
         event: QuestionEvent,
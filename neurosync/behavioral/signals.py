@@ -20,7 +20,6 @@ from typing import Any, Protocol, runtime_checkable
 
 import numpy as np
 from loguru import logger
-from scipy import stats as scipy_stats
 
 from neurosync.config.settings import get_threshold
 from neurosync.core.constants import (
@@ -95,17 +94,16 @@ class ResponseTimeSignal:
             self._result = ResponseTimeResult()
             return self._result
 
-        times_list = list(self._times)
-        mean_rt = float(np.mean(times_list))
-        fast_count = sum(1 for t in times_list if t < self._fast_threshold)
-        fast_rate = fast_count / len(times_list)
+        times = np.fromiter(self._times, dtype=np.float64, count=len(self._times))
+        mean_rt = float(times.mean())
+        fast_rate = np.count_nonzero(times < self._fast_threshold) / times.size
 
         # Trend: compare mean of last 3 vs mean of previous 7 (or whatever we have)
         trend = TREND_STABLE
-        if len(times_list) >= 4:
-            split = max(1, len(times_list) - 3)
-            recent_mean = float(np.mean(times_list[split:]))
-            earlier_mean = float(np.mean(times_list[:split]))
+        if times.size >= 4:
+            split = max(1, times.size - 3)
+            recent_mean = float(times[split:].mean())
+            earlier_mean = float(times[:split].mean())
             if earlier_mean > 0:
                 ratio = recent_mean / earlier_mean
                 if ratio > 1.2:
@@ -173,16 +171,13 @@ class RewindSignal:
 
         # Burst detection: 3+ rewinds in 60 seconds
         burst_detected = False
-        rewind_list = list(self._rewind_events)
-        burst_window_ms = self._burst_window_seconds * 1000
-        for i in range(len(rewind_list)):
-            count_in_window = sum(
-                1 for j in range(i, len(rewind_list))
-                if rewind_list[j] - rewind_list[i] <= burst_window_ms
-            )
-            if count_in_window >= self._burst_threshold:
-                burst_detected = True
-                break
+        if rewind_count >= self._burst_threshold:
+            ts = np.sort(np.fromiter(self._rewind_events, dtype=np.float64, count=rewind_count))
+            burst_window_ms = self._burst_window_seconds * 1000
+            # Sliding window over sorted times: a burst exists iff some run of
+            # `threshold` consecutive rewinds spans no more than the window.
+            span = self._burst_threshold - 1
+            burst_detected = bool(np.any(ts[span:] - ts[:rewind_count - span] <= burst_window_ms))
 
         # Repeated segments
         repeated = [seg for seg, cnt in self._segment_rewinds.items() if cnt >= 2]
@@ -234,24 +229,25 @@ class IdleSignal:
             self._result = IdleResult()
             return self._result
 
-        total_idle = sum(d for _, d in self._all_idles)
-        longest_idle = max(d for _, d in self._all_idles)
+        idles = np.asarray(self._all_idles, dtype=np.float64)
+        ts, durations = idles[:, 0], idles[:, 1]
+        total_idle = float(durations.sum())
+        longest_idle = float(durations.max())
 
         # Idle frequency: idles per minute over recent window
         now = time.time() * 1000.0
         window_ms = self._window_minutes * 60 * 1000
-        recent = [(t, d) for t, d in self._all_idles if t >= now - window_ms]
-        idle_frequency = len(recent) / self._window_minutes if self._window_minutes > 0 else 0.0
+        recent_count = int(np.count_nonzero(ts >= now - window_ms))
+        idle_frequency = recent_count / self._window_minutes if self._window_minutes > 0 else 0.0
 
         # Trend: compare idle frequency in last 2 min vs prior 3 min
         trend = "stable"
         two_min_ms = 2 * 60 * 1000
         three_min_ms = 3 * 60 * 1000
-        recent_2min = sum(1 for t, _ in self._all_idles if t >= now - two_min_ms)
-        prior_3min = sum(
-            1 for t, _ in self._all_idles
-            if now - (two_min_ms + three_min_ms) <= t < now - two_min_ms
-        )
+        recent_2min = int(np.count_nonzero(ts >= now - two_min_ms))
+        prior_3min = int(np.count_nonzero(
+            (ts >= now - (two_min_ms + three_min_ms)) & (ts < now - two_min_ms)
+        ))
         # Normalise by time window
         recent_rate = recent_2min / 2.0
         prior_rate = prior_3min / 3.0 if prior_3min > 0 else 0.0
@@ -305,19 +301,17 @@ class InteractionVarianceSignal:
             self._result = InteractionVarianceResult()
             return self._result
 
-        ts = list(self._timestamps)
-        intervals = [ts[i + 1] - ts[i] for i in range(len(ts) - 1)]
-
-        if not intervals:
-            self._result = InteractionVarianceResult()
-            return self._result
+        # Difference the absolute ms timestamps in float64, then narrow: the
+        # intervals themselves are small enough for float32.
+        ts = np.fromiter(self._timestamps, dtype=np.float64, count=len(self._timestamps))
+        intervals = np.diff(ts).astype(np.float32)
 
-        mean_interval = float(np.mean(intervals))
+        mean_interval = float(intervals.mean())
         if mean_interval == 0:
             variance = 0.0
         else:
-            # Coefficient of variation
-            variance = float(scipy_stats.variation(intervals))
+            # Coefficient of variation (population std / mean)
+            variance = float(intervals.std()) / mean_interval
 
         # Trend
         if variance > self._threshold * 1.5:
@@ -20,6 +20,7 @@ class QuizOutput:
     question_count: int
     total_points: int
     concept_count: int
+    content: str = ""
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -53,7 +54,8 @@ class QuizExporter:
         path.parent.mkdir(parents=True, exist_ok=True)
 
         data = quiz_bank.to_dict()
-        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        content = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        path.write_bytes(content.encode("utf-8"))
 
         return QuizOutput(
             path=str(path),
@@ -61,4 +63,5 @@ class QuizExporter:
             question_count=len(quiz_bank.questions),
             total_points=quiz_bank.total_points,
             concept_count=len(quiz_bank.concept_coverage),
+            content=content,
         )
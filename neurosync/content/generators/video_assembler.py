@@ -2,24 +2,33 @@
 NeuroSync AI — Video Assembler.
 
 Assembles narrated video from slides, audio clips, and diagrams
-using MoviePy.  Supports two slide-rendering backends:
+using MoviePy.  Supports three slide-rendering backends:
 
 * **libreoffice** — PPTX → PDF → PNG via ``soffice`` + ``pdftoppm``
   (highest fidelity, Linux / macOS).
 * **pillow** — text-only rendering via Pillow (cross-platform fallback).
+* **cairo** — text-only rendering via ``cairocffi`` (opt-in; faster
+  rasterisation than Pillow, falls back to it if cairocffi is missing).
 
-The best available method is auto-detected at construction time.
+The best available method is auto-detected at construction time unless
+one is passed explicitly.
 """
 
 from __future__ import annotations
 
+import asyncio
 import glob
+import io
 import os
 import shutil
 import subprocess
 import textwrap
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -61,6 +70,127 @@ _BODY_FONT_SIZE = 48
 _TEXT_WRAP_WIDTH = 60
 _LIBREOFFICE_TIMEOUT = 60   # seconds
 _PDFTOPPM_TIMEOUT = 120     # seconds
+_MAX_RENDER_WORKERS = 5     # cap on parallel Pillow slide renders
+_UNO_CONNECT_POLL = 0.2     # seconds between connection attempts
+_PDF_EXPORT_FILTER = "impress_pdf_Export"
+
+
+@lru_cache(maxsize=8)
+def _detect_best_method_cached(
+    soffice_path: Optional[str], pdftoppm_path: Optional[str],
+) -> str:
+    """Return ``'libreoffice'`` or ``'pillow'`` for the given tool lookups.
+
+    Keyed on the ``shutil.which`` results, so the decision (and the
+    fallback warning) happens once per distinct host setup.
+    """
+    if soffice_path and pdftoppm_path:
+        return "libreoffice"
+
+    logger.warning(
+        "LibreOffice/poppler not found — falling back to Pillow "
+        "text-only slide rendering"
+    )
+    return "pillow"
+
+
+def _ffmpeg_exe() -> str:
+    """Path to ffmpeg: the binary bundled with MoviePy's imageio-ffmpeg, else PATH."""
+    try:
+        import imageio_ffmpeg
+    except ImportError:
+        return "ffmpeg"
+    return imageio_ffmpeg.get_ffmpeg_exe()
+
+
+def _slide_texts(pptx_path: Path) -> tuple[tuple[str, str], ...]:
+    """(title, body) for every slide in *pptx_path*, parsed once per file version."""
+    st = pptx_path.stat()
+    return _slide_texts_cached(str(pptx_path.resolve()), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4)
+def _slide_texts_cached(
+    pptx_path: str, mtime_ns: int, size: int,
+) -> tuple[tuple[str, str], ...]:
+    """Parse the deck and extract its slide text.
+
+    Keyed on path + mtime + size, so re-rendering an unchanged deck skips
+    the python-pptx XML parse while an edited one is read afresh.  Only
+    the plain-string tuple is cached, never the mutable Presentation.
+    """
+    from pptx import Presentation
+
+    prs = Presentation(pptx_path)
+    return tuple(VideoAssembler._extract_slide_text(slide) for slide in prs.slides)
+
+
+def _load_uno() -> Any:
+    """Return LibreOffice's ``uno`` bridge module, or ``None`` if unavailable."""
+    try:
+        import uno  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return uno
+
+
+@lru_cache(maxsize=1)
+def _output_sink_class() -> type:
+    """Build (once) a UNO ``XOutputStream`` that collects bytes in memory."""
+    import unohelper  # type: ignore[import-not-found]
+    from com.sun.star.io import XOutputStream  # type: ignore[import-not-found]
+
+    class _BytesSink(unohelper.Base, XOutputStream):  # type: ignore[misc]
+        def __init__(self) -> None:
+            self._buffer = io.BytesIO()
+
+        def writeBytes(self, data: Any) -> None:  # noqa: N802 — UNO API
+            self._buffer.write(data.value)
+
+        def flush(self) -> None:
+            pass
+
+        def closeOutput(self) -> None:  # noqa: N802 — UNO API
+            pass
+
+        def getvalue(self) -> bytes:
+            return self._buffer.getvalue()
+
+    return _BytesSink
+
+
+def _stop_soffice(proc: subprocess.Popen[bytes], profile: Optional[Path] = None) -> None:
+    """Terminate a ``soffice`` daemon, killing it if it ignores SIGTERM.
+
+    *profile*, the daemon's private user installation, is removed once the
+    process is gone.
+    """
+    if proc.poll() is None:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        logger.info("Stopped soffice daemon")
+    if profile is not None:
+        shutil.rmtree(profile, ignore_errors=True)
+
+
+def _make_output_sink() -> Any:
+    """Return a fresh in-memory UNO output stream."""
+    return _output_sink_class()()
+
+
+def _uno_props(uno: Any, **values: Any) -> tuple[Any, ...]:
+    """Build a tuple of ``com.sun.star.beans.PropertyValue`` structs."""
+    props = []
+    for name, value in values.items():
+        prop = uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+        prop.Name = name
+        prop.Value = value
+        props.append(prop)
+    return tuple(props)
 
 
 # ---------------------------------------------------------------------------
@@ -83,19 +213,32 @@ class VideoAssembler:
         codec: str = "libx264",
         audio_codec: str = "aac",
         default_slide_duration: float = 8.0,
+        max_workers: Optional[int] = None,
+        method: Optional[str] = None,
     ) -> None:
         self.fps = fps
         self.resolution = resolution
         self.codec = codec
         self.audio_codec = audio_codec
         self.default_slide_duration = default_slide_duration
+        # Threads for Pillow rendering (Pillow drops the GIL while drawing
+        # and encoding); 1 renders serially on the calling thread.
+        self.max_workers = max_workers or min(os.cpu_count() or 1, _MAX_RENDER_WORKERS)
 
         # Temp directory for intermediate artefacts
         self.temp_dir = Path("temp_slides")
         self.temp_dir.mkdir(exist_ok=True)
 
+        # Long-running ``soffice`` listener, started on first UNO conversion.
+        # The finalizer stops it if the assembler is dropped (or the
+        # interpreter exits) without close().
+        self._soffice_daemon: Optional[subprocess.Popen[bytes]] = None
+        self._daemon_profile: Optional[Path] = None
+        self._daemon_finalizer: Optional[weakref.finalize] = None
+        self._uno_desktop: Any = None
+
         # Auto-detect best rendering backend
-        self.method = self._detect_best_method()
+        self.method = method or self._detect_best_method()
         logger.info(f"Video rendering method: {self.method}")
 
     # ------------------------------------------------------------------
@@ -104,29 +247,23 @@ class VideoAssembler:
 
     def _detect_best_method(self) -> str:
         """Return ``'libreoffice'`` or ``'pillow'`` based on host tools."""
-        has_soffice = shutil.which("soffice") is not None
-        has_pdftoppm = shutil.which("pdftoppm") is not None
-
-        if has_soffice and has_pdftoppm:
-            return "libreoffice"
-
-        logger.warning(
-            "LibreOffice/poppler not found — falling back to Pillow "
-            "text-only slide rendering"
-        )
-        return "pillow"
+        return _detect_best_method_cached(shutil.which("soffice"), shutil.which("pdftoppm"))
 
     # ------------------------------------------------------------------
     # PPTX → images (dispatcher)
     # ------------------------------------------------------------------
 
-    def pptx_to_images(self, pptx_path: str | Path) -> list[Path]:
+    def pptx_to_images(
+        self, pptx_path: str | Path, max_slides: Optional[int] = None,
+    ) -> list[Path]:
         """Convert a PPTX file to a list of PNG images.
 
         Automatically selects the best available pipeline.
 
         Args:
             pptx_path: Path to the ``.pptx`` file.
+            max_slides: Render only the first *max_slides* slides
+                (default: the whole deck).  Must be at least 1.
 
         Returns:
             Sorted list of ``Path`` objects pointing to generated PNGs.
@@ -134,30 +271,176 @@ class VideoAssembler:
         pptx_path = Path(pptx_path)
         if not pptx_path.exists():
             raise FileNotFoundError(f"PPTX not found: {pptx_path}")
+        if max_slides is not None and max_slides < 1:
+            raise ValueError(f"max_slides must be >= 1, got {max_slides}")
 
         if self.method == "libreoffice":
             try:
-                return self._pptx_to_images_libreoffice(pptx_path)
+                return self._pptx_to_images_libreoffice(pptx_path, max_slides)
             except Exception as exc:
                 logger.error(f"LibreOffice pipeline failed: {exc}")
                 logger.warning("Falling back to Pillow rendering")
-                return self._pptx_to_images_pillow(pptx_path)
+                return self._pptx_to_images_pillow(pptx_path, max_slides)
 
-        return self._pptx_to_images_pillow(pptx_path)
+        if self.method == "cairo":
+            try:
+                return self._pptx_to_images_cairo(pptx_path, max_slides)
+            except ImportError:
+                logger.warning("cairocffi not installed — falling back to Pillow rendering")
+                return self._pptx_to_images_pillow(pptx_path, max_slides)
+
+        return self._pptx_to_images_pillow(pptx_path, max_slides)
 
     # ------------------------------------------------------------------
     # LibreOffice pipeline  (PPTX → PDF → PNG)
     # ------------------------------------------------------------------
 
-    def _pptx_to_images_libreoffice(self, pptx_path: Path) -> list[Path]:
-        """High-fidelity rendering via LibreOffice + pdftoppm."""
-        pdf_path = self._convert_pptx_to_pdf(pptx_path)
-        png_paths = self._convert_pdf_to_pngs(pdf_path)
+    def _pptx_to_images_libreoffice(
+        self, pptx_path: Path, max_slides: Optional[int] = None,
+    ) -> list[Path]:
+        """High-fidelity rendering via LibreOffice + pdftoppm.
+
+        With the UNO bridge the PDF is exported into memory and piped to
+        ``pdftoppm`` on stdin, so no intermediate file touches the disk.
+        (A direct ``--convert-to png`` is not an option: Impress only
+        exports the first slide that way.)
+        """
+        uno = _load_uno()
+        pdf: Path | bytes
+        if uno is None:
+            pdf = self._convert_pptx_to_pdf_subprocess(pptx_path)
+        else:
+            pdf = self._export_pdf_bytes(uno, pptx_path)
+        png_paths = self._convert_pdf_to_pngs(pdf, last_page=max_slides)
         logger.info(f"Generated {len(png_paths)} slide images (libreoffice)")
         return png_paths
 
     def _convert_pptx_to_pdf(self, pptx_path: Path) -> Path:
-        """Convert PPTX to PDF using ``soffice --headless``."""
+        """Convert PPTX to PDF.
+
+        Uses a persistent ``soffice`` daemon over the UNO bridge when the
+        ``uno`` module is importable, so LibreOffice only starts once per
+        assembler; otherwise runs a one-shot ``soffice --headless``.
+        """
+        uno = _load_uno()
+        if uno is None:
+            return self._convert_pptx_to_pdf_subprocess(pptx_path)
+
+        pdf_path = self.temp_dir / (pptx_path.stem + ".pdf")
+        pdf_path.write_bytes(self._export_pdf_bytes(uno, pptx_path))
+        return pdf_path
+
+    def _export_pdf_bytes(self, uno: Any, pptx_path: Path) -> bytes:
+        """Export PPTX to PDF in memory through the ``soffice`` daemon.
+
+        UNO calls have no timeout of their own, so the export runs on a
+        worker thread bounded by ``_LIBREOFFICE_TIMEOUT``.  A hung export
+        stops the daemon, which also breaks the stuck bridge call.
+        """
+        logger.info("Converting PPTX to PDF (UNO)...")
+        desktop = self._ensure_soffice_daemon(uno)
+        pool = ThreadPoolExecutor(max_workers=1)
+        try:
+            future = pool.submit(self._store_pdf_via_uno, uno, desktop, pptx_path)
+            pdf_bytes = future.result(timeout=_LIBREOFFICE_TIMEOUT)
+        except FutureTimeoutError:
+            self.close()
+            raise RuntimeError(f"soffice timed out converting {pptx_path}") from None
+        finally:
+            pool.shutdown(wait=False)
+
+        if not pdf_bytes:
+            raise RuntimeError(f"soffice exported an empty PDF for {pptx_path}")
+        return pdf_bytes
+
+    @staticmethod
+    def _store_pdf_via_uno(uno: Any, desktop: Any, pptx_path: Path) -> bytes:
+        """Load *pptx_path* into *desktop* and store it as PDF bytes."""
+        doc = desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(str(pptx_path.resolve())),
+            "_blank", 0, _uno_props(uno, Hidden=True),
+        )
+        if doc is None:
+            raise RuntimeError(f"soffice could not open {pptx_path}")
+
+        sink = _make_output_sink()
+        try:
+            doc.storeToURL(
+                "private:stream",
+                _uno_props(uno, FilterName=_PDF_EXPORT_FILTER, OutputStream=sink),
+            )
+        finally:
+            doc.close(True)
+        return sink.getvalue()
+
+    def _ensure_soffice_daemon(self, uno: Any) -> Any:
+        """Start the ``soffice`` UNO listener once and return its Desktop.
+
+        Later calls reuse the running instance; a daemon that has exited is
+        restarted.  The daemon listens on a private named pipe and uses a
+        user profile named after that pipe.  LibreOffice picks its
+        single-instance IPC from the profile, so this keeps it from handing
+        off to an interactive LibreOffice or another assembler's daemon.
+        """
+        if self._uno_desktop is not None and self._soffice_daemon is not None \
+                and self._soffice_daemon.poll() is None:
+            return self._uno_desktop
+
+        self.close()
+        pipe_name = f"neurosync_{os.getpid()}_{id(self)}"
+        profile = (self.temp_dir / f"lo_profile_{pipe_name}").resolve()
+        self._daemon_profile = profile
+        self._soffice_daemon = subprocess.Popen(
+            [
+                "soffice",
+                f"-env:UserInstallation={profile.as_uri()}",
+                "--headless", "--invisible", "--norestore",
+                f"--accept=pipe,name={pipe_name};urp;",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        self._daemon_finalizer = weakref.finalize(
+            self, _stop_soffice, self._soffice_daemon, profile,
+        )
+        logger.info(f"Started soffice daemon (pid={self._soffice_daemon.pid})")
+
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local,
+        )
+        deadline = time.monotonic() + _LIBREOFFICE_TIMEOUT
+        while True:
+            try:
+                ctx = resolver.resolve(
+                    f"uno:pipe,name={pipe_name};urp;StarOffice.ComponentContext"
+                )
+                break
+            except Exception:  # NoConnectException until soffice is listening
+                if time.monotonic() > deadline or self._soffice_daemon.poll() is not None:
+                    self.close()
+                    raise RuntimeError("soffice daemon did not accept UNO connections")
+                time.sleep(_UNO_CONNECT_POLL)
+
+        self._uno_desktop = ctx.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", ctx,
+        )
+        return self._uno_desktop
+
+    def close(self) -> None:
+        """Terminate the ``soffice`` daemon, if one was started, and remove
+        its profile directory."""
+        self._uno_desktop = None
+        proc, self._soffice_daemon = self._soffice_daemon, None
+        profile, self._daemon_profile = self._daemon_profile, None
+        finalizer, self._daemon_finalizer = self._daemon_finalizer, None
+        if finalizer is not None:
+            finalizer.detach()
+        if proc is not None:
+            _stop_soffice(proc, profile)
+
+    def _convert_pptx_to_pdf_subprocess(self, pptx_path: Path) -> Path:
+        """Convert PPTX to PDF using a one-shot ``soffice --headless``."""
         logger.info("Converting PPTX to PDF...")
         result = subprocess.run(
             [
@@ -184,29 +467,126 @@ class VideoAssembler:
             )
         return pdf_path
 
-    def _convert_pdf_to_pngs(self, pdf_path: Path) -> list[Path]:
-        """Convert PDF pages to PNG images using ``pdftoppm``."""
+    async def convert_many_async(
+        self,
+        pptx_paths: list[str | Path],
+        max_concurrency: int = 5,
+    ) -> list[Path]:
+        """Convert several PPTX files to PDF with concurrent ``soffice`` runs.
+
+        At most *max_concurrency* conversions run at once.  Each slot uses
+        its own LibreOffice user profile, since instances sharing a profile
+        refuse to run side by side.  Each deck gets its own output directory
+        (``pdf_<index>``), emptied first, so decks sharing a file stem never
+        collide and a run that writes nothing cannot return an earlier PDF.
+        If one conversion fails, the others are cancelled and their
+        ``soffice`` processes killed.
+
+        Returns:
+            PDF paths in the same order as *pptx_paths*.
+        """
+        slots: asyncio.Queue[int] = asyncio.Queue()
+        for slot in range(max(1, max_concurrency)):
+            slots.put_nowait(slot)
+
+        async def kill(proc: asyncio.subprocess.Process) -> None:
+            if proc.returncode is None:
+                proc.kill()
+            await proc.wait()
+
+        async def convert(index: int, pptx_path: Path) -> Path:
+            outdir = self.temp_dir / f"pdf_{index}"
+            shutil.rmtree(outdir, ignore_errors=True)
+            outdir.mkdir()
+            slot = await slots.get()
+            try:
+                profile = (self.temp_dir / f"lo_profile_{slot}").resolve()
+                proc = await asyncio.create_subprocess_exec(
+                    "soffice",
+                    f"-env:UserInstallation={profile.as_uri()}",
+                    "--headless",
+                    "--convert-to", "pdf",
+                    "--outdir", str(outdir),
+                    str(pptx_path),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                try:
+                    _, stderr = await asyncio.wait_for(
+                        proc.communicate(), timeout=_LIBREOFFICE_TIMEOUT,
+                    )
+                except asyncio.TimeoutError:
+                    await kill(proc)
+                    raise RuntimeError(f"soffice timed out converting {pptx_path}")
+                except asyncio.CancelledError:
+                    # A sibling conversion failed; don't leave soffice running.
+                    await kill(proc)
+                    raise
+            finally:
+                slots.put_nowait(slot)
+
+            if proc.returncode != 0:
+                raise RuntimeError(
+                    f"soffice failed (rc={proc.returncode}): "
+                    f"{stderr.decode(errors='replace')}"
+                )
+            pdf_path = outdir / (pptx_path.stem + ".pdf")
+            if not pdf_path.exists():
+                raise FileNotFoundError(
+                    f"Expected PDF not found after conversion: {pdf_path}"
+                )
+            return pdf_path
+
+        logger.info(f"Converting {len(pptx_paths)} PPTX files to PDF...")
+        tasks = [
+            asyncio.ensure_future(convert(i, Path(p))) for i, p in enumerate(pptx_paths)
+        ]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def _convert_pdf_to_pngs(
+        self, pdf: Path | bytes, last_page: Optional[int] = None,
+    ) -> list[Path]:
+        """Convert PDF pages to PNG images using ``pdftoppm``.
+
+        *pdf* is either a file path or the PDF bytes, which are piped to
+        ``pdftoppm`` on stdin.  *last_page* stops rasterising after that
+        page.
+        """
         logger.info("Converting PDF to PNG images...")
         output_prefix = self.temp_dir / "slide"
+        piped = isinstance(pdf, bytes)
+        # Leftovers from an earlier render (possibly zero-padded differently)
+        # would otherwise be globbed in below.
+        for stale in self.temp_dir.glob("slide-*.png"):
+            stale.unlink()
 
         result = subprocess.run(
             [
                 "pdftoppm",
                 "-png",
                 "-r", "150",           # 150 DPI
-                str(pdf_path),
+                *(["-l", str(last_page)] if last_page is not None else []),
+                "-" if piped else str(pdf),
                 str(output_prefix),
             ],
+            input=pdf if piped else None,
             capture_output=True,
-            text=True,
             timeout=_PDFTOPPM_TIMEOUT,
         )
         if result.returncode != 0:
             raise RuntimeError(
-                f"pdftoppm failed (rc={result.returncode}): {result.stderr}"
+                f"pdftoppm failed (rc={result.returncode}): "
+                f"{result.stderr.decode(errors='replace')}"
             )
 
-        # pdftoppm names files  slide-1.png, slide-2.png, …
+        # pdftoppm names files  slide-1.png, slide-2.png, …  (zero-padded to
+        # the page count, so a lexicographic sort is page order)
         png_paths = sorted(self.temp_dir.glob("slide-*.png"))
         if not png_paths:
             raise FileNotFoundError(
@@ -218,31 +598,83 @@ class VideoAssembler:
     # Pillow fallback  (text-only rendering)
     # ------------------------------------------------------------------
 
-    def _pptx_to_images_pillow(self, pptx_path: Path) -> list[Path]:
+    def _pptx_to_images_pillow(
+        self, pptx_path: Path, max_slides: Optional[int] = None,
+    ) -> list[Path]:
         """Render slide text onto 1920×1080 images with Pillow."""
         from PIL import Image, ImageDraw, ImageFont
-        from pptx import Presentation
 
         logger.warning("Using basic text-only rendering")
-        prs = Presentation(str(pptx_path))
-        image_paths: list[Path] = []
-        total = len(prs.slides)
+        # Text is extracted up front; only rendering fans out to threads.
+        texts = _slide_texts(pptx_path)[:max_slides]
+        total = len(texts)
 
-        for i, slide in enumerate(prs.slides):
+        def render(i: int) -> Path:
             t0 = time.monotonic()
-            title, body = self._extract_slide_text(slide)
-            img = self._render_text_image(title, body)
-
+            title, body = texts[i]
             out = self.temp_dir / f"slide_{i:03d}.png"
-            img.save(str(out))
-            image_paths.append(out)
-
+            self._render_text_image(title, body).save(str(out))
             elapsed = time.monotonic() - t0
             logger.info(f"Processed slide {i + 1}/{total} ({elapsed:.1f}s)")
+            return out
+
+        if self.max_workers <= 1 or total <= 1:
+            image_paths = [render(i) for i in range(total)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, total)) as pool:
+                image_paths = list(pool.map(render, range(total)))
 
         logger.info(f"Generated {len(image_paths)} slide images (pillow)")
         return image_paths
 
+    # ------------------------------------------------------------------
+    # Cairo renderer  (text-only, opt-in)
+    # ------------------------------------------------------------------
+
+    def _pptx_to_images_cairo(
+        self, pptx_path: Path, max_slides: Optional[int] = None,
+    ) -> list[Path]:
+        """Render slide text onto images with cairo, mirroring the Pillow layout."""
+        import cairocffi as cairo  # type: ignore[import-not-found]
+
+        w, h = self.resolution
+        bg = tuple(c / 255.0 for c in _BG_COLOR)
+        image_paths: list[Path] = []
+
+        for i, (title, body) in enumerate(_slide_texts(pptx_path)[:max_slides]):
+            surface = cairo.ImageSurface(cairo.FORMAT_RGB24, w, h)
+            ctx = cairo.Context(surface)
+            ctx.set_source_rgb(*bg)
+            ctx.paint()
+            ctx.set_source_rgb(1.0, 1.0, 1.0)
+            ctx.select_font_face("Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL)
+
+            # Title — centred near the top
+            ctx.set_font_size(_TITLE_FONT_SIZE)
+            ascent, _, line_height, *_ = ctx.font_extents()
+            y = 120 + ascent
+            for line in textwrap.fill(title, width=_TEXT_WRAP_WIDTH).splitlines():
+                ctx.move_to((w - ctx.text_extents(line)[4]) / 2, y)
+                ctx.show_text(line)
+                y += line_height
+
+            # Body — left-aligned below title
+            if body:
+                ctx.set_font_size(_BODY_FONT_SIZE)
+                ascent, _, line_height, *_ = ctx.font_extents()
+                y = 320 + ascent
+                for line in textwrap.fill(body, width=_TEXT_WRAP_WIDTH).splitlines():
+                    ctx.move_to(120, y)
+                    ctx.show_text(line)
+                    y += line_height
+
+            out = self.temp_dir / f"slide_{i:03d}.png"
+            surface.write_to_png(str(out))
+            image_paths.append(out)
+
+        logger.info(f"Generated {len(image_paths)} slide images (cairo)")
+        return image_paths
+
     @staticmethod
     def _extract_slide_text(slide: Any) -> tuple[str, str]:
         """Pull title and body text from a python-pptx slide object."""
@@ -250,9 +682,15 @@ class VideoAssembler:
         body_parts: list[str] = []
 
         for shape in slide.shapes:
-            if not shape.has_text_frame:
+            try:
+                if not shape.has_text_frame:
+                    continue
+                text = shape.text_frame.text.strip()
+            except NotImplementedError:
+                # python-pptx raises this for shape types it cannot parse;
+                # skip the shape rather than losing the whole slide.
+                logger.debug(f"Skipping unsupported shape {getattr(shape, 'name', '?')!r}")
                 continue
-            text = shape.text_frame.text.strip()
             if not text:
                 continue
             # First shape with text becomes title if title is empty
@@ -299,8 +737,13 @@ class VideoAssembler:
         return img
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def _get_font(size: int) -> Any:
-        """Return a TrueType font or the default bitmap font."""
+        """Return a TrueType font or the default bitmap font.
+
+        Cached per size: resolving the path and parsing the TTF happens
+        once, not for every rendered slide.
+        """
         from PIL import ImageFont
 
         # Try common system font paths
@@ -359,6 +802,7 @@ class VideoAssembler:
         pptx_path: str | Path,
         audio_paths: list[str | Path],
         output_path: str | Path,
+        keep_intermediate_pngs: bool = True,
     ) -> AssembledVideo:
         """Build an MP4 video from a PPTX deck and per-slide audio files.
 
@@ -366,10 +810,17 @@ class VideoAssembler:
             pptx_path: Path to the ``.pptx`` presentation.
             audio_paths: One audio file per slide.
             output_path: Destination ``.mp4`` path.
+            keep_intermediate_pngs: When ``False`` and the ``pillow``
+                method is active, slides are rendered in memory and
+                streamed to ffmpeg as raw RGB frames — no PNGs are
+                written.
 
         Returns:
             ``AssembledVideo`` with metadata.
         """
+        if not keep_intermediate_pngs and self.method == "pillow":
+            return self._render_and_pipe_to_ffmpeg(pptx_path, audio_paths, output_path)
+
         from moviepy import AudioFileClip, ImageClip, concatenate_videoclips
 
         image_paths = self.pptx_to_images(pptx_path)
@@ -435,6 +886,105 @@ class VideoAssembler:
             file_size_bytes=file_size,
         )
 
+    def _render_and_pipe_to_ffmpeg(
+        self,
+        pptx_path: str | Path,
+        audio_paths: list[str | Path],
+        output_path: str | Path,
+    ) -> AssembledVideo:
+        """Render slides with Pillow and stream them to ffmpeg over stdin.
+
+        Each slide is held for its audio clip's duration; the per-slide
+        audio files are concatenated by ffmpeg itself.
+        """
+        pptx_path = Path(pptx_path)
+        if not pptx_path.exists():
+            raise FileNotFoundError(f"PPTX not found: {pptx_path}")
+
+        texts = _slide_texts(pptx_path)
+        if len(texts) != len(audio_paths):
+            logger.warning(
+                f"Slide/audio count mismatch ({len(texts)} slides, "
+                f"{len(audio_paths)} audio files) — using min"
+            )
+        count = min(len(texts), len(audio_paths))
+        if not count:
+            raise ValueError("No segments to assemble")
+
+        durations = [self._audio_duration(a) for a in audio_paths[:count]]
+
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        w, h = self.resolution
+        cmd = [
+            _ffmpeg_exe(), "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "rgb24",
+            "-s", f"{w}x{h}", "-r", str(self.fps), "-i", "-",
+        ]
+        for audio_path in audio_paths[:count]:
+            cmd += ["-i", str(audio_path)]
+        audio_inputs = "".join(f"[{i + 1}:a]" for i in range(count))
+        cmd += [
+            "-filter_complex", f"{audio_inputs}concat=n={count}:v=0:a=1[a]",
+            "-map", "0:v", "-map", "[a]",
+            "-c:v", self.codec, "-pix_fmt", "yuv420p",
+            "-c:a", self.audio_codec,
+            str(path),
+        ]
+
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            for (title, body), duration in zip(texts, durations):
+                frame = self._render_text_image(title, body).tobytes("raw", "RGB")
+                for _ in range(max(1, round(duration * self.fps))):
+                    proc.stdin.write(frame)  # type: ignore[union-attr]
+        except BrokenPipeError:
+            pass  # ffmpeg exited early; its stderr explains why
+        except BaseException:
+            # Rendering failed or was interrupted: don't leave ffmpeg
+            # waiting on stdin or a truncated MP4 behind.
+            try:
+                proc.stdin.close()  # type: ignore[union-attr]
+            except OSError:
+                pass
+            proc.kill()
+            proc.wait()
+            path.unlink(missing_ok=True)
+            raise
+        _, stderr = proc.communicate()
+        if proc.returncode != 0:
+            path.unlink(missing_ok=True)
+            raise RuntimeError(
+                f"ffmpeg failed (rc={proc.returncode}): "
+                f"{stderr.decode(errors='replace')}"
+            )
+
+        total_duration = sum(durations)
+        file_size = path.stat().st_size if path.exists() else 0
+        logger.info(
+            f"Assembled video: {path.name} ({total_duration:.1f}s, "
+            f"{count} segments, {file_size / (1024 * 1024):.1f}MB, piped)"
+        )
+        return AssembledVideo(
+            output_path=str(path),
+            total_duration_seconds=total_duration,
+            segment_count=count,
+            resolution=self.resolution,
+            fps=self.fps,
+            file_size_bytes=file_size,
+        )
+
+    @staticmethod
+    def _audio_duration(audio_path: str | Path) -> float:
+        """Duration of an audio file in seconds."""
+        from moviepy import AudioFileClip
+
+        audio = AudioFileClip(str(audio_path))
+        try:
+            return float(audio.duration)
+        finally:
+            audio.close()
+
     def assemble(self, segments: list[VideoSegment], output_path: str | Path) -> AssembledVideo:
         """Assemble video from pre-built segments (text-card mode).
 
@@ -523,7 +1073,10 @@ class VideoAssembler:
         with Image.open(image_path) as img:
             if img.size == self.resolution:
                 return image_path
-            resized = img.resize(self.resolution, Image.LANCZOS)
+            # Pillow >= 9.1 namespaces filters under Image.Resampling;
+            # Pillow-SIMD builds may predate it.
+            resampling = getattr(Image, "Resampling", Image)
+            resized = img.resize(self.resolution, resampling.LANCZOS)
             resized.save(image_path)
         return image_path
 
@@ -532,18 +1085,24 @@ class VideoAssembler:
         return sum(s.duration_seconds for s in segments)
 
     def cleanup(self) -> None:
-        """Remove temporary slide images and intermediate PDFs.
+        """Stop the ``soffice`` daemon and remove temporary slide images and
+        intermediate PDFs.
 
-        Skipped when the environment variable ``NEUROSYNC_DEBUG=1`` is set.
+        File removal is skipped when the environment variable
+        ``NEUROSYNC_DEBUG=1`` is set.
         """
+        self.close()
         if os.environ.get("NEUROSYNC_DEBUG") == "1":
             logger.info("NEUROSYNC_DEBUG=1 — keeping temp files in {}", self.temp_dir)
             return
 
         removed = 0
-        for pattern in ("*.png", "*.pdf"):
+        for pattern in ("*.png", "*.pdf", "pdf_*/*.pdf"):
             for f in self.temp_dir.glob(pattern):
                 f.unlink()
                 removed += 1
+        for outdir in self.temp_dir.glob("pdf_*"):
+            if outdir.is_dir() and not any(outdir.iterdir()):
+                outdir.rmdir()
 
         logger.info(f"Cleaned up {removed} temp files from {self.temp_dir}")
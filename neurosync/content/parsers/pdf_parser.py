@@ -10,7 +10,7 @@ from __future__ import annotations
 import hashlib
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Optional
 
 from loguru import logger
 
@@ -65,12 +65,14 @@ class PDFParser:
         self.max_pages = max_pages
         self.min_text_length = min_text_length
 
-    def parse(self, pdf_path: str | Path) -> PDFDocument:
+    def parse(self, pdf_path: str | Path | BinaryIO) -> PDFDocument:
         """
         Parse a PDF file and return a PDFDocument.
 
         Args:
-            pdf_path: Path to the PDF file.
+            pdf_path: Path to the PDF file, or a binary file-like object
+                (checked via the ``%PDF-`` magic bytes and read through
+                :meth:`parse_bytes`).
 
         Returns:
             PDFDocument with extracted pages, text, and tables.
@@ -81,6 +83,13 @@ class PDFParser:
         """
         import pdfplumber
 
+        if not isinstance(pdf_path, (str, Path)):
+            data = pdf_path.read()
+            filename = Path(getattr(pdf_path, "name", "upload.pdf")).name
+            if not data.startswith(b"%PDF-"):
+                raise ValueError(f"Not a PDF file: {filename}")
+            return self.parse_bytes(data, filename)
+
         path = Path(pdf_path)
         if not path.exists():
             raise FileNotFoundError(f"PDF not found: {path}")
@@ -103,9 +103,16 @@ class ProgressTracker:
         PipelineStage.EXPORTING: 0.05,
     }
 
+    # Tracker methods that batch_transitions() may replay
+    _BATCHABLE: frozenset[str] = frozenset({
+        "start_pipeline", "start_stage", "update_stage", "complete_stage",
+        "fail_stage", "complete_pipeline", "fail_pipeline",
+    })
+
     def __init__(self, callback: Optional[Callable[[PipelineProgress], None]] = None) -> None:
         self._progress = PipelineProgress()
         self._callback = callback
+        self._batching = False
 
         # Initialize all stages as pending
         for stage in PipelineStage:
@@ -181,6 +188,24 @@ class ProgressTracker:
         self._progress.completed_at = time.time()
         self._notify()
 
+    def batch_transitions(self, ops: list[tuple[Any, ...]]) -> None:
+        """
+        Apply several transitions in order with a single callback.
+
+        Each op is ``(method_name, *args)``, e.g.
+        ``("start_stage", PipelineStage.PARSING, "Reading PDF")``.
+        """
+        for op in ops:
+            if op[0] not in self._BATCHABLE:
+                raise ValueError(f"Unknown tracker transition: {op[0]!r}")
+        self._batching = True
+        try:
+            for name, *args in ops:
+                getattr(self, name)(*args)
+        finally:
+            self._batching = False
+        self._notify()
+
     def _update_overall(self) -> None:
         """Recalculate overall progress from stage weights."""
         total = 0.0
@@ -192,7 +217,7 @@ class ProgressTracker:
 
     def _notify(self) -> None:
         """Send progress update via callback."""
-        if self._callback:
+        if self._callback and not self._batching:
             try:
                 self._callback(self._progress)
             except Exception:
@@ -75,6 +75,24 @@ class DatabaseManager:
             conn.executemany(sql, params_list)
             conn.commit()
 
+    def execute_many_immediate(self, sql: str, params_list: list[tuple[Any, ...]]) -> None:
+        """
+        Execute a batch inside a ``BEGIN IMMEDIATE`` transaction.
+
+        Acquires the RESERVED lock up-front so concurrent writers never
+        race on the SHARED -> RESERVED upgrade at commit time. The whole
+        batch is rolled back if any statement fails.
+        """
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(sql, params_list)
+            except Exception:
+                conn.rollback()
+                raise
+            conn.commit()
+
     def fetch_one(self, sql: str, params: tuple[Any, ...] = ()) -> Optional[sqlite3.Row]:
         """Fetch a single row."""
         conn = self._get_connection()
@@ -87,6 +105,11 @@ class DatabaseManager:
         cursor = conn.execute(sql, params)
         return cursor.fetchall()
 
+    def backup_to(self, target: DatabaseManager) -> None:
+        """Copy this database into *target* using SQLite's online backup API."""
+        with self._lock:
+            self._get_connection().backup(target._get_connection())
+
     def close(self) -> None:
         """Close the thread-local connection if open."""
         conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
@@ -7,7 +7,8 @@ Handles logging raw events to the database.
 from __future__ import annotations
 
 import json
-from typing import Any, Optional
+import sqlite3
+from typing import Optional
 
 from loguru import logger
 
@@ -38,6 +39,26 @@ class EventRepository:
         )
         logger.debug("Event logged: {} ({})", event.event_type, event.event_id)
 
+    def insert_events_atomic(self, events: list[RawEvent]) -> None:
+        """Insert a batch of raw events in a single immediate transaction."""
+        self._db.execute_many_immediate(
+            """INSERT INTO events
+               (event_id, session_id, student_id, timestamp, event_type, metadata)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            [
+                (
+                    event.event_id,
+                    event.session_id,
+                    event.student_id,
+                    event.timestamp,
+                    event.event_type,
+                    json.dumps(event.metadata, default=str),
+                )
+                for event in events
+            ],
+        )
+        logger.debug("Event batch logged: {} events", len(events))
+
     def insert_question_attempt(self, event: QuestionEvent, authenticity_score: float = 0.0, mastery_flag: str = "accept") -> None:
         """Insert a question attempt record."""
         attempt_id = DatabaseManager.generate_id()
@@ -67,8 +88,13 @@ class EventRepository:
 
     def get_session_events(
         self, session_id: str, event_type: Optional[str] = None
-    ) -> list[dict[str, Any]]:
-        """Get all events for a session, optionally filtered by type."""
+    ) -> list[sqlite3.Row]:
+        """
+        Get all events for a session, optionally filtered by type.
+
+        Rows are returned as ``sqlite3.Row`` (key-indexable) without a
+        per-row ``dict`` copy.
+        """
         if event_type:
             rows = self._db.fetch_all(
                 "SELECT * FROM events WHERE session_id = ? AND event_type = ? ORDER BY timestamp",
@@ -79,7 +105,7 @@ class EventRepository:
                 "SELECT * FROM events WHERE session_id = ? ORDER BY timestamp",
                 (session_id,),
             )
-        return [dict(r) for r in rows]
+        return rows
 
     def get_event_count(self, session_id: str) -> int:
         """Get total number of events in a session."""
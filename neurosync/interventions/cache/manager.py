@@ -37,12 +37,21 @@ class CacheManager:
         self.max_size = max_size or int(INTERVENTION_COST_LIMITS["CACHE_MAX_SIZE"])
         self._memory_cache: dict[str, Any] = {}
         self._access_order: list[str] = []
+        # ":memory:" databases vanish with their connection, so keep one open
+        self._memory_conn: sqlite3.Connection | None = (
+            sqlite3.connect(self.db_path) if self.db_path == ":memory:" else None
+        )
         self._init_db()
 
     # ── DB bootstrap ────────────────────────────────────────────────
 
+    def _connect(self) -> sqlite3.Connection:
+        if self._memory_conn is not None:
+            return self._memory_conn
+        return sqlite3.connect(self.db_path)
+
     def _init_db(self) -> None:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS intervention_cache (
@@ -77,7 +86,7 @@ class CacheManager:
             return hit
 
         # Tier 2 — SQLite
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             row = conn.execute(
                 "SELECT intervention_type, content, tokens_used, created_at "
                 "FROM intervention_cache WHERE cache_key = ?",
@@ -109,8 +118,17 @@ class CacheManager:
 
     async def set(self, cache_key: str, content: Any) -> None:
         """Store a ``GeneratedContent`` in both tiers."""
+        self._persist(cache_key, content)
+        self._memory_cache[cache_key] = content
+        self._update_access_order(cache_key)
+
+        if len(self._access_order) > self.max_size:
+            self._evict_lru()
+
+    def _persist(self, cache_key: str, content: Any) -> None:
+        """Write one entry to the SQLite tier."""
         now = time.time()
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute(
                 """INSERT OR REPLACE INTO intervention_cache
                    (cache_key, intervention_type, content, tokens_used,
@@ -125,11 +143,6 @@ class CacheManager:
                     now,
                 ),
             )
-        self._memory_cache[cache_key] = content
-        self._update_access_order(cache_key)
-
-        if len(self._access_order) > self.max_size:
-            self._evict_lru()
 
     # ── LRU bookkeeping ────────────────────────────────────────────
 
@@ -144,7 +157,7 @@ class CacheManager:
             self._memory_cache.pop(lru_key, None)
 
         cutoff = time.time() - (int(INTERVENTION_COST_LIMITS["CACHE_TTL_DAYS"]) * 86400)
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute(
                 "DELETE FROM intervention_cache WHERE last_accessed < ?",
                 (cutoff,),
@@ -154,7 +167,7 @@ class CacheManager:
 
     def get_stats(self) -> dict[str, int]:
         """Return cache statistics."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             total = conn.execute("SELECT COUNT(*) FROM intervention_cache").fetchone()[0]
             total_accesses = (
                 conn.execute("SELECT SUM(access_count) FROM intervention_cache").fetchone()[0]
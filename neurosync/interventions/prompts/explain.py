@@ -49,6 +49,18 @@ class ExplainPrompts:
     @staticmethod
     def validate_length(response: str) -> str:
         """Ensure explanation is 40-60 words; truncate if needed."""
+        # Fast path: single-space separated text with only printable
+        # characters has exactly count(" ") + 1 words, so in-range
+        # responses can be accepted without building a word list.
+        if (
+            39 <= response.count(" ") <= 59
+            and "  " not in response
+            and not response.startswith(" ")
+            and not response.endswith(" ")
+            and response.isprintable()
+        ):
+            return response
+
         words = response.split()
         word_count = len(words)
 
@@ -71,6 +71,34 @@ class ChunkTracker:
             (t, c) for t, c in self._encounters[student_id] if t >= cutoff
         ]
 
+    def record_encounters_batch(
+        self,
+        student_id: str,
+        entries: list[tuple[str, float, Optional[float]]],
+    ) -> None:
+        """
+        Record several ``(concept_id, mastery_score, timestamp)`` encounters
+        in one pass.
+
+        Equivalent to calling :meth:`record_encounter` for each entry in
+        chronological order, but the window is pruned once at the end.
+        """
+        now = time.time()
+        new_entries = [
+            (ts or now, concept_id)
+            for concept_id, mastery_score, ts in entries
+            if mastery_score < self._new_threshold
+        ]
+        if not new_entries:
+            return
+
+        history = self._encounters.setdefault(student_id, [])
+        history.extend(new_entries)
+
+        # Clean up old entries relative to the latest encounter
+        cutoff = new_entries[-1][0] - self._window_minutes * 60.0
+        self._encounters[student_id] = [(t, c) for t, c in history if t >= cutoff]
+
     def detect(self, student_id: str) -> ChunkResult:
         """
         Detect working memory overflow for a student.
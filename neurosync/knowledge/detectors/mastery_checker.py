@@ -51,6 +51,13 @@ class MasteryChecker:
         self._encounter_counts[key] = self._encounter_counts.get(key, 0) + 1
         return self._encounter_counts[key]
 
+    def record_encounters_batch(self, student_id: str, concept_ids: list[str]) -> None:
+        """Record one encounter per entry in *concept_ids* in a single pass."""
+        counts = self._encounter_counts
+        for concept_id in concept_ids:
+            key = (student_id, concept_id)
+            counts[key] = counts.get(key, 0) + 1
+
     def detect(
         self,
         student_id: str,
@@ -7,9 +7,8 @@ FREE tier: 30 req/min, unlimited usage.
 from __future__ import annotations
 
 import time
-from typing import List
+from typing import Any, List
 
-from groq import Groq
 from loguru import logger
 
 from neurosync.llm.base_provider import BaseLLMProvider, LLMMessage, LLMResponse
@@ -28,7 +27,8 @@ class GroqProvider(BaseLLMProvider):
         model: str = "llama-3.3-70b-versatile",
     ) -> None:
         super().__init__(api_key, model)
-        self.client = Groq(api_key=api_key)
+        # SDK client is created lazily on first request (see _get_client)
+        self.client: Any = None
         self.provider_name = "groq"
 
         # Rate limiting (30 requests/minute)
@@ -57,6 +57,15 @@ class GroqProvider(BaseLLMProvider):
 
         self.request_timestamps.append(now)
 
+    # ── lazy client ─────────────────────────────────────────────────
+
+    def _get_client(self) -> Any:
+        if self.client is None:
+            from groq import Groq
+
+            self.client = Groq(api_key=self.api_key)
+        return self.client
+
     def chat_completion(
         self,
         messages: List[LLMMessage],
@@ -72,7 +81,7 @@ class GroqProvider(BaseLLMProvider):
                 {"role": msg.role, "content": msg.content} for msg in messages
             ]
 
-            response = self.client.chat.completions.create(
+            response = self._get_client().chat.completions.create(
                 model=self.model,
                 messages=groq_messages,
                 temperature=temperature,
@@ -6,10 +6,9 @@ Wrapper around existing OpenAI client.
 
 from __future__ import annotations
 
-from typing import List
+from typing import Any, List
 
 from loguru import logger
-from openai import OpenAI
 
 from neurosync.llm.base_provider import BaseLLMProvider, LLMMessage, LLMResponse
 
@@ -27,9 +26,19 @@ class OpenAIProvider(BaseLLMProvider):
         model: str = "gpt-4o",
     ) -> None:
         super().__init__(api_key, model)
-        self.client = OpenAI(api_key=api_key)
+        # SDK client is created lazily on first request (see _get_client)
+        self.client: Any = None
         self.provider_name = "openai"
 
+    # ── lazy client ─────────────────────────────────────────────────
+
+    def _get_client(self) -> Any:
+        if self.client is None:
+            from openai import OpenAI
+
+            self.client = OpenAI(api_key=self.api_key)
+        return self.client
+
     def chat_completion(
         self,
         messages: List[LLMMessage],
@@ -43,7 +52,7 @@ class OpenAIProvider(BaseLLMProvider):
                 {"role": msg.role, "content": msg.content} for msg in messages
             ]
 
-            response = self.client.chat.completions.create(
+            response = self._get_client().chat.completions.create(
                 model=self.model,
                 messages=openai_messages,
                 temperature=temperature,
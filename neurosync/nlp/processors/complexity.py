@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 from neurosync.config.settings import NLP_THRESHOLDS
 
@@ -22,8 +23,9 @@ class ComplexityResult:
     syllable_count: int = 0
 
 
+@lru_cache(maxsize=4096)
 def _count_syllables(word: str) -> int:
-    """Estimate syllable count for an English word."""
+    """Estimate syllable count for an English word (memoised per word)."""
     word = word.lower().strip()
     if len(word) <= 2:
         return 1
@@ -43,21 +43,58 @@ class SentimentAnalyzer:
         if not text or not text.strip():
             return SentimentResult()
 
-        try:
-            from textblob import TextBlob
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity
-            subjectivity = blob.sentiment.subjectivity
-        except Exception as exc:
-            logger.warning("Sentiment analysis failed: {}", exc)
+        scores = self._score(text)
+        if scores is None:
             return SentimentResult()
 
         # Track history
-        self._history.append(polarity)
+        self._history.append(scores[0])
+        if len(self._history) > self._window_size:
+            self._history = self._history[-self._window_size:]
+
+        return self._build_result(*scores)
+
+    def analyze_batch(self, texts: list[str]) -> list[SentimentResult]:
+        """
+        Analyze several texts in order, as if :meth:`analyze` were called on each.
+
+        Identical texts are scored by TextBlob only once, and the trend window
+        is extended and trimmed once for the whole batch.
+        """
+        scored: dict[str, Optional[tuple[float, float]]] = {}
+        results: list[SentimentResult] = []
+        polarities: list[float] = []
+
+        for text in texts:
+            if not text or not text.strip():
+                results.append(SentimentResult())
+                continue
+            if text not in scored:
+                scored[text] = self._score(text)
+            scores = scored[text]
+            if scores is None:
+                results.append(SentimentResult())
+                continue
+            polarities.append(scores[0])
+            results.append(self._build_result(*scores))
+
+        self._history.extend(polarities)
         if len(self._history) > self._window_size:
             self._history = self._history[-self._window_size:]
+        return results
+
+    def _score(self, text: str) -> Optional[tuple[float, float]]:
+        """Return TextBlob ``(polarity, subjectivity)``, or ``None`` on failure."""
+        try:
+            from textblob import TextBlob
+            blob = TextBlob(text)
+            return blob.sentiment.polarity, blob.sentiment.subjectivity
+        except Exception as exc:
+            logger.warning("Sentiment analysis failed: {}", exc)
+            return None
 
-        # Classify
+    def _build_result(self, polarity: float, subjectivity: float) -> SentimentResult:
+        """Classify raw scores into a rounded ``SentimentResult``."""
         label = self._classify(polarity)
         confidence = min(1.0, abs(polarity) + 0.3)
 
@@ -5,9 +5,10 @@ a single readiness score and recommendation.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from neurosync.config.settings import READINESS_CONFIG
 
@@ -21,6 +22,9 @@ _ANXIETY_HIGH: float = float(READINESS_CONFIG["ANXIETY_HIGH_THRESHOLD"])
 class ReadinessScore(BaseModel):
     """Combined readiness evaluation."""
 
+    # Frozen because compute() hands the same memoised instance to every caller.
+    model_config = ConfigDict(frozen=True)
+
     self_report_anxiety: float = Field(0.0, ge=0.0, le=1.0)
     physiological_anxiety: float = Field(0.0, ge=0.0, le=1.0)
     behavioral_anxiety: float = Field(0.0, ge=0.0, le=1.0)
@@ -33,6 +37,7 @@ class ReadinessScore(BaseModel):
     recommendation: str = ""
 
 
+@lru_cache(maxsize=256)
 def compute(
     self_report_anxiety: float,
     physiological_anxiety: float,
@@ -43,6 +48,7 @@ def compute(
 
     When the webcam is unavailable the physiological weight is
     redistributed equally between self-report and behavioural.
+    Results are memoised on the (hashable) scalar arguments.
     """
     if webcam_available:
         w_self, w_phys, w_behav = _W_SELF, _W_PHYS, _W_BEHAV
@@ -56,9 +56,15 @@ FOREHEAD_ROI_INDICES: list[int] = [10, 338, 297, 332, 284, 251]
 
 @dataclass
 class RawLandmarks:
-    """Structured output from a single frame processed by MediaPipe."""
+    """
+    Structured output from a single frame processed by MediaPipe.
+
+    ``face_landmarks`` is stored as a contiguous ``(478, 3)`` float32
+    array so signal processors can index and reduce it directly; a
+    list of ``(x, y, z)`` tuples is coerced on construction.
+    """
 
-    face_landmarks: Optional[list[tuple[float, float, float]]] = None
+    face_landmarks: Optional[np.ndarray] = None
     pose_landmarks: Optional[list[tuple[float, float, float]]] = None
     frame_timestamp: float = field(default_factory=time.time)
     face_detected: bool = False
@@ -66,6 +72,10 @@ class RawLandmarks:
     frame_width: int = 0
     frame_height: int = 0
 
+    def __post_init__(self) -> None:
+        if self.face_landmarks is not None:
+            self.face_landmarks = np.ascontiguousarray(self.face_landmarks, dtype=np.float32)
+
 
 # =============================================================================
 # Processor
@@ -125,7 +135,9 @@ class MediaPipeProcessor:
         face_result = self._face_mesh.process(rgb)
         if face_result.multi_face_landmarks:  # type: ignore[union-attr]
             lm = face_result.multi_face_landmarks[0]  # type: ignore[union-attr]
-            result.face_landmarks = [(p.x, p.y, p.z) for p in lm.landmark]
+            result.face_landmarks = np.array(
+                [(p.x, p.y, p.z) for p in lm.landmark], dtype=np.float32,
+            )
             result.face_detected = True
 
         # --- Pose ---
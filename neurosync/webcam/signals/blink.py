@@ -23,6 +23,34 @@ from neurosync.webcam.mediapipe_processor import (
     RawLandmarks,
 )
 
+# Capacity of the blink-timestamp ring buffer; far above any realistic
+# number of blinks inside the 60-second window.
+_BLINK_BUFFER_SIZE: int = 128
+
+# (left, right) × 6 EAR points — one gather covers both eyes
+_EAR_IDX = np.array([LEFT_EAR_POINTS, RIGHT_EAR_POINTS], dtype=np.intp)
+_EAR_IDX.flags.writeable = False
+
+
+def _eye_aspect_ratios(lm: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """
+    Eye Aspect Ratio (EAR) per eye over a ``(N, 3)`` landmark array.
+
+    EAR = (||p2-p6|| + ||p3-p5||) / (2 * ||p1-p4||)
+
+    Each row of ``indices`` holds 6 landmark indices ordered:
+    p1 (left corner), p2 (upper-inner), p3 (upper-outer),
+    p4 (right corner), p5 (lower-outer), p6 (lower-inner).
+    A degenerate (zero-width) eye yields the safe default 0.3.
+    """
+    pts = lm[indices, :2]                     # (eyes, 6, 2)
+    # Both vertical spans in one norm: (p2, p3) - (p6, p5)
+    vertical = np.linalg.norm(pts[:, 1:3] - pts[:, [5, 4]], axis=-1).sum(axis=-1)
+    horizontal = np.linalg.norm(pts[:, 0] - pts[:, 3], axis=-1)
+    degenerate = horizontal < 1e-9
+    ratios = vertical / (2.0 * np.where(degenerate, 1.0, horizontal))
+    return np.where(degenerate, 0.3, ratios)
+
 
 @dataclass
 class BlinkResult:
@@ -55,8 +83,12 @@ class BlinkSignal:
         self._anxiety_rate: float = float(WEBCAM_THRESHOLDS["BLINK_ANXIETY_RATE"])
         self._flow_rate: float = float(WEBCAM_THRESHOLDS["BLINK_FLOW_RATE"])
 
-        # Rolling 60-second window of blink timestamps
-        self._blink_times: deque[float] = deque()
+        # Rolling 60-second window of blink timestamps, kept in a
+        # preallocated ring buffer (``_bt_head`` = next write slot; the
+        # oldest live slot is ``_bt_head - _bt_count``)
+        self._blink_times: np.ndarray = np.empty(_BLINK_BUFFER_SIZE, dtype=np.float64)
+        self._bt_head: int = 0
+        self._bt_count: int = 0
         self._window_seconds: float = 60.0
 
         # State for consecutive-closed-frame detection
@@ -86,8 +118,7 @@ class BlinkSignal:
         lm = landmarks.face_landmarks
 
         try:
-            left_ear = self._compute_ear(lm, LEFT_EAR_POINTS)
-            right_ear = self._compute_ear(lm, RIGHT_EAR_POINTS)
+            left_ear, right_ear = _eye_aspect_ratios(lm, _EAR_IDX).tolist()
         except (IndexError, ZeroDivisionError):
             return BlinkResult(confidence=0.0)
 
@@ -108,15 +139,13 @@ class BlinkSignal:
             self._consecutive_closed = 0
 
         # Trim old blinks outside window
-        cutoff = now - self._window_seconds
-        while self._blink_times and self._blink_times[0] < cutoff:
-            self._blink_times.popleft()
+        self._trim_blinks(now - self._window_seconds)
 
         # Blink rate
         elapsed = now - self._first_frame_time
         window = min(elapsed, self._window_seconds)
         if window > 0:
-            blink_rate = len(self._blink_times) / (window / 60.0)
+            blink_rate = self._bt_count / (window / 60.0)
         else:
             blink_rate = 0.0
 
@@ -150,32 +179,18 @@ class BlinkSignal:
     # Internals
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _compute_ear(
-        lm: list[tuple[float, float, float]],
-        indices: list[int],
-    ) -> float:
-        """
-        Eye Aspect Ratio (EAR).
-
-        EAR = (||p2-p6|| + ||p3-p5||) / (2 * ||p1-p4||)
-
-        ``indices`` should contain 6 landmark indices ordered:
-        p1 (left corner), p2 (upper-inner), p3 (upper-outer),
-        p4 (right corner), p5 (lower-outer), p6 (lower-inner).
-        """
-        pts = [np.array(lm[i][:2]) for i in indices]
-        p1, p2, p3, p4, p5, p6 = pts
-        vertical_1 = np.linalg.norm(p2 - p6)
-        vertical_2 = np.linalg.norm(p3 - p5)
-        horizontal = np.linalg.norm(p1 - p4)
-        if horizontal < 1e-9:
-            return 0.3  # safe default
-        return float((vertical_1 + vertical_2) / (2.0 * horizontal))
+    def _trim_blinks(self, cutoff: float) -> None:
+        """Drop buffered blinks older than *cutoff*, advancing from the oldest slot."""
+        tail = (self._bt_head - self._bt_count) % _BLINK_BUFFER_SIZE
+        while self._bt_count and self._blink_times[tail] < cutoff:
+            tail = (tail + 1) % _BLINK_BUFFER_SIZE
+            self._bt_count -= 1
 
     def _register_blink(self, now: float) -> None:
         """Register a blink event and record inter-blink interval."""
-        self._blink_times.append(now)
+        self._blink_times[self._bt_head] = now
+        self._bt_head = (self._bt_head + 1) % _BLINK_BUFFER_SIZE
+        self._bt_count = min(self._bt_count + 1, _BLINK_BUFFER_SIZE)
         if self._last_blink_time > 0:
             self._ibi.append(now - self._last_blink_time)
         self._last_blink_time = now
@@ -35,6 +35,40 @@ from neurosync.webcam.mediapipe_processor import (
 
 ExpressionLabel = Literal["engaged", "frustrated", "confused", "bored", "neutral"]
 
+# Landmark pairs whose 2-D distances feed the raw scores, in the order
+# unpacked by ``ExpressionSignal._compute_raw_scores``.
+_DIST_PAIRS = np.array(
+    [
+        (LEFT_CHEEK, RIGHT_CHEEK),                    # face width
+        (FOREHEAD, CHIN),                             # face height
+        (LEFT_EYEBROW_INNER, RIGHT_EYEBROW_INNER),    # inner brow gap
+        (UPPER_LIP, LOWER_LIP),                       # lip gap
+        (LEFT_EYEBROW_INNER, LEFT_EYE_INDICES[0]),    # left brow → eye top
+        (RIGHT_EYEBROW_INNER, RIGHT_EYE_INDICES[0]),  # right brow → eye top
+        (CHIN, NOSE_TIP),                             # jaw drop
+    ],
+    dtype=np.intp,
+)
+_EYE_IDX = np.array([LEFT_EYE_INDICES, RIGHT_EYE_INDICES], dtype=np.intp)
+for _idx in (_DIST_PAIRS, _EYE_IDX):
+    _idx.flags.writeable = False
+
+
+def _pair_distances(lm: np.ndarray, pairs: np.ndarray) -> np.ndarray:
+    """Euclidean (x, y) distance for each ``(i, j)`` row of *pairs*."""
+    return np.linalg.norm(lm[pairs[:, 0], :2] - lm[pairs[:, 1], :2], axis=1)
+
+
+def _eye_openness(lm: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """
+    Approximate openness of each eye row in *indices* from the vertical
+    span of its landmarks; a zero-width eye yields 0.3.
+    """
+    spans = np.ptp(lm[indices, :2], axis=-2)
+    x_range, y_range = spans[..., 0], spans[..., 1]
+    degenerate = x_range < 1e-9
+    return np.where(degenerate, 0.3, y_range / np.where(degenerate, 1.0, x_range))
+
 
 @dataclass
 class ExpressionResult:
@@ -103,55 +137,56 @@ class ExpressionSignal:
     # Internals
     # ------------------------------------------------------------------
 
-    def _compute_raw_scores(self, lm: list[tuple[float, float, float]]) -> dict[str, float]:
+    def _compute_raw_scores(self, lm: np.ndarray) -> dict[str, float]:
         """Compute raw (unsmoothed) expression scores from landmark distances."""
-        face_width = self._dist(lm, LEFT_CHEEK, RIGHT_CHEEK)
-        face_height = self._dist(lm, FOREHEAD, CHIN)
+        (
+            face_width,
+            face_height,
+            inner_brow,
+            lip_span,
+            left_brow_span,
+            right_brow_span,
+            chin_nose,
+        ) = _pair_distances(lm, _DIST_PAIRS).tolist()
         if face_width < 1e-9 or face_height < 1e-9:
             return {"frustration": 0.0, "confusion": 0.0, "boredom": 0.0, "engagement": 0.5}
 
         # --- Frustration tension ---
         # Brow furrow: inner brows move closer together
-        inner_brow_dist = self._dist(lm, LEFT_EYEBROW_INNER, RIGHT_EYEBROW_INNER) / face_width
+        inner_brow_dist = inner_brow / face_width
         # Normalised baseline ~0.25; furrowed < 0.20
         brow_furrow = max(0.0, min(1.0, (0.25 - inner_brow_dist) / 0.10))
 
         # Lip press: lip gap decreases
-        lip_gap = self._dist(lm, UPPER_LIP, LOWER_LIP) / face_height
+        lip_gap = lip_span / face_height
         # Normalised baseline ~0.05; pressed < 0.02
         lip_press = max(0.0, min(1.0, (0.05 - lip_gap) / 0.04))
 
         # Brow lowering: distance from eyebrow to eye top decreases
-        left_eye_top = np.array(lm[LEFT_EYE_INDICES[0]][:2])
-        left_brow = np.array(lm[LEFT_EYEBROW_INNER][:2])
-        brow_eye_dist = float(np.linalg.norm(left_brow - left_eye_top)) / face_height
+        brow_eye_dist = left_brow_span / face_height
         brow_lower = max(0.0, min(1.0, (0.08 - brow_eye_dist) / 0.05))
 
         frustration = brow_furrow * 0.40 + lip_press * 0.30 + brow_lower * 0.30
 
         # --- Confusion (asymmetric lip) ---
-        left_lip_corner = np.array(lm[61][:2])   # left mouth corner
-        right_lip_corner = np.array(lm[291][:2])  # right mouth corner
-        lip_asymmetry = abs(left_lip_corner[1] - right_lip_corner[1]) / face_height
+        # 61 / 291 = left / right mouth corner
+        lip_asymmetry = abs(float(lm[61, 1] - lm[291, 1])) / face_height
         # One brow raised: compare left vs right eyebrow-to-eye dist
-        right_eye_top = np.array(lm[RIGHT_EYE_INDICES[0]][:2])
-        right_brow = np.array(lm[RIGHT_EYEBROW_INNER][:2])
-        right_brow_eye = float(np.linalg.norm(right_brow - right_eye_top)) / face_height
+        right_brow_eye = right_brow_span / face_height
         brow_asymmetry = abs(brow_eye_dist - right_brow_eye) / max(brow_eye_dist, right_brow_eye, 1e-9)
 
         confusion = lip_asymmetry * 10.0 * 0.60 + brow_asymmetry * 0.40
         confusion = min(1.0, confusion)
 
         # --- Boredom ---
-        jaw_drop = self._dist(lm, CHIN, NOSE_TIP) / face_height
+        jaw_drop = chin_nose / face_height
         # Head droop: vertical position of nose relative to face centre
-        nose_y = lm[NOSE_TIP][1]
-        face_centre_y = (lm[FOREHEAD][1] + lm[CHIN][1]) / 2.0
+        nose_y = float(lm[NOSE_TIP, 1])
+        face_centre_y = float(lm[FOREHEAD, 1] + lm[CHIN, 1]) / 2.0
         head_droop = max(0.0, (nose_y - face_centre_y) / 0.1)  # normalised
 
         # Reduced eye openness (heavy lids)
-        left_ear = self._eye_openness(lm, LEFT_EYE_INDICES)
-        right_ear = self._eye_openness(lm, RIGHT_EYE_INDICES)
+        left_ear, right_ear = _eye_openness(lm, _EYE_IDX).tolist()
         avg_ear = (left_ear + right_ear) / 2.0
         heavy_lids = max(0.0, min(1.0, (0.25 - avg_ear) / 0.10))
 
@@ -184,22 +219,6 @@ class ExpressionSignal:
         self._initialised = True
         return result
 
-    @staticmethod
-    def _dist(lm: list[tuple[float, float, float]], i: int, j: int) -> float:
-        a = np.array(lm[i][:2])
-        b = np.array(lm[j][:2])
-        return float(np.linalg.norm(a - b))
-
-    @staticmethod
-    def _eye_openness(lm: list[tuple[float, float, float]], indices: list[int]) -> float:
-        """Approximate eye openness from the vertical span of eye landmarks."""
-        pts = np.array([lm[i][:2] for i in indices])
-        y_range = pts[:, 1].max() - pts[:, 1].min()
-        x_range = pts[:, 0].max() - pts[:, 0].min()
-        if x_range < 1e-9:
-            return 0.3
-        return float(y_range / x_range)
-
     @staticmethod
     def _classify(
         frustration: float,
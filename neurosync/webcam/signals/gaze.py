@@ -28,6 +28,29 @@ from neurosync.webcam.mediapipe_processor import (
 
 GazeDirection = Literal["screen", "left", "right", "up", "down", "away"]
 
+# (left, right) rows — one gather covers both eyes
+_EYE_IDX = np.array([LEFT_EYE_INDICES, RIGHT_EYE_INDICES], dtype=np.intp)
+_IRIS_IDX = np.array([LEFT_IRIS_INDICES, RIGHT_IRIS_INDICES], dtype=np.intp)
+for _idx in (_EYE_IDX, _IRIS_IDX):
+    _idx.flags.writeable = False
+
+
+def _iris_ratios(lm: np.ndarray, eye_idx: np.ndarray, iris_idx: np.ndarray) -> np.ndarray:
+    """
+    Iris centroid relative to the eye bounding box, as ``[h, v]`` per eye.
+
+    Both axes of every eye row in *eye_idx* / *iris_idx* are computed in
+    one pass over the ``(N, 3)`` landmark array; a degenerate
+    (zero-width or zero-height) axis yields 0.5.
+    """
+    eye_pts = lm[eye_idx, :2]
+    iris_centre = lm[iris_idx, :2].mean(axis=-2)
+    lo = eye_pts.min(axis=-2)
+    span = eye_pts.max(axis=-2) - lo
+    degenerate = span < 1e-9
+    ratios = (iris_centre - lo) / np.where(degenerate, 1.0, span)
+    return np.where(degenerate, 0.5, ratios)
+
 
 @dataclass
 class GazeResult:
@@ -57,8 +80,10 @@ class GazeSignal:
         self._min_confidence: float = float(WEBCAM_THRESHOLDS["GAZE_CONFIDENCE_MINIMUM"])
         self._window_size: int = int(WEBCAM_THRESHOLDS["WEBCAM_FRAME_ROLLING_WINDOW"])
 
-        # Rolling window of on-screen booleans (True = on screen)
+        # Rolling window of on-screen booleans (True = on screen), with a
+        # running count of True entries so the vote is O(1) per frame
         self._history: deque[bool] = deque(maxlen=self._window_size)
+        self._on_screen_count: int = 0
 
         # Off-screen tracking
         self._off_screen_start: Optional[float] = None
@@ -82,8 +107,7 @@ class GazeSignal:
 
         lm = landmarks.face_landmarks
         try:
-            h_ratio = self._horizontal_ratio(lm)
-            v_ratio = self._vertical_ratio(lm)
+            h_ratio, v_ratio = self._gaze_ratios(lm)
         except (IndexError, ZeroDivisionError):
             self._record_off_screen()
             return GazeResult(confidence=0.0, on_screen=False, gaze_direction="away")
@@ -97,10 +121,12 @@ class GazeSignal:
             self._record_off_screen()
 
         # Majority vote: on-screen if >60% of recent window says on-screen
+        if len(self._history) == self._window_size:
+            self._on_screen_count -= self._history[0]
         self._history.append(on_screen)
+        self._on_screen_count += on_screen
         if len(self._history) >= 5:
-            ratio_on = sum(self._history) / len(self._history)
-            on_screen_smoothed = ratio_on > 0.60
+            on_screen_smoothed = self._on_screen_count > 0.60 * len(self._history)
         else:
             on_screen_smoothed = on_screen
 
@@ -118,48 +144,16 @@ class GazeSignal:
     # Internals
     # ------------------------------------------------------------------
 
-    def _horizontal_ratio(self, lm: list[tuple[float, float, float]]) -> float:
-        """Iris centre X relative to eye width (0 = left, 1 = right)."""
-        # Average of both eyes
-        l_ratio = self._eye_iris_ratio_h(lm, LEFT_EYE_INDICES, LEFT_IRIS_INDICES)
-        r_ratio = self._eye_iris_ratio_h(lm, RIGHT_EYE_INDICES, RIGHT_IRIS_INDICES)
-        return (l_ratio + r_ratio) / 2.0
-
-    def _vertical_ratio(self, lm: list[tuple[float, float, float]]) -> float:
-        """Iris centre Y relative to eye height (0 = top, 1 = bottom)."""
-        l_ratio = self._eye_iris_ratio_v(lm, LEFT_EYE_INDICES, LEFT_IRIS_INDICES)
-        r_ratio = self._eye_iris_ratio_v(lm, RIGHT_EYE_INDICES, RIGHT_IRIS_INDICES)
-        return (l_ratio + r_ratio) / 2.0
-
     @staticmethod
-    def _eye_iris_ratio_h(
-        lm: list[tuple[float, float, float]],
-        eye_idx: list[int],
-        iris_idx: list[int],
-    ) -> float:
-        eye_pts = np.array([lm[i][:2] for i in eye_idx])
-        iris_pts = np.array([lm[i][:2] for i in iris_idx])
-        iris_centre = iris_pts.mean(axis=0)
-        x_min, x_max = eye_pts[:, 0].min(), eye_pts[:, 0].max()
-        width = x_max - x_min
-        if width < 1e-9:
-            return 0.5
-        return float((iris_centre[0] - x_min) / width)
+    def _gaze_ratios(lm: np.ndarray) -> tuple[float, float]:
+        """
+        Average iris ratios of both eyes.
 
-    @staticmethod
-    def _eye_iris_ratio_v(
-        lm: list[tuple[float, float, float]],
-        eye_idx: list[int],
-        iris_idx: list[int],
-    ) -> float:
-        eye_pts = np.array([lm[i][:2] for i in eye_idx])
-        iris_pts = np.array([lm[i][:2] for i in iris_idx])
-        iris_centre = iris_pts.mean(axis=0)
-        y_min, y_max = eye_pts[:, 1].min(), eye_pts[:, 1].max()
-        height = y_max - y_min
-        if height < 1e-9:
-            return 0.5
-        return float((iris_centre[1] - y_min) / height)
+        Horizontal: 0 = left, 1 = right.  Vertical: 0 = top, 1 = bottom.
+        """
+        left, right = _iris_ratios(lm, _EYE_IDX, _IRIS_IDX)
+        h_ratio, v_ratio = (left + right) / 2.0
+        return float(h_ratio), float(v_ratio)
 
     def _classify(self, h: float, v: float) -> GazeDirection:
         centre = 0.5
@@ -179,7 +173,7 @@ class GazeSignal:
         self._off_screen_duration_ms = 0.0
 
     def _record_off_screen(self) -> None:
-        now = time.time()
+        now = time.monotonic()
         if self._off_screen_start is None:
             self._off_screen_start = now
         self._off_screen_duration_ms = (now - self._off_screen_start) * 1000.0
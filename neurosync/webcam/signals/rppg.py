@@ -118,15 +118,12 @@ class RemotePPGSignal:
 
     def _extract_forehead_green(
         self,
-        lm: list[tuple[float, float, float]],
+        lm: np.ndarray,
         frame: np.ndarray,
     ) -> float:
         """Extract mean green-channel value from the forehead polygon."""
         h, w = frame.shape[:2]
-        pts = np.array(
-            [[int(lm[i][0] * w), int(lm[i][1] * h)] for i in FOREHEAD_ROI_INDICES],
-            dtype=np.int32,
-        )
+        pts = (lm[FOREHEAD_ROI_INDICES, :2] * (w, h)).astype(np.int32)
 
         # Bounding rectangle for efficiency
         x_min = max(0, pts[:, 0].min())
@@ -111,12 +111,10 @@ def main() -> None:
                 cv2.rectangle(frame, (0, 0), (w - 1, h - 1), border_colour, 6)
 
             # Face bounding box (green)
-            if landmarks.face_detected and landmarks.face_landmarks:
+            if landmarks.face_detected and landmarks.face_landmarks is not None:
                 lm = landmarks.face_landmarks
-                xs = [p[0] for p in lm]
-                ys = [p[1] for p in lm]
-                x1, y1 = int(min(xs) * w), int(min(ys) * h)
-                x2, y2 = int(max(xs) * w), int(max(ys) * h)
+                x1, y1 = (lm[:, :2].min(axis=0) * (w, h)).astype(int).tolist()
+                x2, y2 = (lm[:, :2].max(axis=0) * (w, h)).astype(int).tolist()
                 cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
 
             # Text overlay
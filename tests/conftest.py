@@ -3,13 +3,25 @@ NeuroSync AI — Shared test fixtures.
 """
 
 import os
+import shutil
 import tempfile
 import time
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 import pytest
+from pydantic import ConfigDict
 
+from neurosync.behavioral.moments import (
+    FatigueDetector,
+    FrustrationDetector,
+    InsightDetector,
+    PseudoUnderstandingDetector,
+    VariableRewardScheduler,
+)
 from neurosync.core.events import (
     IdleEvent,
     QuestionEvent,
@@ -18,6 +30,58 @@ from neurosync.core.events import (
     VideoEvent,
 )
 from neurosync.database.manager import DatabaseManager
+from neurosync.database.repositories.sessions import SessionRepository
+
+
+class _FrozenSessionConfig(SessionConfig):
+    """SessionConfig that rejects attribute assignment, safe to share across tests."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+# Shared immutable template; derive variants with ``.model_copy(update=...)``
+# rather than re-running SessionConfig validation in every test.
+DEFAULT_SESSION_CONFIG = _FrozenSessionConfig(student_id="student", lesson_id="lesson")
+
+# Fixed epoch-ms base for tests that only need coherent timestamp deltas
+# (matches the FakeClock default start in conftest_graph).
+NOW_MS: float = 1_700_000_000_000.0
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--no-cache-writes",
+        action="store_true",
+        default=False,
+        help="Skip the SQLite tier of CacheManager.set in tests that opt in.",
+    )
+    parser.addoption(
+        "--tmp-on-shm",
+        action="store_true",
+        default=False,
+        help="Put tmp_path directories on /dev/shm (tmpfs) for this run.",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    # Opt-in (--tmp-on-shm): root tmp_path / tmp_path_factory in a fresh
+    # directory on tmpfs, removed when the run ends.  Runs before the tmpdir
+    # plugin reads --basetemp; an explicit --basetemp still wins, and xdist
+    # workers get their basetemp from the controller.
+    if not config.getoption("--tmp-on-shm") or config.option.basetemp:
+        return
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        basetemp = tempfile.mkdtemp(prefix="neurosync-pytest-", dir=shm)
+        config.option.basetemp = basetemp
+        config.add_cleanup(lambda: shutil.rmtree(basetemp, ignore_errors=True))
+
+
+@pytest.fixture(scope="session")
+def no_cache_writes(pytestconfig: pytest.Config) -> bool:
+    """True when the run was started with ``--no-cache-writes``."""
+    return bool(pytestconfig.getoption("--no-cache-writes"))
 
 
 @pytest.fixture
@@ -30,6 +94,27 @@ def db_manager(tmp_path: Path) -> DatabaseManager:
     db.close()
 
 
+@pytest.fixture(scope="module")
+def base_db() -> tuple[DatabaseManager, SessionConfig]:
+    """In-memory template database with one session already created."""
+    db = DatabaseManager(":memory:")
+    db.initialise()
+    config = SessionConfig(student_id="test_student", lesson_id="test_lesson")
+    SessionRepository(db).create_session(config)
+    yield db, config  # type: ignore[misc]
+    db.close()
+
+
+@pytest.fixture
+def seeded_db(base_db: tuple[DatabaseManager, SessionConfig]) -> tuple[DatabaseManager, SessionConfig]:
+    """Fresh in-memory copy of ``base_db``, restored via the backup API."""
+    template, config = base_db
+    db = DatabaseManager(":memory:")
+    template.backup_to(db)
+    yield db, config  # type: ignore[misc]
+    db.close()
+
+
 @pytest.fixture
 def session_config() -> SessionConfig:
     """Create a test session config."""
@@ -52,9 +137,11 @@ def make_raw_event(
     event_type: str = "click",
     timestamp: float | None = None,
     metadata: dict | None = None,
+    event_id: str | None = None,
 ) -> RawEvent:
     """Helper to create a raw event."""
     return RawEvent(
+        event_id=event_id or str(uuid.uuid4()),
         session_id=session_id,
         student_id=student_id,
         event_type=event_type,  # type: ignore[arg-type]
@@ -63,6 +150,23 @@ def make_raw_event(
     )
 
 
+@dataclass(slots=True, frozen=True)
+class TimestampEvent:
+    """
+    Bare stand-in for a raw event exposing only ``timestamp``.
+
+    Only for processors that read nothing else off their events
+    (InteractionVarianceSignal); anything doing ``isinstance`` checks
+    needs the real models.
+    """
+    timestamp: float
+
+
+def make_timestamp_events(timestamps: np.ndarray) -> list[TimestampEvent]:
+    """One :class:`TimestampEvent` per timestamp."""
+    return [TimestampEvent(t) for t in timestamps.tolist()]
+
+
 def make_question_event(
     session_id: str = "test_session",
     student_id: str = "test_student",
@@ -72,9 +176,11 @@ def make_question_event(
     response_time_ms: float = 5000.0,
     confidence_score: int = 3,
     timestamp: float | None = None,
+    event_id: str | None = None,
 ) -> QuestionEvent:
     """Helper to create a question event."""
     return QuestionEvent(
+        event_id=event_id or str(uuid.uuid4()),
         session_id=session_id,
         student_id=student_id,
         event_type="answer_submitted",
@@ -93,9 +199,11 @@ def make_video_event(
     event_type: str = "video_rewind",
     timestamp: float | None = None,
     playback_position_ms: float = 60000.0,
+    event_id: str | None = None,
 ) -> VideoEvent:
     """Helper to create a video event."""
     return VideoEvent(
+        event_id=event_id or str(uuid.uuid4()),
         session_id=session_id,
         student_id=student_id,
         event_type=event_type,  # type: ignore[arg-type]
@@ -110,9 +218,11 @@ def make_idle_event(
     student_id: str = "test_student",
     idle_duration_ms: float = 5000.0,
     timestamp: float | None = None,
+    event_id: str | None = None,
 ) -> IdleEvent:
     """Helper to create an idle event."""
     return IdleEvent(
+        event_id=event_id or str(uuid.uuid4()),
         session_id=session_id,
         student_id=student_id,
         event_type="mouse_idle",
@@ -122,6 +232,61 @@ def make_idle_event(
     )
 
 
+# Validated once per event type; ``make_event_fast`` hands out copies.
+_EVENT_TEMPLATES: dict[type, RawEvent] = {
+    RawEvent: make_raw_event(),
+    QuestionEvent: make_question_event(),
+    VideoEvent: make_video_event(),
+    IdleEvent: make_idle_event(),
+}
+
+
+def make_event_fast(event_cls: type[RawEvent], **overrides: Any) -> Any:
+    """
+    Copy the prebuilt ``event_cls`` template with ``overrides`` applied.
+
+    Skips validation and the uuid/time calls of the ``make_*_event``
+    helpers; every copy shares its template's ``event_id`` (and, for
+    questions, ``question_id``).
+    """
+    return _EVENT_TEMPLATES[event_cls].model_copy(update=overrides)
+
+
+def make_idle_events(timestamps: np.ndarray, **common: Any) -> list[IdleEvent]:
+    """One template-copied idle event per timestamp, sharing ``common`` overrides."""
+    return [make_event_fast(IdleEvent, **common, timestamp=t) for t in timestamps.tolist()]
+
+
+# ── Moment detectors ─────────────────────────────────────────────────
+# Fresh per test: construction is cheaper than copying a shared instance,
+# and cooldown timers / histories never leak between tests.
+
+
+@pytest.fixture
+def frustration_detector() -> FrustrationDetector:
+    return FrustrationDetector()
+
+
+@pytest.fixture
+def fatigue_detector() -> FatigueDetector:
+    return FatigueDetector()
+
+
+@pytest.fixture
+def pseudo_understanding_detector() -> PseudoUnderstandingDetector:
+    return PseudoUnderstandingDetector()
+
+
+@pytest.fixture
+def insight_detector() -> InsightDetector:
+    return InsightDetector()
+
+
+@pytest.fixture
+def reward_scheduler() -> VariableRewardScheduler:
+    return VariableRewardScheduler()
+
+
 # =====================================================================
 # Step 2 — Webcam fixtures (re-export from conftest_webcam)
 # =====================================================================
@@ -141,6 +306,9 @@ from tests.conftest_webcam import (  # noqa: E402, F401
 # Step 3 — Knowledge graph fixtures (re-export from conftest_graph)
 # =====================================================================
 from tests.conftest_graph import (  # noqa: E402, F401
+    _session_graph_manager,
+    _session_seeded_graph,
+    frozen_time,
     mock_graph_manager,
     seeded_graph,
 )
@@ -150,8 +318,19 @@ from tests.conftest_graph import (  # noqa: E402, F401
 # Step 4 — NLP fixtures (re-export from conftest_nlp)
 # =====================================================================
 from tests.conftest_nlp import (  # noqa: E402, F401
+    _session_nlp_pipeline,
     nlp_pipeline,
     text_event,
+    complexity_analyzer,
+    keyword_extractor,
+    answer_quality_assessor,
+    readability_analyzer,
+    _session_sentiment_analyzer,
+    sentiment_analyzer,
+    _session_confusion_detector,
+    confusion_detector,
+    _session_topic_drift_detector,
+    topic_drift_detector,
 )
 
 
@@ -160,6 +339,7 @@ from tests.conftest_nlp import (  # noqa: E402, F401
 # =====================================================================
 from tests.conftest_interventions import (  # noqa: E402, F401
     mock_openai_response,
+    ok_response,
     cache_manager,
     cost_tracker,
     generator,
@@ -172,11 +352,22 @@ from tests.conftest_content import (  # noqa: E402, F401
     sample_concepts,
     mock_openai_client,
     concept_extractor,
+    _module_script_generator,
     script_generator,
     story_generator,
+    _module_quiz_generator,
     quiz_generator,
     diagram_generator,
+    _module_tts_engine,
     tts_engine,
+    export_dir,
+    pdf_parser,
+    text_cleaner,
+    markdown_generator,
+    story_exporter,
+    quiz_exporter,
+    slide_generator,
+    video_assembler,
 )
 
 # Step 5 — Fusion fixtures (re-export from conftest_fusion)
@@ -198,6 +389,7 @@ from tests.conftest_fusion import (  # noqa: E402, F401
 # Step 8 — Spaced-repetition fixtures (re-export from conftest_spaced_rep)
 # ========================================================================
 from tests.conftest_spaced_rep import (  # noqa: E402, F401
+    _session_sr_template,
     sr_db,
     fitter,
     predictor,
@@ -8,15 +8,25 @@ stories, quizzes, diagrams, and TTS so tests never call real APIs.
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from neurosync.content.analyzers.concept_extractor import ConceptExtractor, ExtractedConcept
+from neurosync.content.formats.markdown import MarkdownGenerator
+from neurosync.content.formats.quiz import QuizExporter
+from neurosync.content.formats.story import StoryExporter
 from neurosync.content.generators.quiz_generator import QuizGenerator
 from neurosync.content.generators.script_generator import ScriptGenerator
+from neurosync.content.generators.slide_generator import SlideGenerator
 from neurosync.content.generators.story_generator import StoryGenerator
 from neurosync.content.generators.diagram_generator import DiagramGenerator
+from neurosync.content.generators.video_assembler import VideoAssembler
+from neurosync.content.parsers.pdf_parser import PDFParser
+from neurosync.content.parsers.text_cleaner import TextCleaner
 from neurosync.content.tts.openai_tts import OpenAITTS
 
 
@@ -51,11 +61,23 @@ def _make_image_response(url: str = "https://example.com/diagram.png") -> MagicM
     return resp
 
 
-def _make_tts_response(audio_bytes: bytes = b"fake-audio-mp3-content") -> MagicMock:
-    """Build a mock TTS response."""
-    resp = MagicMock()
-    resp.content = audio_bytes
-    return resp
+_FAKE_MP3: Final[bytes] = b"fake-audio-mp3-content"
+
+
+@dataclass(slots=True, frozen=True)
+class _FakeTTSResp:
+    """Plain stand-in for a speech API response; only ``content`` is read."""
+    content: bytes = _FAKE_MP3
+
+
+_SHARED_TTS_RESP: Final = _FakeTTSResp()
+
+
+def _make_tts_response(audio_bytes: bytes = _FAKE_MP3) -> _FakeTTSResp:
+    """Return a stub TTS response; the default one is a shared frozen instance."""
+    if audio_bytes is _FAKE_MP3:
+        return _SHARED_TTS_RESP
+    return _FakeTTSResp(content=audio_bytes)
 
 
 # ── Sample concept extraction response ──────────────────────────
@@ -144,10 +166,10 @@ SAMPLE_QUIZ_RESPONSE = {
 # ── Fixtures ────────────────────────────────────────────────────────
 
 
-@pytest.fixture
-def sample_concepts() -> list[ExtractedConcept]:
-    """Pre-built concept list for generator tests."""
-    return [
+@pytest.fixture(scope="session")
+def sample_concepts() -> tuple[ExtractedConcept, ...]:
+    """Pre-built concepts for generator tests (shared; do not mutate)."""
+    return (
         ExtractedConcept(
             concept_id="c1",
             name="Photosynthesis",
@@ -164,11 +186,10 @@ def sample_concepts() -> list[ExtractedConcept]:
             prerequisites=["Photosynthesis"],
             keywords=["mitochondria", "ATP", "oxygen"],
         ),
-    ]
+    )
 
 
-@pytest.fixture
-def mock_openai_client() -> MagicMock:
+def _build_mock_openai_client() -> MagicMock:
     """Fully mocked OpenAI client with chat, images, and audio."""
     client = MagicMock()
 
@@ -190,20 +211,36 @@ def mock_openai_client() -> MagicMock:
     return client
 
 
+@pytest.fixture
+def mock_openai_client() -> MagicMock:
+    """Fully mocked OpenAI client with chat, images, and audio."""
+    return _build_mock_openai_client()
+
+
 @pytest.fixture
 def concept_extractor(mock_openai_client) -> ConceptExtractor:
     """ConceptExtractor with mocked client."""
     return ConceptExtractor(client=mock_openai_client)
 
 
-@pytest.fixture
-def script_generator(mock_openai_client) -> ScriptGenerator:
-    """ScriptGenerator with mocked client."""
-    # Override to return script responses
-    mock_openai_client.chat.completions.create = AsyncMock(
+# Script, quiz and TTS fixtures are built once per module on a private client;
+# the public wrappers clear recorded calls (return values are kept).
+
+
+@pytest.fixture(scope="module")
+def _module_script_generator() -> ScriptGenerator:
+    client = _build_mock_openai_client()
+    client.chat.completions.create = AsyncMock(
         return_value=_make_chat_response(SAMPLE_SCRIPT_RESPONSE),
     )
-    return ScriptGenerator(client=mock_openai_client)
+    return ScriptGenerator(client=client)
+
+
+@pytest.fixture
+def script_generator(_module_script_generator: ScriptGenerator) -> ScriptGenerator:
+    """ScriptGenerator with mocked client."""
+    _module_script_generator.client.reset_mock()
+    return _module_script_generator
 
 
 @pytest.fixture
@@ -215,13 +252,20 @@ def story_generator(mock_openai_client) -> StoryGenerator:
     return StoryGenerator(client=mock_openai_client)
 
 
-@pytest.fixture
-def quiz_generator(mock_openai_client) -> QuizGenerator:
-    """QuizGenerator with mocked client."""
-    mock_openai_client.chat.completions.create = AsyncMock(
+@pytest.fixture(scope="module")
+def _module_quiz_generator() -> QuizGenerator:
+    client = _build_mock_openai_client()
+    client.chat.completions.create = AsyncMock(
         return_value=_make_chat_response(SAMPLE_QUIZ_RESPONSE),
     )
-    return QuizGenerator(client=mock_openai_client)
+    return QuizGenerator(client=client)
+
+
+@pytest.fixture
+def quiz_generator(_module_quiz_generator: QuizGenerator) -> QuizGenerator:
+    """QuizGenerator with mocked client."""
+    _module_quiz_generator.client.reset_mock()
+    return _module_quiz_generator
 
 
 @pytest.fixture
@@ -230,7 +274,64 @@ def diagram_generator(mock_openai_client) -> DiagramGenerator:
     return DiagramGenerator(client=mock_openai_client)
 
 
+@pytest.fixture(scope="module")
+def _module_tts_engine() -> OpenAITTS:
+    return OpenAITTS(client=_build_mock_openai_client())
+
+
 @pytest.fixture
-def tts_engine(mock_openai_client) -> OpenAITTS:
+def tts_engine(_module_tts_engine: OpenAITTS) -> OpenAITTS:
     """OpenAITTS with mocked speech API."""
-    return OpenAITTS(client=mock_openai_client)
+    _module_tts_engine.client.reset_mock()
+    return _module_tts_engine
+
+
+# ── Stateless parsers / exporters (shared per session) ─────────────
+
+
+@pytest.fixture(scope="session")
+def export_dir(tmp_path_factory) -> Path:
+    """One output directory for every export test; use distinct filenames."""
+    return tmp_path_factory.mktemp("exports")
+
+
+@pytest.fixture(scope="session")
+def pdf_parser() -> PDFParser:
+    """Default PDFParser."""
+    return PDFParser()
+
+
+@pytest.fixture(scope="session")
+def text_cleaner() -> TextCleaner:
+    """TextCleaner with its header/footer regexes compiled once."""
+    return TextCleaner()
+
+
+@pytest.fixture(scope="session")
+def markdown_generator() -> MarkdownGenerator:
+    """Default MarkdownGenerator."""
+    return MarkdownGenerator()
+
+
+@pytest.fixture(scope="session")
+def story_exporter() -> StoryExporter:
+    """Default StoryExporter."""
+    return StoryExporter()
+
+
+@pytest.fixture(scope="session")
+def quiz_exporter() -> QuizExporter:
+    """Default QuizExporter."""
+    return QuizExporter()
+
+
+@pytest.fixture(scope="session")
+def slide_generator() -> SlideGenerator:
+    """Default SlideGenerator; decks are built fresh per call."""
+    return SlideGenerator()
+
+
+@pytest.fixture(scope="session")
+def video_assembler() -> VideoAssembler:
+    """Default VideoAssembler; backend detection runs once per session."""
+    return VideoAssembler()
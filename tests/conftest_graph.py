@@ -7,7 +7,6 @@ allowing all 25 graph tests to run without a Neo4j instance.
 
 from __future__ import annotations
 
-import copy
 import re
 import time
 from typing import Any, Optional
@@ -525,26 +524,101 @@ class MockGraphManager:
             self._nodes[label].clear()
         self._rels.clear()
 
+    def _snapshot(self) -> tuple[dict[str, dict[str, dict[str, Any]]], dict[tuple[str, str, str, str, str], dict[str, Any]]]:
+        """Copy the node/relationship tables so they can be restored later.
+
+        Queries only ever replace or update a node's / relationship's
+        top-level properties, so copying each property dict is enough.
+        """
+        nodes = {label: {k: props.copy() for k, props in table.items()}
+                 for label, table in self._nodes.items()}
+        rels = {key: props.copy() for key, props in self._rels.items()}
+        return nodes, rels
+
+    def _restore(
+        self,
+        snapshot: tuple[dict[str, dict[str, dict[str, Any]]], dict[tuple[str, str, str, str, str], dict[str, Any]]],
+    ) -> None:
+        """Roll the graph back to a state captured by :meth:`_snapshot`.
+
+        The snapshot's tables are adopted as-is, so it must not be reused.
+        """
+        self._nodes, self._rels = snapshot
+        self._connected = True
+
+
+# =============================================================================
+# FakeClock — deterministic replacement for time.time() in detectors
+# =============================================================================
+
+class FakeClock:
+    """
+    Frozen clock exposing the ``time()`` / ``monotonic()`` calls the
+    detectors use.
+
+    Installed in place of the ``time`` module inside the detector modules so
+    tests and detectors read the same deterministic timestamp.
+    """
+
+    def __init__(self, start: float = 1_700_000_000.0) -> None:
+        self.now = start
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
 
 # =============================================================================
 # Fixtures
 # =============================================================================
 
-@pytest.fixture
-def mock_graph_manager() -> MockGraphManager:
-    """Provide a fresh MockGraphManager for each test."""
+@pytest.fixture(scope="session")
+def _session_graph_manager() -> MockGraphManager:
+    """Single empty MockGraphManager shared by the whole session."""
     gm = MockGraphManager()
     gm.connect()
     return gm
 
 
 @pytest.fixture
-def seeded_graph(mock_graph_manager: MockGraphManager) -> MockGraphManager:
+def mock_graph_manager(_session_graph_manager: MockGraphManager) -> MockGraphManager:
+    """Provide an empty MockGraphManager, cleared again after each test."""
+    gm = _session_graph_manager
+    gm.connect()
+    yield gm  # type: ignore[misc]
+    gm.reset()
+
+
+@pytest.fixture(scope="session")
+def _session_seeded_graph() -> MockGraphManager:
+    """Seed the biology graph once for the whole session."""
+    gm = MockGraphManager()
+    gm.connect()
+    return seed_graph(gm)
+
+
+@pytest.fixture
+def seeded_graph(_session_seeded_graph: MockGraphManager) -> MockGraphManager:
     """
     A MockGraphManager pre-seeded with a small set of biology concepts
     and prerequisites for testing.
+
+    The graph is seeded once per session; any writes a test makes are
+    rolled back from a snapshot on teardown.
     """
-    gm = mock_graph_manager
+    gm = _session_seeded_graph
+    snapshot = gm._snapshot()
+    yield gm  # type: ignore[misc]
+    gm._restore(snapshot)
+
+
+def seed_graph(gm: MockGraphManager) -> MockGraphManager:
+    """Seed *gm* with the biology concepts/prerequisites used by the tests."""
     from neurosync.knowledge.repositories.concepts import ConceptRepository
     from neurosync.knowledge.repositories.students import StudentRepository
 
@@ -590,3 +664,14 @@ def seeded_graph(mock_graph_manager: MockGraphManager) -> MockGraphManager:
     student_repo.create_student("arjun", name="Arjun")
 
     return gm
+
+
+@pytest.fixture
+def frozen_time(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Freeze ``time.time()`` for the plateau, mirror and chunk detectors."""
+    from neurosync.knowledge.detectors import chunk_tracker, mirror, plateau_detector
+
+    clock = FakeClock()
+    for module in (plateau_detector, mirror, chunk_tracker):
+        monkeypatch.setattr(module, "time", clock)
+    return clock
@@ -48,10 +48,16 @@ def mock_openai_response() -> MagicMock:
     return _make_mock_response()
 
 
+@pytest.fixture(scope="module")
+def ok_response() -> MagicMock:
+    """Shared "Recovered response" mock, built once per module."""
+    return _make_mock_response("Recovered response")
+
+
 @pytest.fixture
-def cache_manager(tmp_path) -> CacheManager:
+def cache_manager() -> CacheManager:
     """In-memory cache for tests."""
-    return CacheManager(db_path=str(tmp_path / "test_cache.db"), max_size=100)
+    return CacheManager(db_path=":memory:", max_size=100)
 
 
 @pytest.fixture
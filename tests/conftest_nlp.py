@@ -10,6 +10,13 @@ import pytest
 
 from neurosync.core.events import TextEvent
 from neurosync.nlp.pipeline import NLPPipeline
+from neurosync.nlp.processors.answer_quality import AnswerQualityAssessor
+from neurosync.nlp.processors.complexity import ComplexityAnalyzer
+from neurosync.nlp.processors.confusion import ConfusionDetector
+from neurosync.nlp.processors.keywords import KeywordExtractor
+from neurosync.nlp.processors.readability import ReadabilityAnalyzer
+from neurosync.nlp.processors.sentiment import SentimentAnalyzer
+from neurosync.nlp.processors.topic_drift import TopicDriftDetector
 
 
 # =============================================================================
@@ -34,6 +41,11 @@ COMPLEX_TEXT = (
     "ultimately generating adenosine triphosphate through the rotary catalysis mechanism "
     "of ATP synthase."
 )
+MITOCHONDRIAL_COMPLEX = (
+    "The mitochondrial electron transport chain comprises four enzymatic complexes "
+    "embedded in the inner mitochondrial membrane, facilitating oxidative phosphorylation "
+    "through chemiosmotic coupling of proton gradients across the intermembrane space."
+)
 
 # =============================================================================
 # Sample texts — confusion
@@ -58,7 +70,15 @@ DETAILED_ANSWER = (
     "releases oxygen as a byproduct, it is essential for life on Earth."
 )
 
+PHOTOSYNTHESIS_LONG = (
+    "Photosynthesis is the process by which plants convert light energy "
+    "from the sun into chemical energy stored in glucose. This occurs in "
+    "the chloroplasts, because the thylakoid membranes contain chlorophyll "
+    "which absorbs light energy."
+)
+
 CONCEPT_KEYWORDS = ["photosynthesis", "light", "energy", "glucose", "chloroplast", "oxygen", "carbon"]
+EXPECTED_PHOTOSYNTHESIS_KEYWORDS = ("photosynthesis", "light", "energy", "glucose", "chloroplast")
 
 # =============================================================================
 # Sample texts — topic drift
@@ -72,12 +92,18 @@ OFF_TOPIC_TEXT = "My favorite movie is about space exploration and astronauts on
 # =============================================================================
 
 
-@pytest.fixture
-def nlp_pipeline() -> NLPPipeline:
-    """Create a fresh NLP pipeline."""
+@pytest.fixture(scope="session")
+def _session_nlp_pipeline() -> NLPPipeline:
     return NLPPipeline()
 
 
+@pytest.fixture
+def nlp_pipeline(_session_nlp_pipeline: NLPPipeline) -> NLPPipeline:
+    """Shared NLP pipeline, reset to a fresh state for each test."""
+    _session_nlp_pipeline.reset()
+    return _session_nlp_pipeline
+
+
 @pytest.fixture
 def text_event() -> TextEvent:
     """Create a sample text event."""
@@ -88,3 +114,68 @@ def text_event() -> TextEvent:
         text_type="answer",
         concept_id="concept_1",
     )
+
+
+# ── Shared processors ──────────────────────────────────────────────
+# Stateless processors are built once per session. Stateful ones are
+# also built once, then reset() by a function-scoped wrapper per test.
+
+
+@pytest.fixture(scope="session")
+def complexity_analyzer() -> ComplexityAnalyzer:
+    """Session-wide ComplexityAnalyzer (stateless)."""
+    return ComplexityAnalyzer()
+
+
+@pytest.fixture(scope="session")
+def keyword_extractor() -> KeywordExtractor:
+    """Session-wide KeywordExtractor (stateless)."""
+    return KeywordExtractor()
+
+
+@pytest.fixture(scope="session")
+def answer_quality_assessor() -> AnswerQualityAssessor:
+    """Session-wide AnswerQualityAssessor (stateless)."""
+    return AnswerQualityAssessor()
+
+
+@pytest.fixture(scope="session")
+def readability_analyzer() -> ReadabilityAnalyzer:
+    """Session-wide ReadabilityAnalyzer (stateless)."""
+    return ReadabilityAnalyzer()
+
+
+@pytest.fixture(scope="session")
+def _session_sentiment_analyzer() -> SentimentAnalyzer:
+    return SentimentAnalyzer()
+
+
+@pytest.fixture
+def sentiment_analyzer(_session_sentiment_analyzer: SentimentAnalyzer) -> SentimentAnalyzer:
+    """Shared SentimentAnalyzer with its trend history cleared."""
+    _session_sentiment_analyzer.reset()
+    return _session_sentiment_analyzer
+
+
+@pytest.fixture(scope="session")
+def _session_confusion_detector() -> ConfusionDetector:
+    return ConfusionDetector()
+
+
+@pytest.fixture
+def confusion_detector(_session_confusion_detector: ConfusionDetector) -> ConfusionDetector:
+    """Shared ConfusionDetector with its trend history cleared."""
+    _session_confusion_detector.reset()
+    return _session_confusion_detector
+
+
+@pytest.fixture(scope="session")
+def _session_topic_drift_detector() -> TopicDriftDetector:
+    return TopicDriftDetector()
+
+
+@pytest.fixture
+def topic_drift_detector(_session_topic_drift_detector: TopicDriftDetector) -> TopicDriftDetector:
+    """Shared TopicDriftDetector with its text history cleared."""
+    _session_topic_drift_detector.reset()
+    return _session_topic_drift_detector
@@ -8,7 +8,6 @@ pre-built retention data, and scheduler instances.
 from __future__ import annotations
 
 import time
-from pathlib import Path
 
 import pytest
 
@@ -23,15 +22,24 @@ from neurosync.spaced_repetition.quiz.generator import ReviewQuizGenerator
 from neurosync.spaced_repetition.scheduler import SpacedRepetitionScheduler
 
 
-@pytest.fixture
-def sr_db(tmp_path: Path) -> DatabaseManager:
-    """Temporary database with full schema (incl. Step 8 tables)."""
-    db = DatabaseManager(tmp_path / "sr_test.db")
+@pytest.fixture(scope="session")
+def _session_sr_template() -> DatabaseManager:
+    """In-memory database with the full schema, built once per session."""
+    db = DatabaseManager(":memory:")
     db.initialise()
     yield db  # type: ignore[misc]
     db.close()
 
 
+@pytest.fixture
+def sr_db(_session_sr_template: DatabaseManager) -> DatabaseManager:
+    """Fresh in-memory database with full schema (incl. Step 8 tables)."""
+    db = DatabaseManager(":memory:")
+    _session_sr_template.backup_to(db)
+    yield db  # type: ignore[misc]
+    db.close()
+
+
 @pytest.fixture
 def fitter() -> ForgettingCurveFitter:
     return ForgettingCurveFitter()
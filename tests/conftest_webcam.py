@@ -38,17 +38,16 @@ from neurosync.webcam.mediapipe_processor import (
 # Helper: build a full 478-landmark face from key positions
 # =====================================================================
 
-def _default_landmarks() -> list[tuple[float, float, float]]:
+def _default_landmarks() -> np.ndarray:
     """
     Generate 478 face landmarks at a neutral expression with the face
     centered and looking at the screen.
 
-    Landmark positions are in MediaPipe normalised coordinates (0–1).
+    Landmark positions are in MediaPipe normalised coordinates (0–1),
+    returned as the ``(478, 3)`` float32 array ``RawLandmarks`` stores.
     """
     # Start with every point at face-centre as a safe baseline
-    base = [(0.5, 0.45, 0.0)] * 478
-
-    lm = list(base)
+    lm = np.tile(np.array([0.5, 0.45, 0.0], dtype=np.float32), (478, 1))
 
     # -- Face boundary --
     lm[FOREHEAD] = (0.50, 0.20, 0.0)        # top of forehead
@@ -73,12 +72,10 @@ def _default_landmarks() -> list[tuple[float, float, float]]:
         lm[i] = (x, y, 0.0)
 
     # -- Left iris (centered in left eye → looking at screen) --
-    for i in LEFT_IRIS_INDICES:
-        lm[i] = (0.60, 0.40, 0.0)
+    lm[LEFT_IRIS_INDICES] = (0.60, 0.40, 0.0)
 
     # -- Right iris (centered in right eye) --
-    for i in RIGHT_IRIS_INDICES:
-        lm[i] = (0.40, 0.40, 0.0)
+    lm[RIGHT_IRIS_INDICES] = (0.40, 0.40, 0.0)
 
     # -- EAR landmarks (used by blink detector) --
     # Left EAR points: p1(left corner) p2(upper-inner) p3(upper-outer)
@@ -128,35 +125,27 @@ def _eye_ring(
     return [(cx + rx * np.cos(a), cy + ry * np.sin(a)) for a in angles]
 
 
-def _shift_iris_left(lm: list[tuple[float, float, float]]) -> list[tuple[float, float, float]]:
+def _shift_iris_left(lm: np.ndarray) -> np.ndarray:
     """Move iris landmarks strongly left (low horizontal ratio)."""
-    lm = list(lm)
-    for i in LEFT_IRIS_INDICES:
-        x, y, z = lm[i]
-        lm[i] = (x - 0.06, y, z)
-    for i in RIGHT_IRIS_INDICES:
-        x, y, z = lm[i]
-        lm[i] = (x - 0.06, y, z)
+    lm = lm.copy()
+    lm[LEFT_IRIS_INDICES + RIGHT_IRIS_INDICES, 0] -= 0.06
     return lm
 
 
-def _make_closed_eyes(lm: list[tuple[float, float, float]]) -> list[tuple[float, float, float]]:
+def _make_closed_eyes(lm: np.ndarray) -> np.ndarray:
     """Collapse eye vertical span to simulate closed eyes (low EAR)."""
-    lm = list(lm)
+    lm = lm.copy()
     for pts in [LEFT_EAR_POINTS, RIGHT_EAR_POINTS]:
-        # Move upper landmarks down and lower landmarks up
-        p1_x, p1_y, _ = lm[pts[0]]
-        mid_y = p1_y
-        lm[pts[1]] = (lm[pts[1]][0], mid_y + 0.001, 0.0)
-        lm[pts[2]] = (lm[pts[2]][0], mid_y + 0.001, 0.0)
-        lm[pts[4]] = (lm[pts[4]][0], mid_y + 0.001, 0.0)
-        lm[pts[5]] = (lm[pts[5]][0], mid_y + 0.001, 0.0)
+        # Move upper (p2, p3) and lower (p5, p6) landmarks onto the corner line
+        lids = [pts[1], pts[2], pts[4], pts[5]]
+        lm[lids, 1] = lm[pts[0], 1] + 0.001
+        lm[lids, 2] = 0.0
     return lm
 
 
-def _make_frustrated(lm: list[tuple[float, float, float]]) -> list[tuple[float, float, float]]:
+def _make_frustrated(lm: np.ndarray) -> np.ndarray:
     """Furrow brows and press lips to simulate frustration."""
-    lm = list(lm)
+    lm = lm.copy()
     # Move inner brows closer together
     lm[LEFT_EYEBROW_INNER] = (0.52, 0.34, 0.0)
     lm[RIGHT_EYEBROW_INNER] = (0.48, 0.34, 0.0)
@@ -169,21 +158,19 @@ def _make_frustrated(lm: list[tuple[float, float, float]]) -> list[tuple[float,
     return lm
 
 
-def _make_bored(lm: list[tuple[float, float, float]]) -> list[tuple[float, float, float]]:
+def _make_bored(lm: np.ndarray) -> np.ndarray:
     """Drop jaw and droop head to simulate boredom."""
-    lm = list(lm)
+    lm = lm.copy()
     # Increase lip gap (jaw drop)
     lm[UPPER_LIP] = (0.50, 0.62, 0.0)
     lm[LOWER_LIP] = (0.50, 0.72, 0.0)
     # Droop chin
     lm[CHIN] = (0.50, 0.85, 0.0)
     # Heavy lids — reduce eye vertical span
-    for pts in [LEFT_EYE_INDICES, RIGHT_EYE_INDICES]:
-        for i in pts:
-            x, y, z = lm[i]
-            # Flatten vertical span
-            cy = 0.40
-            lm[i] = (x, cy + (y - cy) * 0.4, z)
+    # Flatten vertical span around the eye centre line
+    cy = 0.40
+    eyes = LEFT_EYE_INDICES + RIGHT_EYE_INDICES
+    lm[eyes, 1] = cy + (lm[eyes, 1] - cy) * 0.4
     return lm
 
 
@@ -9,8 +9,10 @@ Tests:
   25. test_mastery_record_upsert — upsert works correctly
 """
 
-import threading
+from __future__ import annotations
+
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -19,18 +21,17 @@ from neurosync.database.manager import DatabaseManager
 from neurosync.database.repositories.events import EventRepository
 from neurosync.database.repositories.sessions import SessionRepository
 from neurosync.database.repositories.signals import SignalRepository
-from tests.conftest import make_raw_event
+from tests.conftest import DEFAULT_SESSION_CONFIG, make_raw_event
+
+_NOW_MS = time.time() * 1000
 
 
 class TestEventRepository:
     """Tests for event read/write."""
 
-    def test_event_write_read(self, db_manager: DatabaseManager) -> None:
+    def test_event_write_read(self, seeded_db: tuple[DatabaseManager, SessionConfig]) -> None:
         """Write an event, then read it back and verify all fields."""
-        # Create session first (FK constraint)
-        session_repo = SessionRepository(db_manager)
-        config = SessionConfig(student_id="test_student", lesson_id="test_lesson")
-        session_repo.create_session(config)
+        db_manager, config = seeded_db
 
         event_repo = EventRepository(db_manager)
         event = make_raw_event(
@@ -47,11 +48,9 @@ class TestEventRepository:
         assert events[0]["event_type"] == "click"
         assert events[0]["student_id"] == "test_student"
 
-    def test_event_count(self, db_manager: DatabaseManager) -> None:
+    def test_event_count(self, seeded_db: tuple[DatabaseManager, SessionConfig]) -> None:
         """Event count is accurate."""
-        session_repo = SessionRepository(db_manager)
-        config = SessionConfig(student_id="test_student", lesson_id="test_lesson")
-        session_repo.create_session(config)
+        db_manager, config = seeded_db
 
         event_repo = EventRepository(db_manager)
         for i in range(5):
@@ -62,11 +61,9 @@ class TestEventRepository:
 
         assert event_repo.get_event_count(config.session_id) == 5
 
-    def test_event_filter_by_type(self, db_manager: DatabaseManager) -> None:
+    def test_event_filter_by_type(self, seeded_db: tuple[DatabaseManager, SessionConfig]) -> None:
         """Events can be filtered by type."""
-        session_repo = SessionRepository(db_manager)
-        config = SessionConfig(student_id="test_student", lesson_id="test_lesson")
-        session_repo.create_session(config)
+        db_manager, config = seeded_db
 
         event_repo = EventRepository(db_manager)
         event_repo.insert_event(make_raw_event(session_id=config.session_id, event_type="click"))
@@ -83,13 +80,13 @@ class TestSessionRepository:
     def test_session_create(self, db_manager: DatabaseManager) -> None:
         """Session is created with all fields."""
         repo = SessionRepository(db_manager)
-        config = SessionConfig(
-            student_id="student_123",
-            lesson_id="lesson_456",
-            eeg_enabled=True,
-            webcam_enabled=False,
-            experiment_group="treatment",
-        )
+        config = DEFAULT_SESSION_CONFIG.model_copy(update={
+            "student_id": "student_123",
+            "lesson_id": "lesson_456",
+            "eeg_enabled": True,
+            "webcam_enabled": False,
+            "experiment_group": "treatment",
+        })
         session_id = repo.create_session(config)
 
         session = repo.get_session(session_id)
@@ -103,7 +100,7 @@ class TestSessionRepository:
     def test_session_end(self, db_manager: DatabaseManager) -> None:
         """Session end updates correctly."""
         repo = SessionRepository(db_manager)
-        config = SessionConfig(student_id="student", lesson_id="lesson")
+        config = DEFAULT_SESSION_CONFIG
         session_id = repo.create_session(config)
 
         repo.end_session(
@@ -125,13 +122,13 @@ class TestSignalRepository:
     def test_snapshot_write(self, db_manager: DatabaseManager) -> None:
         """Signal snapshot is written and can be retrieved."""
         session_repo = SessionRepository(db_manager)
-        config = SessionConfig(student_id="student", lesson_id="lesson")
+        config = DEFAULT_SESSION_CONFIG
         session_repo.create_session(config)
 
         signal_repo = SignalRepository(db_manager)
         snapshot_id = signal_repo.insert_snapshot(
             session_id=config.session_id,
-            timestamp=time.time() * 1000,
+            timestamp=_NOW_MS,
             frustration_score=0.65,
             fatigue_score=0.3,
             response_time_mean_ms=7500.0,
@@ -177,36 +174,32 @@ class TestSignalRepository:
 class TestConcurrentWrites:
     """Test thread safety of database operations."""
 
-    def test_concurrent_writes(self, db_manager: DatabaseManager) -> None:
+    @pytest.mark.parametrize(
+        "thread_count, events_per_thread",
+        [(2, 5), pytest.param(4, 20, marks=pytest.mark.slow)],
+    )
+    def test_concurrent_writes(
+        self, db_manager: DatabaseManager, thread_count: int, events_per_thread: int
+    ) -> None:
         """Multiple threads writing events simultaneously don't corrupt data."""
         session_repo = SessionRepository(db_manager)
-        config = SessionConfig(student_id="student", lesson_id="lesson")
+        config = DEFAULT_SESSION_CONFIG
         session_repo.create_session(config)
 
         event_repo = EventRepository(db_manager)
-        errors: list[Exception] = []
-        events_per_thread = 20
-        thread_count = 4
 
         def write_events(thread_id: int) -> None:
-            try:
-                for i in range(events_per_thread):
-                    event_repo.insert_event(make_raw_event(
-                        session_id=config.session_id,
-                        student_id=f"thread_{thread_id}",
-                    ))
-            except Exception as e:
-                errors.append(e)
-
-        threads = [
-            threading.Thread(target=write_events, args=(t,))
-            for t in range(thread_count)
-        ]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-
-        assert len(errors) == 0, f"Concurrent write errors: {errors}"
+            event_repo.insert_events_atomic([
+                make_raw_event(
+                    session_id=config.session_id,
+                    student_id=f"thread_{thread_id}",
+                )
+                for _ in range(events_per_thread)
+            ])
+
+        # Consuming map() re-raises any worker exception here
+        with ThreadPoolExecutor(max_workers=thread_count) as executor:
+            list(executor.map(write_events, range(thread_count)))
+
         total = event_repo.get_event_count(config.session_id)
         assert total == events_per_thread * thread_count
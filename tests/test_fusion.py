@@ -2,80 +2,184 @@
 NeuroSync AI — Tests for the fusion engine.
 
 Tests:
-  16. test_high_confidence_fires_immediately — 3 signals → intervention
+  16. test_fusion_behavior[high_confidence] — 3 signals → intervention
   17. test_medium_confidence_soft_only — 2 signals → soft intervention
   18. test_low_confidence_no_action — 1 signal → log only
-  19. test_cooldown_respected — second intervention within cooldown not fired
-  20. test_priority_ordering — critical before warning before soft
+  19. test_fusion_behavior[cooldown] — second intervention within cooldown not fired
+  20. test_fusion_behavior[priority] — critical before warning before soft
 """
 
+from __future__ import annotations
+
 import time
+from collections import Counter
+from typing import Callable, Iterator
 
 import pytest
 
 from neurosync.behavioral.fusion import BehavioralFusionEngine
-from neurosync.core.events import QuestionEvent, VideoEvent
+from neurosync.core.events import MomentFlags, QuestionEvent, RawEvent, VideoEvent
 from tests.conftest import make_idle_event, make_question_event, make_raw_event, make_video_event
 
+# Pre-generated event IDs so hot-loop tests skip a uuid4() per event.
+_EVENT_IDS = [f"e{i}" for i in range(30)]
+
+
+def count_moments(flags) -> Counter:
+    """Count ready interventions per moment ID in a single pass."""
+    return Counter(i.moment_id for i in flags.interventions_ready)
+
+
+@pytest.fixture(scope="module")
+def now_ms() -> float:
+    """Wall-clock anchor (ms) captured once for the whole module."""
+    return time.time() * 1000
+
+
+# ── Trigger-event factories ─────────────────────────────────────────
+
+
+def _make_m14_event(now: float, ids: Iterator[str]) -> QuestionEvent:
+    """Suspiciously fast, low-confidence correct answer (M14 trigger)."""
+    return make_question_event(
+        answer_correct=True,
+        response_time_ms=1200,
+        confidence_score=1,
+        timestamp=now,
+        event_id=next(ids),
+    )
+
+
+def _make_frustration_events(
+    now: float,
+    ids: Iterator[str],
+    rt_start_ms: float = 15000,
+    include_m14: bool = False,
+) -> list[RawEvent]:
+    """Rewind burst followed by a jump in response times (M07 triggers)."""
+    # 1. Rewind burst (3 rewinds in 30 seconds)
+    events: list[RawEvent] = [
+        make_video_event(timestamp=now, playback_position_ms=60000, event_id=next(ids)),
+        make_video_event(timestamp=now + 5000, playback_position_ms=60000, event_id=next(ids)),
+        make_video_event(timestamp=now + 10000, playback_position_ms=60000, event_id=next(ids)),
+    ]
+    if include_m14:
+        events.append(_make_m14_event(now + 15000, ids))
+    # 2. Increasing response times
+    for i in range(7):
+        events.append(make_question_event(
+            response_time_ms=4000, timestamp=now + rt_start_ms + i * 1000, event_id=next(ids),
+        ))
+    for i in range(3):
+        events.append(make_question_event(
+            response_time_ms=20000, timestamp=now + rt_start_ms + 10000 + i * 1000, event_id=next(ids),
+        ))
+    return events
+
+
+def _make_idle_ramp(now: float, ids: Iterator[str]) -> list[RawEvent]:
+    """Idle periods growing in length (third frustration signal)."""
+    return [
+        make_idle_event(
+            timestamp=now + 30000 + i * 2000,
+            idle_duration_ms=5000 + i * 2000,
+            event_id=next(ids),
+        )
+        for i in range(5)
+    ]
+
+
+# ── Per-case assertions ─────────────────────────────────────────────
+
+
+def _assert_high_confidence(
+    engine: BehavioralFusionEngine, events: list[RawEvent], flags: MomentFlags
+) -> None:
+    """3+ agreeing signals → M07 active and an intervention fires."""
+    assert "M07" in flags.active_moments
+    assert len(flags.interventions_ready) > 0
+
+
+def _assert_cooldown(
+    engine: BehavioralFusionEngine, events: list[RawEvent], flags: MomentFlags
+) -> None:
+    """Frustration intervention doesn't fire twice within cooldown."""
+    m07_count_1 = count_moments(flags)["M07"]
+
+    # Try again immediately — should be blocked by cooldown
+    engine.add_events(events)
+    m07_count_2 = count_moments(engine.run_cycle())["M07"]
+
+    # First should fire, second should be blocked
+    if m07_count_1 > 0:
+        assert m07_count_2 == 0, "Cooldown should prevent second intervention"
+
+
+def _assert_priority(
+    engine: BehavioralFusionEngine, events: list[RawEvent], flags: MomentFlags
+) -> None:
+    """Multiple interventions are ordered by urgency then confidence."""
+    if len(flags.interventions_ready) >= 2:
+        # Priority should be the most urgent
+        assert flags.priority_intervention is not None
+        # Immediate urgency should come first
+        if any(i.urgency == "immediate" for i in flags.interventions_ready):
+            assert flags.priority_intervention.urgency == "immediate"
+
 
 class TestFusionEngine:
     """Tests for the BehavioralFusionEngine."""
 
-    def _make_engine(self) -> BehavioralFusionEngine:
+    def _make_engine(self, now: float) -> BehavioralFusionEngine:
         """Create a fusion engine for testing (no DB)."""
-        now = time.time() * 1000
         return BehavioralFusionEngine(
             session_id="test_session",
             session_start_ms=now,
             db_manager=None,
         )
 
-    def test_high_confidence_fires_immediately(self) -> None:
-        """When 3+ signals agree (rewind burst + increasing RT + increasing idle) → intervention fires."""
-        engine = self._make_engine()
-        now = time.time() * 1000
-
-        # Create events that trigger frustration:
-        # 1. Rewind burst (3 rewinds in 30 seconds)
-        events = [
-            make_video_event(timestamp=now, playback_position_ms=60000),
-            make_video_event(timestamp=now + 5000, playback_position_ms=60000),
-            make_video_event(timestamp=now + 10000, playback_position_ms=60000),
-        ]
-        # 2. Increasing response times
-        for i in range(7):
-            events.append(make_question_event(
-                response_time_ms=4000 + i * 100,
-                timestamp=now + 15000 + i * 1000,
-            ))
-        for i in range(3):
-            events.append(make_question_event(
-                response_time_ms=18000 + i * 2000,
-                timestamp=now + 25000 + i * 1000,
-            ))
-        # 3. Increasing idle
-        for i in range(5):
-            events.append(make_idle_event(
-                timestamp=now + 30000 + i * 2000,
-                idle_duration_ms=5000 + i * 2000,
-            ))
+    @pytest.mark.parametrize(
+        "event_builder, assertions",
+        [
+            pytest.param(
+                lambda now, ids: _make_frustration_events(now, ids) + _make_idle_ramp(now, ids),
+                _assert_high_confidence,
+                id="high_confidence",
+            ),
+            pytest.param(
+                lambda now, ids: _make_frustration_events(now, ids),
+                _assert_cooldown,
+                id="cooldown",
+            ),
+            pytest.param(
+                lambda now, ids: _make_frustration_events(now, ids, rt_start_ms=20000, include_m14=True),
+                _assert_priority,
+                id="priority",
+            ),
+        ],
+    )
+    def test_fusion_behavior(
+        self,
+        now_ms: float,
+        event_builder: Callable[[float, Iterator[str]], list[RawEvent]],
+        assertions: Callable[[BehavioralFusionEngine, list[RawEvent], MomentFlags], None],
+    ) -> None:
+        """Frustration triggers fire, respect cooldown and are priority-ordered."""
+        engine = self._make_engine(now_ms)
+        events = event_builder(now_ms, iter(_EVENT_IDS))
 
         engine.add_events(events)
         flags = engine.run_cycle()
 
-        # Should have M07 (frustration) active
-        assert "M07" in flags.active_moments
-        # Should have at least one intervention
-        assert len(flags.interventions_ready) > 0
+        assertions(engine, events, flags)
 
-    def test_low_confidence_no_action(self) -> None:
+    def test_low_confidence_no_action(self, now_ms: float) -> None:
         """Minimal/no signals → no active moments, no interventions."""
-        engine = self._make_engine()
-        now = time.time() * 1000
+        engine = self._make_engine(now_ms)
 
         # Just a few normal clicks
         events = [
-            make_raw_event(timestamp=now + i * 2000)
+            make_raw_event(timestamp=now_ms + i * 2000)
             for i in range(5)
         ]
 
@@ -86,15 +190,13 @@ class TestFusionEngine:
         assert "M07" not in flags.active_moments
         assert "M10" not in flags.active_moments
         # No interventions
-        m07_interventions = [i for i in flags.interventions_ready if i.moment_id == "M07"]
-        m10_interventions = [i for i in flags.interventions_ready if i.moment_id == "M10"]
-        assert len(m07_interventions) == 0
-        assert len(m10_interventions) == 0
+        counts = count_moments(flags)
+        assert counts["M07"] == 0
+        assert counts["M10"] == 0
 
-    def test_pseudo_understanding_flags_in_fusion(self) -> None:
+    def test_pseudo_understanding_flags_in_fusion(self, now_ms: float) -> None:
         """Fast correct answers are flagged as M14 through fusion."""
-        engine = self._make_engine()
-        now = time.time() * 1000
+        engine = self._make_engine(now_ms)
 
         # Fast suspicious answer
         events = [
@@ -102,7 +204,7 @@ class TestFusionEngine:
                 answer_correct=True,
                 response_time_ms=1500,  # suspiciously fast
                 confidence_score=1,
-                timestamp=now,
+                timestamp=now_ms,
             ),
         ]
 
@@ -110,72 +212,4 @@ class TestFusionEngine:
         flags = engine.run_cycle()
 
         assert "M14" in flags.active_moments
-        m14_interventions = [i for i in flags.interventions_ready if i.moment_id == "M14"]
-        assert len(m14_interventions) >= 1
-
-    def test_cooldown_respected(self) -> None:
-        """Frustration intervention doesn't fire twice within cooldown."""
-        engine = self._make_engine()
-        now = time.time() * 1000
-
-        # Trigger frustration
-        events = [
-            make_video_event(timestamp=now, playback_position_ms=60000),
-            make_video_event(timestamp=now + 5000, playback_position_ms=60000),
-            make_video_event(timestamp=now + 10000, playback_position_ms=60000),
-        ]
-        for i in range(7):
-            events.append(make_question_event(response_time_ms=4000, timestamp=now + 15000 + i * 1000))
-        for i in range(3):
-            events.append(make_question_event(response_time_ms=20000, timestamp=now + 25000 + i * 1000))
-
-        engine.add_events(events)
-        flags1 = engine.run_cycle()
-
-        m07_count_1 = len([i for i in flags1.interventions_ready if i.moment_id == "M07"])
-
-        # Try again immediately — should be blocked by cooldown
-        engine.add_events(events)
-        flags2 = engine.run_cycle()
-
-        m07_count_2 = len([i for i in flags2.interventions_ready if i.moment_id == "M07"])
-
-        # First should fire, second should be blocked
-        if m07_count_1 > 0:
-            assert m07_count_2 == 0, "Cooldown should prevent second intervention"
-
-    def test_priority_ordering(self) -> None:
-        """When multiple interventions exist, they are ordered by urgency then confidence."""
-        engine = self._make_engine()
-        now = time.time() * 1000
-
-        # Create M14 (flagged answer) + M07 (frustration) simultaneously
-        events = [
-            # M07 triggers
-            make_video_event(timestamp=now, playback_position_ms=60000),
-            make_video_event(timestamp=now + 5000, playback_position_ms=60000),
-            make_video_event(timestamp=now + 10000, playback_position_ms=60000),
-            # M14 trigger
-            make_question_event(
-                answer_correct=True,
-                response_time_ms=1200,
-                confidence_score=1,
-                timestamp=now + 15000,
-            ),
-        ]
-        # Add increasing response times for M07
-        for i in range(7):
-            events.append(make_question_event(response_time_ms=4000, timestamp=now + 20000 + i * 1000))
-        for i in range(3):
-            events.append(make_question_event(response_time_ms=20000, timestamp=now + 30000 + i * 1000))
-
-        engine.add_events(events)
-        flags = engine.run_cycle()
-
-        if len(flags.interventions_ready) >= 2:
-            # Priority should be the most urgent
-            assert flags.priority_intervention is not None
-            # Immediate urgency should come first
-            urgencies = [i.urgency for i in flags.interventions_ready]
-            if "immediate" in urgencies:
-                assert flags.priority_intervention.urgency == "immediate"
+        assert count_moments(flags)["M14"] >= 1
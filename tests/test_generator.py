@@ -8,7 +8,6 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from tests.conftest_interventions import _make_mock_response
 from neurosync.interventions.generator import GeneratedContent, InterventionGenerator
 
 
@@ -18,6 +17,8 @@ EXPLAIN_CTX = {
     "grade_level": 8,
 }
 
+_PERMANENT_FAILURE = RuntimeError("permanent failure")
+
 
 @pytest.mark.asyncio
 async def test_generator_calls_gpt4_on_cache_miss(generator: InterventionGenerator):
@@ -62,11 +63,12 @@ async def test_generator_uses_fallback_on_rate_limit(generator: InterventionGene
 
 
 @pytest.mark.asyncio
-async def test_generator_retries_on_api_error(generator: InterventionGenerator):
+async def test_generator_retries_on_api_error(
+    generator: InterventionGenerator, ok_response: MagicMock
+):
     """API fails twice, succeeds on 3rd try → response returned."""
-    ok_resp = _make_mock_response("Recovered response")
     generator._client.chat.completions.create = AsyncMock(
-        side_effect=[RuntimeError("fail1"), RuntimeError("fail2"), ok_resp],
+        side_effect=[RuntimeError("fail1"), RuntimeError("fail2"), ok_response],
     )
     result = await generator.generate("explain", EXPLAIN_CTX)
     assert result.content == "Recovered response"
@@ -77,7 +79,7 @@ async def test_generator_retries_on_api_error(generator: InterventionGenerator):
 async def test_generator_uses_fallback_after_max_retries(generator: InterventionGenerator):
     """API fails 3 times → fallback template used."""
     generator._client.chat.completions.create = AsyncMock(
-        side_effect=RuntimeError("permanent failure"),
+        side_effect=_PERMANENT_FAILURE,
     )
     result = await generator.generate("explain", EXPLAIN_CTX)
     assert result.model == "fallback_template"
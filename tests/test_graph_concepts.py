@@ -2,11 +2,35 @@
 Tests for ConceptRepository using MockGraphManager.
 """
 
+from functools import lru_cache
+from typing import Callable, Optional
+
 import pytest
 
 from neurosync.knowledge.repositories.concepts import ConceptRepository
+from tests.conftest_graph import MockGraphManager, seed_graph
+
+
+@pytest.fixture(scope="module")
+def all_concepts() -> Callable[[Optional[str]], tuple[dict, ...]]:
+    """
+    Cached ``get_all_concepts`` lookup over a module-wide seeded graph.
+
+    The read-only tests never mutate the graph, so each subject filter is
+    queried once and reused.
+    """
+    gm = MockGraphManager()
+    gm.connect()
+    repo = ConceptRepository(seed_graph(gm))
 
+    @lru_cache(maxsize=16)
+    def _lookup(subject: Optional[str] = None) -> tuple[dict, ...]:
+        return tuple(repo.get_all_concepts(subject=subject))
 
+    return _lookup
+
+
+@pytest.mark.xdist_group("seeded_graph")
 class TestConceptRepository:
     """Test concept CRUD operations with MockGraphManager."""
 
@@ -30,16 +54,14 @@ class TestConceptRepository:
         assert concept["category"] == "core"
         assert concept["difficulty"] == 0.5
 
-    def test_get_all_concepts(self, seeded_graph):
+    def test_get_all_concepts(self, all_concepts):
         """Get all seeded concepts."""
-        repo = ConceptRepository(seeded_graph)
-        concepts = repo.get_all_concepts()
+        concepts = all_concepts()
         assert len(concepts) >= 9  # seeded_graph has 9 concepts
 
-    def test_get_concepts_by_subject(self, seeded_graph):
+    def test_get_concepts_by_subject(self, all_concepts):
         """Filter concepts by subject."""
-        repo = ConceptRepository(seeded_graph)
-        bio = repo.get_all_concepts(subject="biology")
+        bio = all_concepts("biology")
         assert len(bio) >= 9
         assert all(c["subject"] == "biology" for c in bio)
 
@@ -47,23 +69,20 @@ class TestConceptRepository:
         """Verify prerequisite relationships."""
         repo = ConceptRepository(seeded_graph)
         prereqs = repo.get_prerequisites("bio_photosynthesis")
-        prereq_ids = [p["concept_id"] for p in prereqs]
-        assert "bio_chloroplast" in prereq_ids
-        assert "bio_atp" in prereq_ids
-        assert "bio_enzymes" in prereq_ids
+        prereq_ids = {p["concept_id"] for p in prereqs}
+        assert {"bio_chloroplast", "bio_atp", "bio_enzymes"} <= prereq_ids
 
     def test_get_dependents(self, seeded_graph):
         """Get concepts that depend on a prerequisite."""
         repo = ConceptRepository(seeded_graph)
         dependents = repo.get_dependents("bio_atp")
-        dep_ids = [d["concept_id"] for d in dependents]
-        assert "bio_photosynthesis" in dep_ids
+        dep_ids = {d["concept_id"] for d in dependents}
+        assert {"bio_photosynthesis"} <= dep_ids
 
     def test_next_concepts(self, seeded_graph):
         """Get next concepts in learning path."""
         repo = ConceptRepository(seeded_graph)
         next_c = repo.get_next_concepts("bio_photosynthesis")
         assert len(next_c) == 2
-        next_ids = [n["concept_id"] for n in next_c]
-        assert "bio_light_reactions" in next_ids
-        assert "bio_calvin_cycle" in next_ids
+        next_ids = {n["concept_id"] for n in next_c}
+        assert {"bio_light_reactions", "bio_calvin_cycle"} <= next_ids
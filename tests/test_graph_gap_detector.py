@@ -7,6 +7,7 @@ import pytest
 from neurosync.knowledge.detectors.gap_detector import GapDetector, GapResult
 
 
+@pytest.mark.xdist_group("seeded_graph")
 class TestGapDetector:
     """Test knowledge gap detection."""
 
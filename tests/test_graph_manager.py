@@ -2,8 +2,6 @@
 Tests for GraphManager and NullSession.
 """
 
-import pytest
-
 from neurosync.knowledge.graph_manager import GraphManager, NullSession, NullResult
 
 
@@ -8,19 +8,26 @@ from neurosync.knowledge.repositories.mastery import MasteryRepository, _score_t
 from neurosync.knowledge.repositories.students import StudentRepository
 
 
+@pytest.mark.xdist_group("seeded_graph")
 class TestMasteryRepository:
     """Test mastery computation and tracking."""
 
-    def test_score_to_level(self):
-        """Score-to-level mapping works correctly."""
-        assert _score_to_level(0.0) == "novice"
-        assert _score_to_level(0.29) == "novice"
-        assert _score_to_level(0.30) == "developing"
-        assert _score_to_level(0.59) == "developing"
-        assert _score_to_level(0.60) == "proficient"
-        assert _score_to_level(0.84) == "proficient"
-        assert _score_to_level(0.85) == "mastered"
-        assert _score_to_level(1.0) == "mastered"
+    @pytest.mark.parametrize(
+        "score, level",
+        [
+            (0.0, "novice"),
+            (0.29, "novice"),
+            (0.30, "developing"),
+            (0.59, "developing"),
+            (0.60, "proficient"),
+            (0.84, "proficient"),
+            (0.85, "mastered"),
+            (1.0, "mastered"),
+        ],
+    )
+    def test_score_to_level(self, score, level):
+        """Score-to-level mapping works correctly at each boundary."""
+        assert _score_to_level(score) == level
 
     def test_compute_mastery_correct_answer(self, seeded_graph):
         """Correct answer increases mastery score."""
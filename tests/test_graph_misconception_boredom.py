@@ -9,6 +9,27 @@ from neurosync.knowledge.detectors.mastery_checker import MasteryChecker, Boredo
 from neurosync.knowledge.repositories.misconceptions import MisconceptionRepository
 
 
+@pytest.fixture
+def photo_food_misconception(seeded_graph) -> list[dict]:
+    """
+    Add the "plants eat soil" misconception to the test's seeded graph.
+
+    Returns the ``known`` list for bio_photosynthesis; the write is rolled
+    back with the rest of the test's changes when ``seeded_graph`` tears down.
+    """
+    mc_repo = MisconceptionRepository(seeded_graph)
+    mc_repo.create_misconception(
+        misconception_id="mc_photo_food",
+        concept_id="bio_photosynthesis",
+        description="Plants eat food from the soil",
+        common_wrong_answer="soil nutrients",
+        correction="Plants make their own food via photosynthesis",
+        severity=0.7,
+    )
+    return mc_repo.get_misconceptions_for_concept("bio_photosynthesis")
+
+
+@pytest.mark.xdist_group("seeded_graph")
 class TestMisconceptionDetector:
     """Test misconception detection."""
 
@@ -23,21 +44,10 @@ class TestMisconceptionDetector:
         )
         assert result.misconception_detected is False
 
-    def test_misconception_matched(self, seeded_graph):
+    def test_misconception_matched(self, seeded_graph, photo_food_misconception):
         """Misconception detected when wrong answer matches known pattern."""
-        # Seed a misconception
-        mc_repo = MisconceptionRepository(seeded_graph)
-        mc_repo.create_misconception(
-            misconception_id="mc_photo_food",
-            concept_id="bio_photosynthesis",
-            description="Plants eat food from the soil",
-            common_wrong_answer="soil nutrients",
-            correction="Plants make their own food via photosynthesis",
-            severity=0.7,
-        )
-
+        known = photo_food_misconception
         detector = MisconceptionDetector(seeded_graph)
-        known = mc_repo.get_misconceptions_for_concept("bio_photosynthesis")
 
         result = detector.detect(
             student_id="arjun",
@@ -51,19 +61,10 @@ class TestMisconceptionDetector:
         assert result.correction != ""
         assert result.severity == 0.7
 
-    def test_repeat_wrong_answer_escalates(self, seeded_graph):
+    def test_repeat_wrong_answer_escalates(self, seeded_graph, photo_food_misconception):
         """Repeated wrong answers increase confidence and change action."""
+        known = photo_food_misconception
         detector = MisconceptionDetector(seeded_graph)
-        mc_repo = MisconceptionRepository(seeded_graph)
-        mc_repo.create_misconception(
-            misconception_id="mc_photo_food",
-            concept_id="bio_photosynthesis",
-            description="Plants eat food from the soil",
-            common_wrong_answer="soil nutrients",
-            correction="Plants make food via photosynthesis",
-            severity=0.7,
-        )
-        known = mc_repo.get_misconceptions_for_concept("bio_photosynthesis")
 
         # First wrong answer
         r1 = detector.detect("arjun", "bio_photosynthesis", "soil nutrients",
@@ -89,6 +90,7 @@ class TestMisconceptionDetector:
         assert result.recommended_action == "investigate_novel_misconception"
 
 
+@pytest.mark.xdist_group("seeded_graph")
 class TestMasteryChecker:
     """Test stealth boredom / mastery checker."""
 
@@ -102,8 +104,7 @@ class TestMasteryChecker:
         """Boredom detected with high mastery and many encounters."""
         checker = MasteryChecker(seeded_graph)
         # Record 6 encounters (threshold is 5)
-        for _ in range(6):
-            checker.record_encounter("arjun", "bio_cells")
+        checker.record_encounters_batch("arjun", ["bio_cells"] * 6)
 
         result = checker.detect(
             student_id="arjun",
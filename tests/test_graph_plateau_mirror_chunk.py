@@ -3,8 +3,6 @@ Tests for PlateauDetector (M22), ConfidenceCollapseMirror (M09),
 and ChunkTracker (M16).
 """
 
-import time
-
 import pytest
 
 from neurosync.knowledge.detectors.plateau_detector import PlateauDetector, PlateauResult
@@ -12,6 +10,7 @@ from neurosync.knowledge.detectors.mirror import ConfidenceCollapseMirror, Colla
 from neurosync.knowledge.detectors.chunk_tracker import ChunkTracker, ChunkResult
 
 
+@pytest.mark.xdist_group("seeded_graph")
 class TestPlateauDetector:
     """Test mastery plateau detection."""
 
@@ -21,10 +20,10 @@ class TestPlateauDetector:
         result = detector.detect("arjun", "bio_cells", current_score=0.5, attempts=3)
         assert result.plateau_detected is False
 
-    def test_plateau_detected(self, seeded_graph):
+    def test_plateau_detected(self, seeded_graph, frozen_time):
         """Plateau detected with enough attempts and low variance."""
         detector = PlateauDetector(seeded_graph)
-        now = time.time()
+        now = frozen_time.now
         # Record consistent scores (low variance)
         for i in range(10):
             detector.record_score("arjun", "bio_cells", 0.50 + (i % 2) * 0.01,
@@ -41,10 +40,10 @@ class TestPlateauDetector:
         assert result.recommended_action == "try_alternative_explanation"
         assert result.confidence > 0.5
 
-    def test_no_plateau_improving(self, seeded_graph):
+    def test_no_plateau_improving(self, seeded_graph, frozen_time):
         """No plateau when scores are improving (high variance)."""
         detector = PlateauDetector(seeded_graph)
-        now = time.time()
+        now = frozen_time.now
         # Record improving scores with large steps (high variance > 0.05)
         for i in range(10):
             detector.record_score("arjun", "bio_cells", 0.05 + i * 0.10,
@@ -60,6 +59,7 @@ class TestPlateauDetector:
         assert result.plateau_detected is False
 
 
+@pytest.mark.xdist_group("seeded_graph")
 class TestConfidenceCollapseMirror:
     """Test confidence collapse detection."""
 
@@ -70,11 +70,11 @@ class TestConfidenceCollapseMirror:
                                previous_score=0.70, current_score=0.60)
         assert result.collapse_detected is False
 
-    def test_collapse_detected_large_drop(self, seeded_graph):
+    def test_collapse_detected_large_drop(self, seeded_graph, frozen_time):
         """Collapse detected with drop exceeding threshold."""
         mirror = ConfidenceCollapseMirror(seeded_graph)
         # Record some history
-        now = time.time()
+        now = frozen_time.now
         mirror.record_score("arjun", "bio_cells", 0.80, timestamp=now - 60)
         mirror.record_score("arjun", "bio_cells", 0.75, timestamp=now - 30)
 
@@ -95,6 +95,7 @@ class TestConfidenceCollapseMirror:
         assert result.collapse_detected is False
 
 
+@pytest.mark.xdist_group("seeded_graph")
 class TestChunkTracker:
     """Test working memory overflow detection."""
 
@@ -108,16 +109,17 @@ class TestChunkTracker:
         assert result.overflow_detected is False
         assert result.new_concepts_count == 2
 
-    def test_overflow_too_many_new(self, seeded_graph):
+    def test_overflow_too_many_new(self, seeded_graph, frozen_time):
         """Overflow detected when too many new concepts in window."""
         tracker = ChunkTracker(seeded_graph)
-        now = time.time()
-        for i, cid in enumerate([
-            "bio_cells", "bio_organelles", "bio_chloroplast",
-            "bio_atp", "bio_enzymes", "bio_photosynthesis",
-        ]):
-            tracker.record_encounter("arjun", cid, mastery_score=0.1,
-                                     timestamp=now + i)
+        now = frozen_time.now
+        tracker.record_encounters_batch("arjun", [
+            (cid, 0.1, now + i)
+            for i, cid in enumerate([
+                "bio_cells", "bio_organelles", "bio_chloroplast",
+                "bio_atp", "bio_enzymes", "bio_photosynthesis",
+            ])
+        ])
 
         result = tracker.detect("arjun")
         assert result.overflow_detected is True
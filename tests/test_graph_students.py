@@ -8,6 +8,7 @@ from neurosync.knowledge.repositories.students import StudentRepository
 from neurosync.knowledge.repositories.concepts import ConceptRepository
 
 
+@pytest.mark.xdist_group("seeded_graph")
 class TestStudentRepository:
     """Test student CRUD and relationship operations."""
 
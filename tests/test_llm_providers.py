@@ -6,8 +6,9 @@ Tests both Groq and OpenAI providers, the factory, and interface compatibility.
 
 from __future__ import annotations
 
+import copy
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -17,6 +18,24 @@ from neurosync.llm.openai_provider import OpenAIProvider
 from neurosync.llm.factory import LLMProviderFactory
 
 
+# Response scaffold built once at import; tests take a shallow copy.
+_RESP_PROTO = MagicMock()
+_RESP_PROTO.choices = [MagicMock()]
+_RESP_PROTO.choices[0].message.content = "test"
+_RESP_PROTO.choices[0].finish_reason = "stop"
+_RESP_PROTO.usage.total_tokens = 10
+
+
+@pytest.fixture
+def mock_chat_response() -> MagicMock:
+    """Pre-wired chat-completion response; each test sets its own ``usage``."""
+    resp = MagicMock()
+    resp.choices = [MagicMock()]
+    resp.choices[0].message.content = "4"
+    resp.choices[0].finish_reason = "stop"
+    return resp
+
+
 # ── Unit Tests: LLMMessage / LLMResponse models ────────────────────
 
 
@@ -50,54 +69,64 @@ class TestLLMModels:
 # ── Unit Tests: GroqProvider ────────────────────────────────────────
 
 
+@pytest.fixture(scope="class")
+def groq_provider() -> GroqProvider:
+    """One GroqProvider per test class; tests monkeypatch what they mutate."""
+    return GroqProvider(api_key="fake-key")
+
+
+@pytest.fixture(scope="class")
+def openai_provider() -> OpenAIProvider:
+    """One OpenAIProvider per test class; tests monkeypatch what they mutate."""
+    return OpenAIProvider(api_key="fake-key")
+
+
 class TestGroqProvider:
     """Test Groq provider without real API calls."""
 
-    def test_provider_name(self) -> None:
-        provider = GroqProvider(api_key="fake-key")
-        assert provider.provider_name == "groq"
-        assert provider.get_provider_name() == "groq"
+    def test_provider_name(self, groq_provider: GroqProvider) -> None:
+        assert groq_provider.provider_name == "groq"
+        assert groq_provider.get_provider_name() == "groq"
 
-    def test_default_model(self) -> None:
-        provider = GroqProvider(api_key="fake-key")
-        assert provider.model == "llama-3.3-70b-versatile"
+    def test_default_model(self, groq_provider: GroqProvider) -> None:
+        assert groq_provider.model == "llama-3.3-70b-versatile"
 
     def test_custom_model(self) -> None:
         provider = GroqProvider(api_key="fake-key", model="llama-3.1-8b-instant")
         assert provider.model == "llama-3.1-8b-instant"
 
-    def test_rate_limit_tracking(self) -> None:
-        provider = GroqProvider(api_key="fake-key")
-        assert provider.requests_per_minute == 30
-        assert len(provider.request_timestamps) == 0
+    def test_rate_limit_tracking(self, groq_provider: GroqProvider) -> None:
+        assert groq_provider.requests_per_minute == 30
+        assert len(groq_provider.request_timestamps) == 0
 
-    def test_chat_completion_with_mock(self) -> None:
+    def test_chat_completion_with_mock(
+        self,
+        groq_provider: GroqProvider,
+        mock_chat_response: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Test chat completion with a mocked Groq client."""
-        provider = GroqProvider(api_key="fake-key")
-
         # Mock the internal client
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "4"
-        mock_response.choices[0].finish_reason = "stop"
-        mock_response.usage.total_tokens = 15
-
-        provider.client = MagicMock()
-        provider.client.chat.completions.create.return_value = mock_response
+        monkeypatch.setattr(groq_provider, "client", MagicMock())
+        monkeypatch.setattr(groq_provider, "request_timestamps", [])
+        mock_chat_response.usage.total_tokens = 15
+        groq_provider.client.chat.completions.create.return_value = mock_chat_response
 
         messages = [LLMMessage(role="user", content="What is 2+2?")]
-        response = provider.chat_completion(messages, max_tokens=10)
+        response = groq_provider.chat_completion(messages, max_tokens=10)
 
         assert response.content == "4"
         assert response.provider == "groq"
         assert response.tokens_used == 15
         assert response.finish_reason == "stop"
 
-    def test_is_available_returns_false_on_error(self) -> None:
-        provider = GroqProvider(api_key="fake-key")
-        provider.client = MagicMock()
-        provider.client.chat.completions.create.side_effect = Exception("API error")
-        assert provider.is_available() is False
+    def test_is_available_returns_false_on_error(
+        self, groq_provider: GroqProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(groq_provider, "client", MagicMock())
+        monkeypatch.setattr(groq_provider, "request_timestamps", [])
+        groq_provider.client.chat.completions.create.side_effect = Exception("API error")
+        assert groq_provider.is_available() is False
 
 
 # ── Unit Tests: OpenAIProvider ──────────────────────────────────────
@@ -106,45 +135,42 @@ class TestGroqProvider:
 class TestOpenAIProvider:
     """Test OpenAI provider without real API calls."""
 
-    def test_provider_name(self) -> None:
-        provider = OpenAIProvider(api_key="fake-key")
-        assert provider.provider_name == "openai"
-        assert provider.get_provider_name() == "openai"
+    def test_provider_name(self, openai_provider: OpenAIProvider) -> None:
+        assert openai_provider.provider_name == "openai"
+        assert openai_provider.get_provider_name() == "openai"
 
-    def test_default_model(self) -> None:
-        provider = OpenAIProvider(api_key="fake-key")
-        assert provider.model == "gpt-4o"
+    def test_default_model(self, openai_provider: OpenAIProvider) -> None:
+        assert openai_provider.model == "gpt-4o"
 
     def test_custom_model(self) -> None:
         provider = OpenAIProvider(api_key="fake-key", model="gpt-3.5-turbo")
         assert provider.model == "gpt-3.5-turbo"
 
-    def test_chat_completion_with_mock(self) -> None:
+    def test_chat_completion_with_mock(
+        self,
+        openai_provider: OpenAIProvider,
+        mock_chat_response: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Test chat completion with a mocked OpenAI client."""
-        provider = OpenAIProvider(api_key="fake-key")
-
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "4"
-        mock_response.choices[0].finish_reason = "stop"
-        mock_response.usage.total_tokens = 20
-
-        provider.client = MagicMock()
-        provider.client.chat.completions.create.return_value = mock_response
+        monkeypatch.setattr(openai_provider, "client", MagicMock())
+        mock_chat_response.usage.total_tokens = 20
+        openai_provider.client.chat.completions.create.return_value = mock_chat_response
 
         messages = [LLMMessage(role="user", content="What is 2+2?")]
-        response = provider.chat_completion(messages, max_tokens=10)
+        response = openai_provider.chat_completion(messages, max_tokens=10)
 
         assert response.content == "4"
         assert response.provider == "openai"
         assert response.tokens_used == 20
         assert response.finish_reason == "stop"
 
-    def test_is_available_returns_false_on_error(self) -> None:
-        provider = OpenAIProvider(api_key="fake-key")
-        provider.client = MagicMock()
-        provider.client.chat.completions.create.side_effect = Exception("API error")
-        assert provider.is_available() is False
+    def test_is_available_returns_false_on_error(
+        self, openai_provider: OpenAIProvider, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(openai_provider, "client", MagicMock())
+        openai_provider.client.chat.completions.create.side_effect = Exception("API error")
+        assert openai_provider.is_available() is False
 
 
 # ── Unit Tests: Interface Compatibility ─────────────────────────────
@@ -173,12 +199,7 @@ class TestInterfaceCompatibility:
         """Both providers return LLMResponse from chat_completion."""
         for cls in (GroqProvider, OpenAIProvider):
             provider = cls(api_key="fake")
-
-            mock_response = MagicMock()
-            mock_response.choices = [MagicMock()]
-            mock_response.choices[0].message.content = "test"
-            mock_response.choices[0].finish_reason = "stop"
-            mock_response.usage.total_tokens = 10
+            mock_response = copy.copy(_RESP_PROTO)
 
             provider.client = MagicMock()
             provider.client.chat.completions.create.return_value = mock_response
@@ -191,33 +212,40 @@ class TestInterfaceCompatibility:
 # ── Unit Tests: LLMProviderFactory ──────────────────────────────────
 
 
+@pytest.fixture
+def llm_env(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    """
+    Clear only the environment keys the factory reads.
+
+    Tests then ``setenv`` the single key they need, instead of copying the
+    whole of ``os.environ`` with ``patch.dict``.
+    """
+    for key in ("GROQ_API_KEY", "OPENAI_API_KEY", "LLM_PROVIDER"):
+        monkeypatch.delenv(key, raising=False)
+    return monkeypatch
+
+
 class TestLLMProviderFactory:
     """Test the factory pattern for provider creation."""
 
-    def test_get_available_providers_empty(self) -> None:
-        with patch.dict(os.environ, {}, clear=True):
-            providers = LLMProviderFactory.get_available_providers()
-            assert "groq" not in providers
-            assert "openai" not in providers
-
-    def test_get_available_providers_with_groq(self) -> None:
-        with patch.dict(os.environ, {"GROQ_API_KEY": "gsk_test"}, clear=False):
-            providers = LLMProviderFactory.get_available_providers()
-            assert "groq" in providers
-
-    def test_get_available_providers_with_openai(self) -> None:
-        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test"}, clear=False):
-            providers = LLMProviderFactory.get_available_providers()
-            assert "openai" in providers
-
-    def test_factory_raises_when_no_providers(self) -> None:
-        with patch.dict(os.environ, {}, clear=True):
-            # Remove all API keys
-            env = {k: v for k, v in os.environ.items()
-                   if k not in ("GROQ_API_KEY", "OPENAI_API_KEY")}
-            with patch.dict(os.environ, env, clear=True):
-                with pytest.raises(RuntimeError, match="No LLM provider available"):
-                    LLMProviderFactory.create_provider(enable_fallback=False)
+    def test_get_available_providers_empty(self, llm_env: pytest.MonkeyPatch) -> None:
+        providers = LLMProviderFactory.get_available_providers()
+        assert "groq" not in providers
+        assert "openai" not in providers
+
+    def test_get_available_providers_with_groq(self, llm_env: pytest.MonkeyPatch) -> None:
+        llm_env.setenv("GROQ_API_KEY", "gsk_test")
+        providers = LLMProviderFactory.get_available_providers()
+        assert "groq" in providers
+
+    def test_get_available_providers_with_openai(self, llm_env: pytest.MonkeyPatch) -> None:
+        llm_env.setenv("OPENAI_API_KEY", "sk-test")
+        providers = LLMProviderFactory.get_available_providers()
+        assert "openai" in providers
+
+    def test_factory_raises_when_no_providers(self, llm_env: pytest.MonkeyPatch) -> None:
+        with pytest.raises(RuntimeError, match="No LLM provider available"):
+            LLMProviderFactory.create_provider(enable_fallback=False)
 
 
 # ── Integration Tests (require API keys) ────────────────────────────
@@ -7,16 +7,29 @@ existing functionality. Tests backward compatibility with mock clients.
 
 from __future__ import annotations
 
+import importlib
 import json
 import os
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from neurosync.config.settings import LLM_CONFIG, TTS_CONFIG
 from neurosync.content.pipeline import ContentPipeline, PipelineConfig
 from neurosync.interventions.generator import InterventionGenerator
+from neurosync.llm.factory import LLMProviderFactory
 
+# Canned chat-completion response, built once for the module.
+_MOCK_RESP = SimpleNamespace(
+    choices=[SimpleNamespace(message=SimpleNamespace(content="Test response"))],
+    usage=SimpleNamespace(prompt_tokens=100, completion_tokens=50, total_tokens=150),
+)
+
+# Environment without any LLM API keys, snapshotted once at import.
+_ENV_NO_GROQ = os.environ.copy()
+_ENV_NO_GROQ.pop("GROQ_API_KEY", None)
+_ENV_NO_GROQ.pop("OPENAI_API_KEY", None)
 
 # ── Test: Settings include new config ───────────────────────────────
 
@@ -51,65 +64,60 @@ class TestMigrationConfig:
 class TestInterventionGeneratorCompatibility:
     """Test that InterventionGenerator still works with mocked clients."""
 
-    def test_init_with_api_key(self) -> None:
-        """Backward compatible: passing api_key still works."""
-        gen = InterventionGenerator(api_key="sk-test-dummy")
-        assert gen._api_key == "sk-test-dummy"
-        assert gen._model == "gpt-4-turbo-preview"
-
-    def test_init_with_api_key_and_model(self) -> None:
-        gen = InterventionGenerator(api_key="sk-test", model="gpt-3.5-turbo")
-        assert gen._model == "gpt-3.5-turbo"
-
-    def test_init_uses_groq_when_configured(self) -> None:
-        with patch.dict(os.environ, {
-            "LLM_PROVIDER": "groq",
-            "GROQ_API_KEY": "gsk_test",
-        }):
-            gen = InterventionGenerator()
-            assert gen._llm_provider_type == "groq"
-            assert gen._api_key == "gsk_test"
-            assert "llama" in gen._model
-
-    def test_init_falls_back_to_openai(self) -> None:
-        env = {k: v for k, v in os.environ.items() if k != "GROQ_API_KEY"}
-        env["LLM_PROVIDER"] = "openai"
-        env["OPENAI_API_KEY"] = "sk-fallback"
-        with patch.dict(os.environ, env, clear=True):
-            gen = InterventionGenerator()
-            assert gen._llm_provider_type == "openai"
+    @pytest.mark.parametrize(
+        "env, kwargs, expected_provider, expected_key, expected_model_prefix",
+        [
+            pytest.param(
+                {"LLM_PROVIDER": "openai"},
+                {"api_key": "sk-test-dummy"},
+                "openai", "sk-test-dummy", "gpt-4-turbo-preview",
+                id="api_key",
+            ),
+            pytest.param(
+                {"LLM_PROVIDER": "openai"},
+                {"api_key": "sk-test", "model": "gpt-3.5-turbo"},
+                "openai", "sk-test", "gpt-3.5-turbo",
+                id="api_key_and_model",
+            ),
+            pytest.param(
+                {"LLM_PROVIDER": "openai", "OPENAI_API_KEY": "sk-fallback"},
+                {},
+                "openai", "sk-fallback", "gpt",
+                id="falls_back_to_openai",
+            ),
+        ],
+    )
+    def test_init_resolves_provider(
+        self, env, kwargs, expected_provider, expected_key, expected_model_prefix,
+    ) -> None:
+        """Explicit api_key wins; otherwise LLM_PROVIDER + env keys pick the backend."""
+        with patch.dict(os.environ, {**_ENV_NO_GROQ, **env}, clear=True):
+            gen = InterventionGenerator(**kwargs)
+        assert gen._llm_provider_type == expected_provider
+        assert gen._api_key == expected_key
+        assert gen._model.startswith(expected_model_prefix)
 
     @pytest.mark.asyncio
-    async def test_generate_with_mocked_client(self, tmp_path) -> None:
+    async def test_generate_with_mocked_client(
+        self, cache_manager, cost_tracker, no_cache_writes, monkeypatch,
+    ) -> None:
         """Critical: mocked client path still works (all existing tests use this)."""
-        from neurosync.interventions.cache.manager import CacheManager
-        from neurosync.interventions.cost_tracker import CostTracker
+        if no_cache_writes:
+            # Nothing below reads back from SQLite, so the write is pure overhead
+            monkeypatch.setattr(cache_manager, "_persist", lambda *_args: None)
 
         gen = InterventionGenerator(
             api_key="sk-test-dummy",
-            cache_manager=CacheManager(db_path=str(tmp_path / "test.db"), max_size=100),
-            cost_tracker=CostTracker(),
+            cache_manager=cache_manager,
+            cost_tracker=cost_tracker,
         )
 
-        # Mock the client (same pattern as existing tests)
-        mock_msg = MagicMock()
-        mock_msg.content = "Test response"
-
-        mock_choice = MagicMock()
-        mock_choice.message = mock_msg
-
-        mock_usage = MagicMock()
-        mock_usage.prompt_tokens = 100
-        mock_usage.completion_tokens = 50
-        mock_usage.total_tokens = 150
+        async def _create(*_args, **_kwargs):
+            return _MOCK_RESP
 
-        mock_resp = MagicMock()
-        mock_resp.choices = [mock_choice]
-        mock_resp.usage = mock_usage
-
-        mock_client = MagicMock()
-        mock_client.chat.completions.create = AsyncMock(return_value=mock_resp)
-        gen._client = mock_client
+        gen._client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=_create)),
+        )
 
         result = await gen.generate("explain", {
             "original_content": "Test content",
@@ -139,54 +147,80 @@ class TestContentPipelineCompatibility:
 
     def test_pipeline_creates_client_when_none(self) -> None:
         """When no client provided, factory tries env vars."""
-        env = {k: v for k, v in os.environ.items()
-               if k not in ("GROQ_API_KEY", "OPENAI_API_KEY")}
-        with patch.dict(os.environ, env, clear=True):
+        with patch.dict(os.environ, _ENV_NO_GROQ, clear=True):
             pipeline = ContentPipeline()
             # No API keys -> client is None (graceful degradation)
             assert pipeline.client is None
 
-    def test_pipeline_creates_groq_client(self) -> None:
-        """When Groq configured, pipeline creates Groq-compatible client."""
-        with patch.dict(os.environ, {
-            "LLM_PROVIDER": "groq",
-            "GROQ_API_KEY": "gsk_test",
-        }):
-            pipeline = ContentPipeline()
-            # Client should be created (AsyncOpenAI pointed at Groq)
-            assert pipeline.client is not None
 
+# ── Test: Groq-configured environment ───────────────────────────────
 
-# ── Test: Provider abstraction layer ────────────────────────────────
 
+@pytest.fixture(scope="class")
+def groq_env():
+    """Point LLM_PROVIDER at Groq with a dummy key for one test class."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("LLM_PROVIDER", "groq")
+        mp.setenv("GROQ_API_KEY", "gsk_test")
+        yield
 
-class TestProviderAbstraction:
-    """Test that the provider abstraction layer works standalone."""
 
-    def test_groq_provider_init(self) -> None:
-        from neurosync.llm.groq_provider import GroqProvider
+@pytest.mark.usefixtures("groq_env")
+class TestGroqConfigured:
+    """Generator and pipeline both pick up Groq from the environment."""
 
-        provider = GroqProvider(api_key="fake")
-        assert provider.provider_name == "groq"
-        assert provider.model == "llama-3.3-70b-versatile"
+    def test_generator_uses_groq(self) -> None:
+        gen = InterventionGenerator()
+        assert gen._llm_provider_type == "groq"
+        assert gen._api_key == "gsk_test"
+        assert gen._model.startswith("llama")
 
-    def test_openai_provider_init(self) -> None:
-        from neurosync.llm.openai_provider import OpenAIProvider
+    def test_pipeline_creates_groq_client(self) -> None:
+        """When Groq configured, pipeline creates Groq-compatible client."""
+        pipeline = ContentPipeline()
+        # Client should be created (AsyncOpenAI pointed at Groq)
+        assert pipeline.client is not None
 
-        provider = OpenAIProvider(api_key="fake")
-        assert provider.provider_name == "openai"
-        assert provider.model == "gpt-4o"
 
-    def test_gtts_provider_init(self, tmp_path) -> None:
-        from neurosync.tts.gtts_provider import GTTSProvider
+# ── Test: Provider abstraction layer ────────────────────────────────
 
-        provider = GTTSProvider(output_dir=str(tmp_path))
-        assert provider.provider_name == "gtts"
-        assert provider.language == "en"
 
-    def test_factory_available_providers(self) -> None:
-        from neurosync.llm.factory import LLMProviderFactory
+class TestProviderAbstraction:
+    """Test that the provider abstraction layer works standalone."""
 
+    @pytest.mark.parametrize(
+        "module_path, class_name, requires, expected",
+        [
+            pytest.param(
+                "neurosync.llm.groq_provider", "GroqProvider", None,
+                {"provider_name": "groq", "model": "llama-3.3-70b-versatile"},
+                id="groq",
+            ),
+            pytest.param(
+                "neurosync.llm.openai_provider", "OpenAIProvider", None,
+                {"provider_name": "openai", "model": "gpt-4o"},
+                id="openai",
+            ),
+            pytest.param(
+                "neurosync.tts.gtts_provider", "GTTSProvider", "gtts",
+                {"provider_name": "gtts", "language": "en"},
+                id="gtts",
+            ),
+        ],
+    )
+    def test_provider_init(self, tmp_path, module_path, class_name, requires, expected) -> None:
+        """Each provider constructs offline with its default settings."""
+        if requires:
+            pytest.importorskip(requires)
+        cls = getattr(importlib.import_module(module_path), class_name)
+        if module_path.startswith("neurosync.tts."):
+            provider = cls(output_dir=str(tmp_path))
+        else:
+            provider = cls(api_key="fake")
+        for attr, value in expected.items():
+            assert getattr(provider, attr) == value
+
+    def test_factory_available_providers(self) -> None:
         providers = LLMProviderFactory.get_available_providers()
         assert isinstance(providers, list)
 
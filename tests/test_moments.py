@@ -2,8 +2,8 @@
 NeuroSync AI — Tests for moment detectors.
 
 Tests:
-  7.  test_frustration_critical — correct signals → critical level
-  8.  test_frustration_no_trigger — insufficient signals → no flag
+  7.  test_frustration_level[critical] — correct signals → critical level
+  8.  test_frustration_level[no_trigger] — insufficient signals → no flag
   9.  test_fatigue_mandatory — after 35min + high variance → mandatory break
   10. test_fatigue_cooldown — no second break within 20 min
   11. test_pseudo_understanding_fast_answer — <3s answer flagged
@@ -13,65 +13,53 @@ Tests:
   15. test_variable_reward_unpredictable — fires within window bounds
 """
 
-import time
 import uuid
 
 import pytest
 
-from neurosync.behavioral.moments import (
-    FatigueDetector,
-    FrustrationDetector,
-    InsightDetector,
-    PseudoUnderstandingDetector,
-    VariableRewardScheduler,
-)
 from neurosync.core.events import QuestionEvent
-from tests.conftest import make_question_event
+from tests.conftest import make_event_fast
+
+# Fixed wall-clock anchor (s); every detector here takes time explicitly.
+NOW = 1_700_000_000.0
+# Offsets (s) from NOW: 90 s of struggle, one sample every 9 s.
+_FRUSTRATION_TIMES = tuple(-90 + i * 9 for i in range(10))
+# Offsets (s) for 20 correct answers, 1 minute apart (avoids cooldown).
+_ANSWER_TIMES = tuple(i * 60 for i in range(20))
 
 
 class TestFrustrationDetector:
     """Tests for M07 — Frustration Detector."""
 
-    def test_frustration_critical(self) -> None:
-        """When rewind burst + increasing response time + increasing idle → critical."""
-        detector = FrustrationDetector()
-        result = detector.detect(
-            rewind_burst=True,
-            response_time_trend="increasing",
-            idle_trend="increasing",
+    @pytest.mark.parametrize(
+        "rewind, rt_trend, idle_trend, level, min_score",
+        [
+            # 0.30 + 0.25 + 0.20 = 0.75 > 0.70 → critical
+            pytest.param(True, "increasing", "increasing", "critical", 0.70, id="critical"),
+            # 0.30 + 0.25 = 0.55 > 0.45 → warning
+            pytest.param(True, "increasing", "stable", "warning", 0.45, id="warning"),
+            pytest.param(False, "stable", "stable", "none", 0.0, id="no_trigger"),
+        ],
+    )
+    def test_frustration_level(
+        self, frustration_detector, rewind, rt_trend, idle_trend, level, min_score,
+    ) -> None:
+        """Active signal count maps to critical / warning / none."""
+        result = frustration_detector.detect(
+            rewind_burst=rewind,
+            response_time_trend=rt_trend,
+            idle_trend=idle_trend,
         )
-        # 0.30 + 0.25 + 0.20 = 0.75 > 0.70 → critical
-        assert result.level == "critical"
-        assert result.score >= 0.70
-        assert result.confidence > 0
-
-    def test_frustration_warning(self) -> None:
-        """Two signals → warning level."""
-        detector = FrustrationDetector()
-        result = detector.detect(
-            rewind_burst=True,
-            response_time_trend="increasing",
-            idle_trend="stable",
-        )
-        # 0.30 + 0.25 = 0.55 > 0.45 → warning
-        assert result.level == "warning"
-        assert result.score >= 0.45
-
-    def test_frustration_no_trigger(self) -> None:
-        """No active signals → no frustration."""
-        detector = FrustrationDetector()
-        result = detector.detect(
-            rewind_burst=False,
-            response_time_trend="stable",
-            idle_trend="stable",
-        )
-        assert result.level == "none"
-        assert result.score < 0.25
-
-    def test_frustration_cooldown(self) -> None:
+        assert result.level == level
+        assert result.score >= min_score
+        if level == "critical":
+            assert result.confidence > 0
+        elif level == "none":
+            assert result.score < 0.25
+
+    def test_frustration_cooldown(self, frustration_detector) -> None:
         """Intervention should not fire twice within cooldown period."""
-        detector = FrustrationDetector()
-        result = detector.detect(
+        result = frustration_detector.detect(
             rewind_burst=True,
             response_time_trend="increasing",
             idle_trend="increasing",
@@ -79,18 +67,17 @@ class TestFrustrationDetector:
         assert result.level == "critical"
 
         # First intervention should fire
-        assert detector.should_intervene(result) is True
+        assert frustration_detector.should_intervene(result) is True
         # Second immediate call should be blocked by cooldown
-        assert detector.should_intervene(result) is False
+        assert frustration_detector.should_intervene(result) is False
 
 
 class TestFatigueDetector:
     """Tests for M10 — Fatigue Detector."""
 
-    def test_fatigue_mandatory(self) -> None:
+    def test_fatigue_mandatory(self, fatigue_detector) -> None:
         """High variance + long session → mandatory break."""
-        detector = FatigueDetector()
-        result = detector.detect(
+        result = fatigue_detector.detect(
             interaction_variance=1.2,    # well above 0.65 threshold
             session_duration_minutes=40,  # above 35 min full risk
             idle_frequency=2.0,
@@ -100,10 +87,9 @@ class TestFatigueDetector:
         assert result.break_mandatory is True
         assert result.score > 0.75
 
-    def test_fatigue_fresh_early_session(self) -> None:
+    def test_fatigue_fresh_early_session(self, fatigue_detector) -> None:
         """Early in session with low variance → fresh."""
-        detector = FatigueDetector()
-        result = detector.detect(
+        result = fatigue_detector.detect(
             interaction_variance=0.1,
             session_duration_minutes=5,
             idle_frequency=0.5,
@@ -112,10 +98,9 @@ class TestFatigueDetector:
         assert result.break_mandatory is False
         assert result.break_recommended is False
 
-    def test_fatigue_cooldown(self) -> None:
+    def test_fatigue_cooldown(self, fatigue_detector) -> None:
         """No second mandatory break within 20 minutes."""
-        detector = FatigueDetector()
-        result = detector.detect(
+        result = fatigue_detector.detect(
             interaction_variance=1.5,
             session_duration_minutes=40,
             idle_frequency=3.0,
@@ -123,124 +108,114 @@ class TestFatigueDetector:
         assert result.break_mandatory is True
 
         # First break fires
-        assert detector.should_force_break(result) is True
+        assert fatigue_detector.should_force_break(result) is True
         # Second call within cooldown — blocked
-        assert detector.should_force_break(result) is False
+        assert fatigue_detector.should_force_break(result) is False
 
 
 class TestPseudoUnderstandingDetector:
     """Tests for M14 — Pseudo-Understanding Detector."""
 
-    def test_pseudo_understanding_fast_answer(self) -> None:
+    def test_pseudo_understanding_fast_answer(self, pseudo_understanding_detector) -> None:
         """Very fast correct answer (<3s) is flagged as pseudo-understanding."""
-        detector = PseudoUnderstandingDetector()
-        event = make_question_event(
+        event = make_event_fast(
+            QuestionEvent,
             answer_correct=True,
             response_time_ms=1500,   # <3000ms → suspicious
             confidence_score=2,
         )
-        result = detector.check(event)
+        result = pseudo_understanding_detector.check(event)
         assert result.flag == "flag"
         assert result.authenticity_score < 0.35
-        assert "fast" in result.reason.lower() or "suspicious" in result.reason.lower()
+        reason = result.reason.lower()
+        assert "fast" in reason or "suspicious" in reason
 
-    def test_pseudo_understanding_slow_confident(self) -> None:
+    def test_pseudo_understanding_slow_confident(self, pseudo_understanding_detector) -> None:
         """Slow, confident correct answer is accepted as genuine mastery."""
-        detector = PseudoUnderstandingDetector()
-        event = make_question_event(
+        event = make_event_fast(
+            QuestionEvent,
             answer_correct=True,
             response_time_ms=18000,  # well above 15s → thoughtful
             confidence_score=5,      # very confident
         )
-        result = detector.check(event)
+        result = pseudo_understanding_detector.check(event)
         assert result.flag == "accept"
         assert result.authenticity_score >= 0.60
         assert result.recommended_action == "accept_mastery"
 
-    def test_pseudo_understanding_moderate(self) -> None:
+    def test_pseudo_understanding_moderate(self, pseudo_understanding_detector) -> None:
         """Moderate response time + moderate confidence → flag or probe (graph_consistency=0 in Step 1)."""
-        detector = PseudoUnderstandingDetector()
-        event = make_question_event(
+        event = make_event_fast(
+            QuestionEvent,
             answer_correct=True,
             response_time_ms=10000,
             confidence_score=4,
         )
-        result = detector.check(event)
+        result = pseudo_understanding_detector.check(event)
         assert result.flag in ("probe", "flag", "accept")
 
 
 class TestInsightDetector:
     """Tests for M08 — Insight Detector."""
 
-    def test_insight_detection(self) -> None:
+    def test_insight_detection(self, insight_detector) -> None:
         """Struggle → fast correct answer → insight detected."""
-        detector = InsightDetector()
-        now = time.time()
-
         # Record frustration for 90 seconds
-        for i in range(10):
-            detector.record_frustration(now - 90 + i * 9, 0.6)
+        insight_detector.record_frustration_batch([(NOW + dt, 0.6) for dt in _FRUSTRATION_TIMES])
 
         # Fast correct answer (resolution)
-        event = make_question_event(
+        event = make_event_fast(
+            QuestionEvent,
             answer_correct=True,
             response_time_ms=2500,  # fast
-            timestamp=now * 1000,
+            timestamp=NOW * 1000,
         )
 
-        result = detector.check_insight(event)
+        result = insight_detector.check_insight(event)
         assert result.detected is True
         assert result.confidence > 0
         assert result.window_open_until is not None
         assert result.preceding_struggle_duration_ms > 0
 
-    def test_insight_no_false_positive(self) -> None:
+    def test_insight_no_false_positive(self, insight_detector) -> None:
         """Fast correct answer WITHOUT preceding struggle → not detected."""
-        detector = InsightDetector()
-        now = time.time()
-
         # No frustration history
-        event = make_question_event(
+        event = make_event_fast(
+            QuestionEvent,
             answer_correct=True,
             response_time_ms=2000,
-            timestamp=now * 1000,
+            timestamp=NOW * 1000,
         )
 
-        result = detector.check_insight(event)
+        result = insight_detector.check_insight(event)
         assert result.detected is False
 
-    def test_insight_wrong_answer_no_trigger(self) -> None:
+    def test_insight_wrong_answer_no_trigger(self, insight_detector) -> None:
         """Wrong answer never triggers insight, even after struggle."""
-        detector = InsightDetector()
-        now = time.time()
-
-        for i in range(10):
-            detector.record_frustration(now - 90 + i * 9, 0.6)
+        insight_detector.record_frustration_batch([(NOW + dt, 0.6) for dt in _FRUSTRATION_TIMES])
 
-        event = make_question_event(
+        event = make_event_fast(
+            QuestionEvent,
             answer_correct=False,
             response_time_ms=2000,
-            timestamp=now * 1000,
+            timestamp=NOW * 1000,
         )
 
-        result = detector.check_insight(event)
+        result = insight_detector.check_insight(event)
         assert result.detected is False
 
 
 class TestVariableRewardScheduler:
     """Tests for M20 — Variable Reward Scheduler."""
 
-    def test_variable_reward_unpredictable(self) -> None:
+    def test_variable_reward_unpredictable(self, reward_scheduler) -> None:
         """Reward fires within the 8-12 answer window but not before."""
-        scheduler = VariableRewardScheduler()
-        now = time.time()
-
         rewards_fired = []
         # Record 20 correct answers, track when rewards fire
-        for i in range(20):
-            result = scheduler.record_correct_answer(
+        for i, dt in enumerate(_ANSWER_TIMES):
+            result = reward_scheduler.record_correct_answer(
                 interaction_speed_ratio=1.0,
-                current_time=now + i * 60,  # 1 minute apart (avoids cooldown)
+                current_time=NOW + dt,
             )
             if result.fire_reward:
                 rewards_fired.append(i + 1)
@@ -250,17 +225,14 @@ class TestVariableRewardScheduler:
         # First reward should come between answer 8 and 12
         assert rewards_fired[0] >= 3  # can be earlier with motivation dip, but with ratio 1.0, min is ~8
 
-    def test_reward_cooldown(self) -> None:
+    def test_reward_cooldown(self, reward_scheduler) -> None:
         """Reward doesn't fire twice within cooldown period."""
-        scheduler = VariableRewardScheduler()
-        now = time.time()
-
         # Force a reward
-        scheduler._correct_since_last_reward = 15
-        result1 = scheduler.record_correct_answer(current_time=now)
+        reward_scheduler._correct_since_last_reward = 15
+        result1 = reward_scheduler.record_correct_answer(current_time=NOW)
         assert result1.fire_reward is True
 
         # Immediate second attempt should be blocked (within 5min cooldown)
-        scheduler._correct_since_last_reward = 15
-        result2 = scheduler.record_correct_answer(current_time=now + 10)
+        reward_scheduler._correct_since_last_reward = 15
+        result2 = reward_scheduler.record_correct_answer(current_time=NOW + 10)
         assert result2.fire_reward is False
@@ -6,20 +6,54 @@ import pytest
 
 from neurosync.core.events import NLPResult, TextEvent
 from neurosync.nlp.pipeline import NLPPipeline
+from tests.conftest_nlp import EXPECTED_PHOTOSYNTHESIS_KEYWORDS, MITOCHONDRIAL_COMPLEX
 
 
 class TestNLPPipeline:
     """Tests for the NLPPipeline orchestrator."""
 
-    def test_pipeline_returns_nlp_result(self, nlp_pipeline: NLPPipeline):
-        result = nlp_pipeline.analyze("Photosynthesis converts light to energy.")
+    @pytest.mark.parametrize(
+        "text, kwargs, expected",
+        [
+            pytest.param(
+                "Photosynthesis converts light to energy.",
+                {},
+                {
+                    "sentiment_label": ("positive", "neutral", "negative", "frustrated"),
+                    "complexity_label": ("simple", "moderate", "hard", "very_hard"),
+                },
+                id="returns_nlp_result",
+            ),
+            pytest.param(
+                "Photosynthesis uses light energy in the chloroplasts to create glucose.",
+                {"expected_keywords": list(EXPECTED_PHOTOSYNTHESIS_KEYWORDS)},
+                {"answer_quality": ("moderate", "good", "excellent")},
+                id="with_expected_keywords",
+            ),
+        ],
+    )
+    def test_pipeline_smoke(self, nlp_pipeline: NLPPipeline, text, kwargs, expected):
+        """Non-empty text yields an NLPResult whose labels fall in the expected sets."""
+        result = nlp_pipeline.analyze(text, **kwargs)
         assert isinstance(result, NLPResult)
         assert result.word_count > 0
-        assert result.sentiment_label in ("positive", "neutral", "negative", "frustrated")
-        assert result.complexity_label in ("simple", "moderate", "hard", "very_hard")
+        for field, allowed in expected.items():
+            assert getattr(result, field) in allowed, field
+
+    def test_pipeline_complex_text_full(self, nlp_pipeline: NLPPipeline):
+        """One pass over dense technical text covers every processor's output."""
+        result = nlp_pipeline.analyze(MITOCHONDRIAL_COMPLEX)
+        assert result.complexity_label in ("hard", "very_hard")
+        assert result.complexity_score > 10.0
+        assert result.confusion_label == "none"
+        assert result.word_count > 20
+        assert len(result.keywords) > 0
+        assert not result.topic_drift_detected
 
     def test_pipeline_tracks_text_count(self, nlp_pipeline: NLPPipeline):
+        # The fixture is shared per session; reset() must leave it pristine
         assert nlp_pipeline.text_count == 0
+        assert nlp_pipeline.get_trends() == {"sentiment_trend": 0.0, "confusion_trend": 0.0}
         nlp_pipeline.analyze("First text.")
         nlp_pipeline.analyze("Second text about science.")
         assert nlp_pipeline.text_count == 2
@@ -30,13 +64,6 @@ class TestNLPPipeline:
         assert result.sentiment_label == "neutral"
         assert nlp_pipeline.text_count == 0  # empty doesn't count
 
-    def test_pipeline_with_expected_keywords(self, nlp_pipeline: NLPPipeline):
-        result = nlp_pipeline.analyze(
-            "Photosynthesis uses light energy in the chloroplasts to create glucose.",
-            expected_keywords=["photosynthesis", "light", "energy", "glucose", "chloroplast"],
-        )
-        assert result.answer_quality in ("moderate", "good", "excellent")
-
     def test_pipeline_analyze_event(self, nlp_pipeline: NLPPipeline, text_event: TextEvent):
         result = nlp_pipeline.analyze_event(text_event)
         assert isinstance(result, NLPResult)
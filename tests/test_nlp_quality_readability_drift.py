@@ -2,37 +2,31 @@
 Tests for NLP answer quality, readability, and topic drift (Step 4).
 """
 
-import pytest
-
-from neurosync.nlp.processors.answer_quality import AnswerQualityAssessor
-from neurosync.nlp.processors.readability import ReadabilityAnalyzer
-from neurosync.nlp.processors.topic_drift import TopicDriftDetector
+from tests.conftest_nlp import (
+    EXPECTED_PHOTOSYNTHESIS_KEYWORDS,
+    MITOCHONDRIAL_COMPLEX,
+    PHOTOSYNTHESIS_LONG,
+)
 
 
 class TestAnswerQualityAssessor:
     """Tests for the AnswerQualityAssessor processor."""
 
-    def test_short_answer_low_quality(self):
-        assessor = AnswerQualityAssessor()
-        result = assessor.assess("yes")
+    def test_short_answer_low_quality(self, answer_quality_assessor):
+        result = answer_quality_assessor.assess("yes")
         assert result.quality == "low"
         assert result.score < 0.25
 
-    def test_detailed_answer_good_quality(self):
-        assessor = AnswerQualityAssessor()
-        result = assessor.assess(
-            "Photosynthesis is the process by which plants convert light energy "
-            "from the sun into chemical energy stored in glucose. This occurs in "
-            "the chloroplasts, because the thylakoid membranes contain chlorophyll "
-            "which absorbs light energy.",
-            expected_keywords=["photosynthesis", "light", "energy", "glucose", "chloroplast"],
+    def test_detailed_answer_good_quality(self, answer_quality_assessor):
+        result = answer_quality_assessor.assess(
+            PHOTOSYNTHESIS_LONG,
+            expected_keywords=list(EXPECTED_PHOTOSYNTHESIS_KEYWORDS),
         )
         assert result.quality in ("good", "excellent")
         assert result.score >= 0.50
 
-    def test_empty_answer_low_quality(self):
-        assessor = AnswerQualityAssessor()
-        result = assessor.assess("")
+    def test_empty_answer_low_quality(self, answer_quality_assessor):
+        result = answer_quality_assessor.assess("")
         assert result.quality == "low"
         assert result.score == 0.0
 
@@ -40,57 +34,46 @@ class TestAnswerQualityAssessor:
 class TestReadabilityAnalyzer:
     """Tests for the ReadabilityAnalyzer processor."""
 
-    def test_simple_text_reading_ease(self):
-        analyzer = ReadabilityAnalyzer()
-        result = analyzer.analyze("The cat sat on the mat. The dog ran and played.")
+    def test_simple_text_reading_ease(self, readability_analyzer):
+        result = readability_analyzer.analyze("The cat sat on the mat. The dog ran and played.")
         assert result.flesch_reading_ease > 50.0  # Should be easy
         assert result.appropriate_for_grade <= 8
 
-    def test_complex_text_lower_reading_ease(self):
-        analyzer = ReadabilityAnalyzer()
-        result = analyzer.analyze(
-            "The mitochondrial electron transport chain comprises four enzymatic complexes "
-            "embedded in the inner mitochondrial membrane, facilitating oxidative phosphorylation "
-            "through chemiosmotic coupling of proton gradients."
-        )
+    def test_complex_text_lower_reading_ease(self, readability_analyzer):
+        result = readability_analyzer.analyze(MITOCHONDRIAL_COMPLEX)
         assert result.flesch_kincaid_grade > 8.0
 
-    def test_empty_text_returns_default(self):
-        analyzer = ReadabilityAnalyzer()
-        result = analyzer.analyze("")
+    def test_empty_text_returns_default(self, readability_analyzer):
+        result = readability_analyzer.analyze("")
         assert result.flesch_reading_ease == 0.0
 
 
 class TestTopicDriftDetector:
     """Tests for the TopicDriftDetector processor."""
 
-    def test_on_topic_no_drift(self):
-        detector = TopicDriftDetector()
-        result = detector.check(
+    def test_on_topic_no_drift(self, topic_drift_detector):
+        result = topic_drift_detector.check(
             "Photosynthesis uses light energy to produce glucose.",
             reference_keywords=["photosynthesis", "light", "energy", "glucose"],
         )
         assert not result.drift_detected
         assert result.similarity_score > 0.0
 
-    def test_off_topic_detects_drift(self):
-        detector = TopicDriftDetector()
-        result = detector.check(
+    def test_off_topic_detects_drift(self, topic_drift_detector):
+        result = topic_drift_detector.check(
             "My favorite movie is about space exploration and astronauts.",
             reference_keywords=["photosynthesis", "light", "energy", "glucose"],
         )
         assert result.drift_detected
         assert result.similarity_score < 0.40
 
-    def test_empty_text_no_drift(self):
-        detector = TopicDriftDetector()
-        result = detector.check("")
+    def test_empty_text_no_drift(self, topic_drift_detector):
+        result = topic_drift_detector.check("")
         assert not result.drift_detected
 
-    def test_reset_clears_state(self):
-        detector = TopicDriftDetector()
-        detector.check("Some text about science.")
-        detector.reset()
+    def test_reset_clears_state(self, topic_drift_detector):
+        topic_drift_detector.check("Some text about science.")
+        topic_drift_detector.reset()
         # After reset, no previous texts to compare
-        result = detector.check("New text.")
+        result = topic_drift_detector.check("New text.")
         assert result.similarity_score == 1.0
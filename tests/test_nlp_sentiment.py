@@ -4,45 +4,42 @@ Tests for NLP sentiment analyzer (Step 4).
 
 import pytest
 
-from neurosync.nlp.processors.sentiment import SentimentAnalyzer
-
 
 class TestSentimentAnalyzer:
     """Tests for the SentimentAnalyzer processor."""
 
-    def test_positive_text_returns_positive_label(self):
-        analyzer = SentimentAnalyzer()
-        result = analyzer.analyze("I love this! It's wonderful and amazing!")
-        assert result.label == "positive"
-        assert result.polarity > 0.0
-
-    def test_negative_text_returns_negative_or_frustrated(self):
-        analyzer = SentimentAnalyzer()
-        result = analyzer.analyze("This is terrible and awful. I hate it so much.")
-        assert result.label in ("negative", "frustrated")
-        assert result.polarity < 0.0
-
-    def test_neutral_text_returns_neutral(self):
-        analyzer = SentimentAnalyzer()
-        result = analyzer.analyze("Water is composed of hydrogen and oxygen atoms.")
-        assert result.label == "neutral"
-
-    def test_empty_text_returns_default(self):
-        analyzer = SentimentAnalyzer()
-        result = analyzer.analyze("")
-        assert result.label == "neutral"
-        assert result.polarity == 0.0
-
-    def test_trend_tracking(self):
-        analyzer = SentimentAnalyzer()
+    @pytest.mark.parametrize(
+        "text, labels, polarity_sign",
+        [
+            pytest.param(
+                "I love this! It's wonderful and amazing!",
+                {"positive"}, 1, id="positive",
+            ),
+            pytest.param(
+                "This is terrible and awful. I hate it so much.",
+                {"negative", "frustrated"}, -1, id="negative_or_frustrated",
+            ),
+            # Polarity of factual text is not pinned down, only its label
+            pytest.param(
+                "Water is composed of hydrogen and oxygen atoms.",
+                {"neutral"}, None, id="neutral",
+            ),
+            pytest.param("", {"neutral"}, 0, id="empty_default"),
+        ],
+    )
+    def test_labels(self, sentiment_analyzer, text, labels, polarity_sign):
+        result = sentiment_analyzer.analyze(text)
+        assert result.label in labels
+        if polarity_sign is not None:
+            assert (result.polarity > 0) - (result.polarity < 0) == polarity_sign
+
+    def test_trend_tracking(self, sentiment_analyzer):
         # Feed several negative texts
-        for _ in range(3):
-            analyzer.analyze("This is really bad and terrible.")
-        trend = analyzer.get_trend()
+        sentiment_analyzer.analyze_batch(["This is really bad and terrible."] * 3)
+        trend = sentiment_analyzer.get_trend()
         assert trend < 0.0
 
-    def test_reset_clears_history(self):
-        analyzer = SentimentAnalyzer()
-        analyzer.analyze("Great work!")
-        analyzer.reset()
-        assert analyzer.get_trend() == 0.0
+    def test_reset_clears_history(self, sentiment_analyzer):
+        sentiment_analyzer.analyze("Great work!")
+        sentiment_analyzer.reset()
+        assert sentiment_analyzer.get_trend() == 0.0
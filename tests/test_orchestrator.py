@@ -10,18 +10,22 @@ from neurosync.fusion.orchestrator import NeuroSyncOrchestrator
 from neurosync.fusion.state import BehavioralSignals
 
 
+@pytest.fixture(scope="module")
+def orchestrator() -> NeuroSyncOrchestrator:
+    """One orchestrator shared by the module's tests."""
+    return NeuroSyncOrchestrator(session_id="s", student_id="stu")
+
+
 class TestOrchestrator:
 
-    def test_initialises_all_agents(self):
+    def test_initialises_all_agents(self, orchestrator):
         """Orchestrator creates all 8 agents."""
-        orch = NeuroSyncOrchestrator(session_id="s", student_id="stu")
-        assert len(orch.agents) == 8
+        assert len(orchestrator.agents) == 8
 
     @pytest.mark.asyncio
-    async def test_run_lesson_cycle(self):
+    async def test_run_lesson_cycle(self, orchestrator):
         """run_lesson_cycle returns list, no crashes."""
-        orch = NeuroSyncOrchestrator()
-        result = await orch.run_lesson_cycle(
+        result = await orchestrator.run_lesson_cycle(
             behavioral=BehavioralSignals(),
         )
         assert isinstance(result, list)
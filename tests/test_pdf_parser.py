@@ -7,10 +7,14 @@ All tests use fixtures — no real PDF files needed for most tests.
 
 from __future__ import annotations
 
+import io
+
 import pytest
 
-from neurosync.content.parsers.pdf_parser import PDFDocument, PDFPage, PDFParser
-from neurosync.content.parsers.text_cleaner import CleanedText, TextCleaner
+from neurosync.content.parsers.pdf_parser import PDFDocument, PDFPage
+from neurosync.content.parsers.text_cleaner import CleanedText
+
+_LONG_TEXT = "word " * 1000  # 5000 chars
 
 
 # ── PDFPage tests ───────────────────────────────────────────────────
@@ -53,17 +57,15 @@ class TestPDFDocument:
 
     def test_text_chunks(self):
         """text_chunks() splits long text into overlapping chunks."""
-        long_text = "word " * 1000  # 5000 chars
         doc = PDFDocument(
             filename="test.pdf",
             total_pages=1,
-            pages=[PDFPage(page_number=1, text=long_text)],
+            pages=[PDFPage(page_number=1, text=_LONG_TEXT)],
         )
         chunks = doc.text_chunks(chunk_size=200, overlap=50)
         assert len(chunks) > 1
         # Each chunk should not exceed chunk_size
-        for ch in chunks:
-            assert len(ch) <= 200
+        assert max(map(len, chunks)) <= 200
 
     def test_empty_document(self):
         """Empty document returns empty text and no chunks."""
@@ -78,25 +80,22 @@ class TestPDFDocument:
 class TestTextCleaner:
     """Test text cleaning and normalization."""
 
-    def test_basic_cleaning(self):
+    def test_basic_cleaning(self, text_cleaner):
         """Cleans whitespace and returns sections."""
-        cleaner = TextCleaner()
-        result = cleaner.clean("   Hello   world  \n\n\n\n  Second paragraph  ")
+        result = text_cleaner.clean("   Hello   world  \n\n\n\n  Second paragraph  ")
         assert isinstance(result, CleanedText)
         assert "Hello world" in result.text
         assert len(result.sections) >= 1
 
-    def test_removes_page_numbers(self):
+    def test_removes_page_numbers(self, text_cleaner):
         """Strips standalone page numbers."""
-        cleaner = TextCleaner()
-        result = cleaner.clean("Some content\nPage 1 of 10\nMore content")
+        result = text_cleaner.clean("Some content\nPage 1 of 10\nMore content")
         assert "Page 1 of 10" not in result.text
         assert result.removed_artifacts > 0
 
-    def test_extracts_title(self):
+    def test_extracts_title(self, text_cleaner):
         """Extracts title from first lines."""
-        cleaner = TextCleaner()
-        title = cleaner.extract_title("Introduction to Machine Learning\nThis chapter covers...")
+        title = text_cleaner.extract_title("Introduction to Machine Learning\nThis chapter covers...")
         assert title == "Introduction to Machine Learning"
 
 
@@ -106,16 +105,33 @@ class TestTextCleaner:
 class TestPDFParserErrors:
     """Test parser error conditions."""
 
-    def test_file_not_found(self):
+    def test_file_not_found(self, pdf_parser):
         """Raises FileNotFoundError for missing files."""
-        parser = PDFParser()
         with pytest.raises(FileNotFoundError):
-            parser.parse("/nonexistent/file.pdf")
+            pdf_parser.parse("/nonexistent/file.pdf")
+
+    def test_not_a_pdf(self, pdf_parser):
+        """Raises ValueError for non-PDF content."""
+        with pytest.raises(ValueError, match="Not a PDF"):
+            pdf_parser.parse(io.BytesIO(b"not a pdf"))
+
+    def test_parse_stream(self, pdf_parser):
+        """A binary stream holding a PDF is parsed like an upload."""
+        from PIL import Image
+
+        buf = io.BytesIO()
+        Image.new("RGB", (200, 100), "white").save(buf, format="PDF")
+        buf.seek(0)
+        buf.name = "/uploads/lecture.pdf"
+
+        doc = pdf_parser.parse(buf)
+        assert doc.filename == "lecture.pdf"
+        assert doc.total_pages == 1
+        assert len(doc.pages) == 1
 
-    def test_not_a_pdf(self, tmp_path):
-        """Raises ValueError for non-PDF files."""
+    def test_not_a_pdf_path(self, tmp_path, pdf_parser):
+        """Raises ValueError for files without a .pdf suffix."""
         txt = tmp_path / "test.txt"
         txt.write_text("not a pdf")
-        parser = PDFParser()
         with pytest.raises(ValueError, match="Not a PDF"):
-            parser.parse(txt)
+            pdf_parser.parse(txt)
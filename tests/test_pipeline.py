@@ -8,18 +8,22 @@ story export, and TTS integration — all with mocked APIs.
 from __future__ import annotations
 
 import json
+import re
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from neurosync.content.formats.markdown import MarkdownGenerator, MarkdownOutput
-from neurosync.content.formats.story import StoryExporter, StoryOutput
+from neurosync.content.formats.markdown import MarkdownOutput
+from neurosync.content.formats.story import StoryOutput
 from neurosync.content.generators.story_generator import FullStory, StorySegment
 from neurosync.content.progress_tracker import PipelineStage, ProgressTracker
 from neurosync.content.tts.openai_tts import AudioSegment, OpenAITTS
 
 from tests.conftest_content import _make_tts_response
 
+# Title, section header and first concept, in document order.
+_MD_PATTERN = re.compile(r"# Biology 101.*## Key Concepts.*Photosynthesis", re.S)
+
 
 # ── Progress Tracker tests ──────────────────────────────────────────
 
@@ -48,8 +52,10 @@ class TestProgressTracker:
         tracker.start_pipeline()
         assert tracker.progress.overall_progress_pct == 0.0
 
-        tracker.start_stage(PipelineStage.PARSING)
-        tracker.complete_stage(PipelineStage.PARSING)
+        tracker.batch_transitions([
+            ("start_stage", PipelineStage.PARSING),
+            ("complete_stage", PipelineStage.PARSING),
+        ])
         assert tracker.progress.overall_progress_pct > 0.0
 
     def test_failure_tracking(self):
@@ -70,6 +76,21 @@ class TestProgressTracker:
         tracker.start_stage(PipelineStage.PARSING)
         assert len(calls) >= 2  # start_pipeline + start_stage
 
+    def test_batch_transitions_notify_once(self):
+        """A batch of transitions fires the callback a single time."""
+        calls = []
+        tracker = ProgressTracker(callback=lambda p: calls.append(p))
+        tracker.batch_transitions([
+            ("start_pipeline",),
+            ("start_stage", PipelineStage.PARSING, "Reading PDF"),
+            ("complete_stage", PipelineStage.PARSING, "Done"),
+        ])
+        assert len(calls) == 1
+        assert tracker.progress.stages[PipelineStage.PARSING.value].status == "completed"
+
+        with pytest.raises(ValueError, match="Unknown tracker transition"):
+            tracker.batch_transitions([("reset",)])
+
 
 # ── Markdown Export tests ───────────────────────────────────────────
 
@@ -77,27 +98,24 @@ class TestProgressTracker:
 class TestMarkdownGenerator:
     """Test Markdown notes generation."""
 
-    def test_generates_markdown(self, sample_concepts):
+    def test_generates_markdown(self, sample_concepts, markdown_generator):
         """Produces valid Markdown from concepts."""
-        gen = MarkdownGenerator()
-        md = gen.generate(
+        md = markdown_generator.generate(
             sample_concepts,
             title="Biology 101",
             summary="Energy in cells",
             objectives=["Understand photosynthesis"],
         )
-        assert "# Biology 101" in md
-        assert "## Key Concepts" in md
-        assert "Photosynthesis" in md
+        assert _MD_PATTERN.search(md)
 
-    def test_export_file(self, sample_concepts, tmp_path):
+    def test_export_file(self, sample_concepts, export_dir, markdown_generator):
         """Exports Markdown to file and returns descriptor."""
-        gen = MarkdownGenerator()
-        content = gen.generate(sample_concepts, "Test")
-        output = gen.export(content, tmp_path / "notes.md")
+        content = markdown_generator.generate(sample_concepts, "Test")
+        output = markdown_generator.export(content, export_dir / "notes.md")
         assert isinstance(output, MarkdownOutput)
         assert output.word_count > 0
-        assert (tmp_path / "notes.md").exists()
+        assert output.content == content
+        assert output.exists()
 
 
 # ── Story Export tests ──────────────────────────────────────────────
@@ -106,7 +124,7 @@ class TestMarkdownGenerator:
 class TestStoryExporter:
     """Test story Markdown export."""
 
-    def test_export_story(self, tmp_path):
+    def test_export_story(self, export_dir, story_exporter):
         """Exports FullStory to Markdown file."""
         story = FullStory(
             title="Test Story",
@@ -121,13 +139,11 @@ class TestStoryExporter:
             ],
             conclusion="The end.",
         )
-        exporter = StoryExporter()
-        output = exporter.export(story, tmp_path / "story.md")
+        output = story_exporter.export(story, export_dir / "story.md")
         assert isinstance(output, StoryOutput)
         assert output.segment_count == 1
-        assert (tmp_path / "story.md").exists()
-        content = (tmp_path / "story.md").read_text()
-        assert "Test Story" in content
+        assert output.exists()
+        assert "Test Story" in output.content
 
 
 # ── TTS tests ──────────────────────────────────────────────────────
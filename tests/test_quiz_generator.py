@@ -11,7 +11,7 @@ import json
 import pytest
 
 from neurosync.content.generators.quiz_generator import QuizBank, QuizGenerator, QuizQuestion
-from neurosync.content.formats.quiz import QuizExporter, QuizOutput
+from neurosync.content.formats.quiz import QuizOutput
 
 
 class TestQuizGenerator:
@@ -48,13 +48,13 @@ class TestQuizExporter:
     """Test quiz JSON export."""
 
     @pytest.mark.asyncio
-    async def test_export_json(self, quiz_generator, sample_concepts, tmp_path):
+    async def test_export_json(self, quiz_generator, sample_concepts, export_dir, quiz_exporter):
         """Exports quiz bank to JSON file."""
         bank = await quiz_generator.generate_quiz(sample_concepts, "Bio")
-        exporter = QuizExporter()
-        output = exporter.export(bank, tmp_path / "quiz.json")
+        output = quiz_exporter.export(bank, export_dir / "quiz.json")
         assert isinstance(output, QuizOutput)
         assert output.question_count > 0
-        # Verify file content
-        data = json.loads((tmp_path / "quiz.json").read_text())
+        assert output.exists()
+        # Verify written content
+        data = json.loads(output.content)
         assert "questions" in data
@@ -3,17 +3,17 @@ NeuroSync AI — Tests for signal processors.
 
 Tests:
   1. test_response_time_fast_answer_rate — fast answers correctly computed
-  2. test_response_time_trend_increasing — increasing trend detected
+  2. test_response_time_trend[trend_increasing] — increasing trend detected
   3. test_rewind_burst_detection — 3 rewinds in 60s triggers burst
   4. test_idle_frequency_increasing — idle trend correctly detected
-  5. test_interaction_variance_erratic — high variance = erratic
-  6. test_interaction_variance_stable — low variance = stable
+  5. test_interaction_variance[erratic] — high variance = erratic
+  6. test_interaction_variance[stable] — low variance = stable
 """
 
-import time
-
+import numpy as np
 import pytest
 
+from neurosync.behavioral import signals
 from neurosync.behavioral.signals import (
     IdleSignal,
     InteractionVarianceSignal,
@@ -21,53 +21,71 @@ from neurosync.behavioral.signals import (
     RewindSignal,
     ScrollBehaviorSignal,
 )
-from tests.conftest import make_idle_event, make_question_event, make_raw_event, make_video_event
+from neurosync.core.events import IdleEvent, QuestionEvent, VideoEvent
+from tests.conftest import (
+    NOW_MS,
+    make_event_fast,
+    make_idle_events,
+    make_timestamp_events,
+)
+from tests.conftest_graph import FakeClock
 
 
-class TestResponseTimeSignal:
-    """Tests for the ResponseTimeSignal processor."""
+@pytest.fixture(autouse=True)
+def _frozen_signal_clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Pin the processors' wall clock to ``NOW_MS`` so windows line up with test timestamps."""
+    clock = FakeClock(NOW_MS / 1000)
+    monkeypatch.setattr(signals, "time", clock)
+    return clock
 
-    def test_response_time_fast_answer_rate(self) -> None:
-        """Fast answers (<3000ms) are correctly detected and rate computed."""
-        processor = ResponseTimeSignal()
 
-        # Create 10 questions: 7 fast (<3000ms), 3 normal
-        events = []
-        for i in range(7):
-            events.append(make_question_event(response_time_ms=1500 + i * 100))
-        for i in range(3):
-            events.append(make_question_event(response_time_ms=8000 + i * 1000))
+def _ramps(*spec: tuple[int, float, float]) -> np.ndarray:
+    """Concatenate ``(count, base_ms, step_ms)`` linear ramps into one array."""
+    return np.concatenate([base + np.arange(count) * step for count, base, step in spec])
 
-        result = processor.process(events)
 
-        # 7 out of 10 answers are fast
-        assert result.fast_answer_rate == pytest.approx(0.7, abs=0.01)
-        assert result.mean_response_time_ms > 0
+# Response times (ms) per case, in arrival order.
+_RESPONSE_TIME_CASES: dict[str, np.ndarray] = {
+    # 7 fast (<3000ms), then 3 normal
+    "fast_rate": _ramps((7, 1500, 100), (3, 8000, 1000)),
+    # Earlier answers are fast, recent answers are slow
+    "increasing": _ramps((7, 3000, 100), (3, 12000, 2000)),
+    # Consistent response times
+    "stable": 7000 + (np.arange(10) % 3) * 200,
+}
 
-    def test_response_time_trend_increasing(self) -> None:
-        """Increasing response times are detected as increasing trend."""
-        processor = ResponseTimeSignal()
 
-        # Earlier answers are fast, recent answers are slow
-        events = []
-        for i in range(7):
-            events.append(make_question_event(response_time_ms=3000 + i * 100))
-        for i in range(3):
-            events.append(make_question_event(response_time_ms=12000 + i * 2000))
+@pytest.fixture
+def response_time_events(request: pytest.FixtureRequest) -> list:
+    """Question events for the ``_RESPONSE_TIME_CASES`` entry named by the param."""
+    return [
+        make_event_fast(QuestionEvent, response_time_ms=ms)
+        for ms in _RESPONSE_TIME_CASES[request.param].tolist()
+    ]
 
-        result = processor.process(events)
-        assert result.response_time_trend == "increasing"
 
-    def test_response_time_trend_stable(self) -> None:
-        """Consistent response times show stable trend."""
-        processor = ResponseTimeSignal()
+class TestResponseTimeSignal:
+    """Tests for the ResponseTimeSignal processor."""
 
-        events = []
-        for i in range(10):
-            events.append(make_question_event(response_time_ms=7000 + (i % 3) * 200))
+    @pytest.mark.parametrize("response_time_events", ["fast_rate"], indirect=True)
+    def test_response_time_fast_answer_rate(self, response_time_events) -> None:
+        """Fast answers (<3000ms) are counted: 7 out of 10 here."""
+        result = ResponseTimeSignal().process(response_time_events)
+        assert result.fast_answer_rate == pytest.approx(0.7, abs=0.01)
+        assert result.mean_response_time_ms > 0
 
-        result = processor.process(events)
-        assert result.response_time_trend == "stable"
+    @pytest.mark.parametrize(
+        "response_time_events, expected_trend",
+        [
+            pytest.param("increasing", "increasing", id="trend_increasing"),
+            pytest.param("stable", "stable", id="trend_stable"),
+        ],
+        indirect=["response_time_events"],
+    )
+    def test_response_time_trend(self, response_time_events, expected_trend) -> None:
+        """The response-time trend follows the recent answers."""
+        result = ResponseTimeSignal().process(response_time_events)
+        assert result.response_time_trend == expected_trend
 
 
 class TestRewindSignal:
@@ -76,13 +94,13 @@ class TestRewindSignal:
     def test_rewind_burst_detection(self) -> None:
         """3 rewinds within 60 seconds triggers burst detection."""
         processor = RewindSignal()
-        now = time.time() * 1000
+        now = NOW_MS
 
         # 3 rewinds within 30 seconds
         events = [
-            make_video_event(timestamp=now, playback_position_ms=60000),
-            make_video_event(timestamp=now + 10000, playback_position_ms=60000),
-            make_video_event(timestamp=now + 20000, playback_position_ms=60000),
+            make_event_fast(VideoEvent, timestamp=now, playback_position_ms=60000),
+            make_event_fast(VideoEvent, timestamp=now + 10000, playback_position_ms=60000),
+            make_event_fast(VideoEvent, timestamp=now + 20000, playback_position_ms=60000),
         ]
 
         result = processor.process(events)
@@ -92,11 +110,11 @@ class TestRewindSignal:
     def test_no_burst_with_spread_rewinds(self) -> None:
         """Rewinds spread over time (>60s apart) do not trigger burst."""
         processor = RewindSignal()
-        now = time.time() * 1000
+        now = NOW_MS
 
         events = [
-            make_video_event(timestamp=now, playback_position_ms=60000),
-            make_video_event(timestamp=now + 120000, playback_position_ms=120000),
+            make_event_fast(VideoEvent, timestamp=now, playback_position_ms=60000),
+            make_event_fast(VideoEvent, timestamp=now + 120000, playback_position_ms=120000),
         ]
 
         result = processor.process(events)
@@ -109,15 +127,10 @@ class TestIdleSignal:
     def test_idle_frequency_increasing(self) -> None:
         """Increasing idle frequency is detected when recent idles are more frequent."""
         processor = IdleSignal()
-        now = time.time() * 1000
+        now = NOW_MS
 
-        # Many recent idles (last 2 minutes)
-        events = []
-        for i in range(8):
-            events.append(make_idle_event(
-                timestamp=now - 30000 + i * 3000,  # 8 idles in last 30s
-                idle_duration_ms=2000,
-            ))
+        # Many recent idles (last 2 minutes): 8 idles in last 30s
+        events = make_idle_events(now - 30000 + np.arange(8) * 3000, idle_duration_ms=2000)
 
         result = processor.process(events)
         assert result.idle_frequency > 0
@@ -126,12 +139,12 @@ class TestIdleSignal:
     def test_idle_total_time_computed(self) -> None:
         """Total idle time is correctly summed."""
         processor = IdleSignal()
-        now = time.time() * 1000
+        now = NOW_MS
 
         events = [
-            make_idle_event(timestamp=now - 5000, idle_duration_ms=1000),
-            make_idle_event(timestamp=now - 3000, idle_duration_ms=2000),
-            make_idle_event(timestamp=now - 1000, idle_duration_ms=3000),
+            make_event_fast(IdleEvent, timestamp=now - 5000, idle_duration_ms=1000),
+            make_event_fast(IdleEvent, timestamp=now - 3000, idle_duration_ms=2000),
+            make_event_fast(IdleEvent, timestamp=now - 1000, idle_duration_ms=3000),
         ]
 
         result = processor.process(events)
@@ -142,35 +155,22 @@ class TestIdleSignal:
 class TestInteractionVarianceSignal:
     """Tests for the InteractionVarianceSignal processor."""
 
-    def test_interaction_variance_erratic(self) -> None:
-        """Highly variable inter-event times produce erratic classification."""
-        processor = InteractionVarianceSignal()
-        now = time.time() * 1000
-
-        # Erratic: alternating fast and very slow intervals
-        events = []
-        t = now
-        for i in range(20):
-            if i % 2 == 0:
-                t += 200   # very fast
-            else:
-                t += 15000  # very slow
-            events.append(make_raw_event(timestamp=t))
-
-        result = processor.process(events)
-        assert result.variance_trend in ("increasing", "erratic")
-        assert result.fatigue_probability > 0.3
-
-    def test_interaction_variance_stable(self) -> None:
-        """Consistent inter-event times produce stable classification."""
-        processor = InteractionVarianceSignal()
-        now = time.time() * 1000
-
-        # Stable: consistent 2-second intervals
-        events = []
-        for i in range(20):
-            events.append(make_raw_event(timestamp=now + i * 2000))
-
-        result = processor.process(events)
-        assert result.variance_trend == "stable"
-        assert result.fatigue_probability < 0.5
+    @pytest.mark.parametrize(
+        "offsets_ms, expected_trend, expected_fatigue",
+        [
+            # Alternating very fast (200 ms) and very slow (15 s) intervals
+            pytest.param(
+                np.cumsum(np.tile([200, 15000], 10)), "increasing", 0.798, id="erratic",
+            ),
+            # Consistent 2-second intervals
+            pytest.param(np.arange(20) * 2000, "stable", 0.037, id="stable"),
+        ],
+    )
+    def test_interaction_variance(
+        self, offsets_ms, expected_trend, expected_fatigue,
+    ) -> None:
+        """Inter-event time variability maps to a variance trend and fatigue probability."""
+        now = NOW_MS
+        result = InteractionVarianceSignal().process(make_timestamp_events(now + offsets_ms))
+        assert result.variance_trend == expected_trend
+        assert result.fatigue_probability == pytest.approx(expected_fatigue, abs=1e-3)
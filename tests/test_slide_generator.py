@@ -6,18 +6,37 @@ Tests slide deck creation and PPTX export.
 
 from __future__ import annotations
 
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
 import pytest
 
-from neurosync.content.generators.slide_generator import SlideContent, SlideDeck, SlideGenerator
+from neurosync.content.generators.slide_generator import SlideContent, SlideDeck
+
+
+def _stub_save(target) -> None:
+    """Stand-in for ``Presentation.save``: write 4 bytes to a path or buffer."""
+    if isinstance(target, (str, Path)):
+        Path(target).write_bytes(b"PPTX")
+    else:
+        target.write(b"PPTX")
+
+
+@pytest.fixture
+def stub_presentation():
+    """Patch python-pptx's Presentation so export tests skip real serialisation."""
+    prs = MagicMock()
+    prs.save.side_effect = _stub_save
+    with patch("pptx.Presentation", return_value=prs):
+        yield prs
 
 
 class TestSlideGenerator:
     """Test slide generation from concepts."""
 
-    def test_generates_slides(self, sample_concepts):
+    def test_generates_slides(self, sample_concepts, slide_generator):
         """Creates slides from concept list."""
-        gen = SlideGenerator()
-        deck = gen.generate(
+        deck = slide_generator.generate(
             sample_concepts,
             title="Biology 101",
             summary="Energy in cells",
@@ -27,26 +46,31 @@ class TestSlideGenerator:
         assert deck.slide_count >= 4  # title + objectives + 2 concepts + summary
         assert deck.title == "Biology 101"
 
-    def test_empty_concepts(self):
+    def test_empty_concepts(self, slide_generator):
         """Generates minimal deck with no concepts."""
-        gen = SlideGenerator()
-        deck = gen.generate([], title="Empty Course")
+        deck = slide_generator.generate([], title="Empty Course")
         # At least title + summary slides
         assert deck.slide_count >= 2
 
-    def test_export_pptx(self, sample_concepts, tmp_path):
-        """Exports valid PPTX file to disk."""
-        gen = SlideGenerator()
-        deck = gen.generate(sample_concepts, title="Test Export")
-        path = gen.export_pptx(deck, tmp_path / "test.pptx")
+    def test_export_pptx(self, sample_concepts, tmp_path, slide_generator, stub_presentation):
+        """Exports the deck to a PPTX file on disk."""
+        deck = slide_generator.generate(sample_concepts, title="Test Export")
+        path = slide_generator.export_pptx(deck, tmp_path / "test.pptx")
         assert path.exists()
         assert path.suffix == ".pptx"
         assert path.stat().st_size > 0
+        stub_presentation.save.assert_called_once()
 
-    def test_export_pptx_bytes(self, sample_concepts):
+    def test_export_pptx_bytes(self, sample_concepts, slide_generator, stub_presentation):
         """Exports PPTX to bytes buffer."""
-        gen = SlideGenerator()
-        deck = gen.generate(sample_concepts, title="Byte Export")
-        data = gen.export_pptx_bytes(deck)
+        deck = slide_generator.generate(sample_concepts, title="Byte Export")
+        data = slide_generator.export_pptx_bytes(deck)
         assert isinstance(data, bytes)
         assert len(data) > 0
+
+    @pytest.mark.slow
+    def test_export_pptx_real(self, sample_concepts, tmp_path, slide_generator):
+        """Real python-pptx export produces a ZIP-based PPTX file."""
+        deck = slide_generator.generate(sample_concepts, title="Test Export")
+        path = slide_generator.export_pptx(deck, tmp_path / "test.pptx")
+        assert path.read_bytes()[:2] == b"PK"
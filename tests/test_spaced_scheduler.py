@@ -9,6 +9,7 @@ import time
 import pytest
 
 from neurosync.database.manager import DatabaseManager
+from neurosync.spaced_repetition.quiz.difficulty_adapter import DifficultyAdapter
 from neurosync.spaced_repetition.scheduler import SpacedRepetitionScheduler
 
 
@@ -51,13 +52,13 @@ class TestScheduler:
         concepts = [d.concept_id for d in due]
         assert "mitosis" in concepts
 
-    def test_review_difficulty_adapts_by_number(self, scheduler: SpacedRepetitionScheduler):
+    @pytest.mark.parametrize(
+        "review_number, expected",
+        [(1, "easy"), (2, "medium"), (3, "hard")],
+    )
+    def test_review_difficulty_adapts_by_number(self, review_number: int, expected: str):
         """Quiz difficulty should escalate with review number."""
-        from neurosync.spaced_repetition.quiz.difficulty_adapter import DifficultyAdapter
-        da = DifficultyAdapter()
-        assert da.determine_difficulty(1) == "easy"
-        assert da.determine_difficulty(2) == "medium"
-        assert da.determine_difficulty(3) == "hard"
+        assert DifficultyAdapter().determine_difficulty(review_number) == expected
 
     def test_multiple_concepts_tracked_independently(self, scheduler: SpacedRepetitionScheduler, sr_db: DatabaseManager):
         """Two concepts get separate mastery rows."""
@@ -4,6 +4,7 @@ Step 5 — FusionGraph (state machine) tests (4 tests).
 
 from __future__ import annotations
 
+import gc
 import time
 
 import pytest
@@ -26,6 +27,10 @@ from neurosync.fusion.state import (
 )
 
 
+# Full-graph runs timed for the latency budget; the slowest must fit.
+_TIMING_RUNS = 20
+
+
 def _all_agents():
     return [
         AttentionAgent(), OverloadAgent(), GapAgent(),
@@ -50,33 +55,48 @@ def _multi_trigger_state() -> FusionState:
     )
 
 
+@pytest.fixture
+def fusion_graph() -> FusionGraph:
+    """Fresh graph per test, so agent cooldowns never leak between tests."""
+    return FusionGraph(_all_agents())
+
+
 class TestFusionGraph:
 
     @pytest.mark.asyncio
-    async def test_executes_all_agents(self):
+    async def test_executes_all_agents(self, fusion_graph: FusionGraph):
         """All 8 agents run."""
-        graph = FusionGraph(_all_agents())
         state = _multi_trigger_state()
-        result = await graph.execute(state)
+        result = await fusion_graph.execute(state)
         assert len(result.agent_states) == 8
 
     @pytest.mark.asyncio
-    async def test_aggregates_all_outputs(self):
+    async def test_aggregates_all_outputs(self, fusion_graph: FusionGraph):
         """Multi-trigger state → proposals from many agents."""
-        graph = FusionGraph(_all_agents())
-        result = await graph.execute(_multi_trigger_state())
+        result = await fusion_graph.execute(_multi_trigger_state())
         # Expect at least some proposals
         assert len(result.proposed_interventions) >= 3
 
     @pytest.mark.asyncio
     async def test_completes_in_under_100ms(self):
-        """Performance: full graph < 100 ms."""
-        graph = FusionGraph(_all_agents())
-        state = _multi_trigger_state()
-        start = time.perf_counter()
-        await graph.execute(state)
-        elapsed_ms = (time.perf_counter() - start) * 1000
-        assert elapsed_ms < 100, f"Graph took {elapsed_ms:.1f} ms"
+        """Performance: slowest of repeated full-graph runs < 100 ms."""
+        samples_ns: list[int] = []
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(_TIMING_RUNS):
+                # Fresh graph and state each run, so cooldowns never
+                # short-circuit the agents being timed.
+                graph = FusionGraph(_all_agents())
+                state = _multi_trigger_state()
+                start = time.perf_counter_ns()
+                result = await graph.execute(state)
+                samples_ns.append(time.perf_counter_ns() - start)
+                assert len(result.proposed_interventions) >= 3
+        finally:
+            gc.enable()
+        slowest_ms = max(samples_ns) / 1e6
+        assert slowest_ms < 100, f"Slowest graph run took {slowest_ms:.1f} ms"
 
     @pytest.mark.asyncio
     async def test_handles_agent_error_gracefully(self, normal_state: FusionState):
@@ -16,10 +16,9 @@ from neurosync.content.generators.video_assembler import AssembledVideo, VideoAs
 class TestVideoAssembler:
     """Test video assembly logic."""
 
-    def test_create_segments(self):
+    def test_create_segments(self, video_assembler):
         """Creates segments from slide titles."""
-        asm = VideoAssembler()
-        segments = asm.create_segments(
+        segments = video_assembler.create_segments(
             slide_titles=["Intro", "Concept 1", "Concept 2", "Summary"],
             durations=[5.0, 8.0, 8.0, 5.0],
         )
@@ -34,17 +33,15 @@ class TestVideoAssembler:
         assert len(segments) == 2
         assert segments[0].duration_seconds == 10.0
 
-    def test_estimate_duration(self):
+    def test_estimate_duration(self, video_assembler):
         """Calculates total duration from segments."""
-        asm = VideoAssembler()
         segments = [
             VideoSegment(slide_title="A", duration_seconds=5.0),
             VideoSegment(slide_title="B", duration_seconds=10.0),
         ]
-        assert asm.estimate_duration(segments) == 15.0
+        assert video_assembler.estimate_duration(segments) == 15.0
 
-    def test_assemble_empty_raises(self):
+    def test_assemble_empty_raises(self, video_assembler):
         """Empty segments raise ValueError."""
-        asm = VideoAssembler()
         with pytest.raises(ValueError, match="No segments"):
-            asm.assemble([], "output.mp4")
+            video_assembler.assemble([], "output.mp4")
@@ -7,21 +7,37 @@ Covers method detection, Pillow fallback rendering, LibreOffice pipeline
 
 from __future__ import annotations
 
+import asyncio
 import os
 import shutil
-import textwrap
 from pathlib import Path
-from unittest.mock import MagicMock, patch, PropertyMock
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch, PropertyMock
 
 import pytest
 
 from neurosync.content.generators.video_assembler import (
-    AssembledVideo,
     VideoAssembler,
-    VideoSegment,
+    _detect_best_method_cached,
+    _slide_texts,
 )
 
 
+_VA = "neurosync.content.generators.video_assembler"
+
+
+def _fake_pdftoppm(pages: int) -> Any:
+    """``subprocess.run`` stand-in that writes *pages* PNGs like pdftoppm."""
+
+    def run(cmd: list[str], **_kw: Any) -> MagicMock:
+        prefix = cmd[-1]
+        for i in range(1, pages + 1):
+            Path(f"{prefix}-{i}.png").write_bytes(b"PNG")
+        return MagicMock(returncode=0, stderr=b"")
+
+    return run
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -37,19 +53,24 @@ def assembler(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> VideoAssembler
     return asm
 
 
-@pytest.fixture()
-def sample_pptx(tmp_path: Path) -> Path:
-    """Create a minimal 3-slide PPTX for testing."""
+@pytest.fixture(scope="session")
+def sample_presentation() -> Any:
+    """Minimal 3-slide python-pptx Presentation, built once per session."""
     from pptx import Presentation
-    from pptx.util import Inches
 
     prs = Presentation()
     for idx in range(1, 4):
         slide = prs.slides.add_slide(prs.slide_layouts[1])  # title + content
         slide.shapes.title.text = f"Slide {idx} Title"
         slide.placeholders[1].text = f"Body text for slide {idx}.\nSecond line."
-    path = tmp_path / "sample.pptx"
-    prs.save(str(path))
+    return prs
+
+
+@pytest.fixture(scope="session")
+def sample_pptx(sample_presentation: Any, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """``sample_presentation`` saved once per session (tests only read it)."""
+    path = tmp_path_factory.mktemp("pptx") / "sample.pptx"
+    sample_presentation.save(str(path))
     return path
 
 
@@ -60,8 +81,21 @@ def sample_pptx(tmp_path: Path) -> Path:
 class TestDetectMethod:
     """Tests for _detect_best_method()."""
 
-    def test_detects_libreoffice_when_both_present(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Returns 'libreoffice' when soffice AND pdftoppm are available."""
+    @pytest.mark.parametrize(
+        "soffice, pdftoppm, expected",
+        [
+            pytest.param("/usr/bin/soffice", "/usr/bin/pdftoppm", "libreoffice", id="both_present"),
+            pytest.param(None, "/usr/bin/pdftoppm", "pillow", id="soffice_missing"),
+            pytest.param("/usr/bin/soffice", None, "pillow", id="pdftoppm_missing"),
+            pytest.param(None, None, "pillow", id="nothing_available"),
+        ],
+    )
+    def test_detect(self, soffice, pdftoppm, expected) -> None:
+        """'libreoffice' only when soffice AND pdftoppm are available."""
+        assert _detect_best_method_cached(soffice, pdftoppm) == expected
+
+    def test_assembler_uses_host_tools(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """VideoAssembler feeds shutil.which results into detection."""
         monkeypatch.setattr(
             shutil, "which",
             lambda cmd: f"/usr/bin/{cmd}" if cmd in ("soffice", "pdftoppm") else None,
@@ -69,30 +103,6 @@ class TestDetectMethod:
         asm = VideoAssembler()
         assert asm.method == "libreoffice"
 
-    def test_detects_pillow_when_soffice_missing(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Falls back to 'pillow' when soffice is absent."""
-        monkeypatch.setattr(
-            shutil, "which",
-            lambda cmd: "/usr/bin/pdftoppm" if cmd == "pdftoppm" else None,
-        )
-        asm = VideoAssembler()
-        assert asm.method == "pillow"
-
-    def test_detects_pillow_when_pdftoppm_missing(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Falls back to 'pillow' when pdftoppm is absent."""
-        monkeypatch.setattr(
-            shutil, "which",
-            lambda cmd: "/usr/bin/soffice" if cmd == "soffice" else None,
-        )
-        asm = VideoAssembler()
-        assert asm.method == "pillow"
-
-    def test_detects_pillow_when_nothing_available(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Falls back to 'pillow' when neither tool is installed."""
-        monkeypatch.setattr(shutil, "which", lambda _cmd: None)
-        asm = VideoAssembler()
-        assert asm.method == "pillow"
-
 
 # ---------------------------------------------------------------------------
 # Pillow rendering
@@ -113,29 +123,66 @@ class TestPillowRendering:
         """Each PNG matches the assembler's configured resolution."""
         from PIL import Image
 
-        images = assembler._pptx_to_images_pillow(sample_pptx)
+        images = assembler._pptx_to_images_pillow(sample_pptx, max_slides=1)
+        assert len(images) == 1
         for img_path in images:
             with Image.open(img_path) as im:
                 assert im.size == assembler.resolution
 
+    def test_parallel_matches_serial(
+        self, assembler: VideoAssembler, sample_pptx: Path, tmp_path: Path,
+    ) -> None:
+        """Threaded rendering yields the same PNGs, in order, as serial rendering."""
+        assembler.max_workers = 3
+        parallel = [p.read_bytes() for p in assembler._pptx_to_images_pillow(sample_pptx)]
+
+        assembler.max_workers = 1
+        assembler.temp_dir = tmp_path / "serial"
+        assembler.temp_dir.mkdir()
+        serial = [p.read_bytes() for p in assembler._pptx_to_images_pillow(sample_pptx)]
+        assert parallel == serial
+
     def test_images_not_blank(self, assembler: VideoAssembler, sample_pptx: Path) -> None:
         """PNGs contain rendered text and are larger than a blank image."""
-        images = assembler._pptx_to_images_pillow(sample_pptx)
+        images = assembler._pptx_to_images_pillow(sample_pptx, max_slides=1)
         for img_path in images:
             # A blank 1920×1080 solid-colour PNG is ~5 KB; with text it
             # should be noticeably larger or at least not all one colour.
             assert img_path.stat().st_size > 1_000
 
-    def test_extract_slide_text(self, assembler: VideoAssembler, sample_pptx: Path) -> None:
+    def test_extract_slide_text(self, assembler: VideoAssembler, sample_presentation: Any) -> None:
         """Title and body text are extracted from slide shapes."""
-        from pptx import Presentation
-
-        prs = Presentation(str(sample_pptx))
-        slide = prs.slides[0]
+        slide = sample_presentation.slides[0]
         title, body = assembler._extract_slide_text(slide)
         assert "Slide 1 Title" in title
         assert "Body text" in body
 
+    def test_extract_slide_text_skips_unsupported_shapes(self, assembler: VideoAssembler) -> None:
+        """Shapes python-pptx cannot parse are skipped, not fatal."""
+        exotic = MagicMock()
+        type(exotic).has_text_frame = PropertyMock(
+            side_effect=NotImplementedError("Shape instance of unrecognized shape type"),
+        )
+        title = MagicMock(has_text_frame=True)
+        title.text_frame.text = "Kept Title"
+        slide = MagicMock(shapes=[exotic, title])
+
+        assert assembler._extract_slide_text(slide) == ("Kept Title", "")
+
+    def test_slide_texts_reparsed_only_when_deck_changes(
+        self, sample_pptx: Path, tmp_path: Path,
+    ) -> None:
+        """Slide text is parsed once per file version, keyed on mtime/size."""
+        deck = tmp_path / "deck.pptx"
+        shutil.copy(sample_pptx, deck)
+        first = _slide_texts(deck)
+        assert _slide_texts(deck) is first
+        assert first[0][0] == "Slide 1 Title"
+
+        stat = deck.stat()
+        os.utime(deck, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert _slide_texts(deck) is not first
+
     def test_render_text_image_returns_pil_image(self, assembler: VideoAssembler) -> None:
         """_render_text_image returns a Pillow Image object."""
         from PIL import Image
@@ -144,6 +191,10 @@ class TestPillowRendering:
         assert isinstance(img, Image.Image)
         assert img.size == assembler.resolution
 
+    def test_get_font_is_cached(self) -> None:
+        """Fonts are loaded once per size and reused across slides."""
+        assert VideoAssembler._get_font(48) is VideoAssembler._get_font(48)
+
 
 # ---------------------------------------------------------------------------
 # LibreOffice pipeline (mocked subprocess)
@@ -157,7 +208,7 @@ class TestLibreOfficePipeline:
         expected_pdf = assembler.temp_dir / "sample.pdf"
         expected_pdf.write_bytes(b"%PDF-1.4 fake")
 
-        with patch("subprocess.run") as mock_run:
+        with patch(f"{_VA}._load_uno", return_value=None), patch("subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=0, stderr="")
             result = assembler._convert_pptx_to_pdf(sample_pptx)
 
@@ -170,34 +221,246 @@ class TestLibreOfficePipeline:
         self, assembler: VideoAssembler, sample_pptx: Path,
     ) -> None:
         """RuntimeError when soffice returns non-zero."""
-        with patch("subprocess.run") as mock_run:
+        with patch(f"{_VA}._load_uno", return_value=None), patch("subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=1, stderr="error")
             with pytest.raises(RuntimeError, match="soffice failed"):
                 assembler._convert_pptx_to_pdf(sample_pptx)
 
+    def test_convert_pptx_to_pdf_uno(self, assembler: VideoAssembler, sample_pptx: Path) -> None:
+        """With the UNO bridge available, conversion goes through the daemon's Desktop."""
+        desktop = MagicMock()
+        doc = desktop.loadComponentFromURL.return_value
+        sink = MagicMock()
+        sink.getvalue.return_value = b"%PDF-1.4 fake"
+
+        with patch(f"{_VA}._load_uno", return_value=MagicMock()), \
+                patch(f"{_VA}._make_output_sink", return_value=sink), \
+                patch.object(assembler, "_ensure_soffice_daemon", return_value=desktop), \
+                patch("subprocess.run") as mock_run:
+            result = assembler._convert_pptx_to_pdf(sample_pptx)
+
+        assert result == assembler.temp_dir / "sample.pdf"
+        assert result.read_bytes() == b"%PDF-1.4 fake"
+        assert doc.storeToURL.call_args[0][0] == "private:stream"
+        doc.close.assert_called_once_with(True)
+        mock_run.assert_not_called()
+
+    def test_daemon_listens_on_private_pipe(
+        self, assembler: VideoAssembler, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """The daemon gets a per-assembler pipe and the resolver connects only to it."""
+        monkeypatch.setattr(f"{_VA}._UNO_CONNECT_POLL", 0)
+        uno = MagicMock()
+        resolver = uno.getComponentContext().ServiceManager.createInstanceWithContext.return_value
+        ctx = MagicMock()
+        resolver.resolve.side_effect = [Exception("NoConnectException"), ctx]
+        proc = MagicMock(pid=4242)
+        proc.poll.return_value = None
+
+        with patch("subprocess.Popen", return_value=proc) as mock_popen:
+            desktop = assembler._ensure_soffice_daemon(uno)
+            assert assembler._ensure_soffice_daemon(uno) is desktop  # reused
+
+        mock_popen.assert_called_once()
+        pipe = f"neurosync_{os.getpid()}_{id(assembler)}"
+        profile = (assembler.temp_dir / f"lo_profile_{pipe}").resolve()
+        argv = mock_popen.call_args[0][0]
+        assert f"--accept=pipe,name={pipe};urp;" in argv
+        assert f"-env:UserInstallation={profile.as_uri()}" in argv
+        assert all(pipe in call.args[0] for call in resolver.resolve.call_args_list)
+        assert desktop is ctx.ServiceManager.createInstanceWithContext.return_value
+
+        profile.mkdir()  # stands in for the profile soffice would create
+        assembler.close()
+        proc.terminate.assert_called_once()
+        assert not profile.exists()
+
+    def test_daemon_stopped_when_assembler_collected(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """An assembler dropped without close() still stops its soffice daemon."""
+        import gc
+
+        monkeypatch.chdir(tmp_path)
+        uno = MagicMock()
+        proc = MagicMock(pid=4242)
+        proc.poll.return_value = None
+        asm = VideoAssembler(method="pillow")
+        with patch("subprocess.Popen", return_value=proc):
+            asm._ensure_soffice_daemon(uno)
+
+        del asm
+        gc.collect()
+        proc.terminate.assert_called_once()
+
+    def test_export_raises_when_document_not_loaded(
+        self, assembler: VideoAssembler, sample_pptx: Path,
+    ) -> None:
+        """loadComponentFromURL returning None is a clear RuntimeError."""
+        desktop = MagicMock()
+        desktop.loadComponentFromURL.return_value = None
+        with patch.object(assembler, "_ensure_soffice_daemon", return_value=desktop):
+            with pytest.raises(RuntimeError, match="could not open"):
+                assembler._export_pdf_bytes(MagicMock(), sample_pptx)
+
+    def test_export_times_out_and_stops_daemon(
+        self, assembler: VideoAssembler, sample_pptx: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A hung UNO export is bounded by the LibreOffice timeout."""
+        import threading
+
+        monkeypatch.setattr(f"{_VA}._LIBREOFFICE_TIMEOUT", 0.05)
+        released = threading.Event()
+        desktop = MagicMock()
+        desktop.loadComponentFromURL.return_value.storeToURL.side_effect = (
+            lambda *_a: released.wait(5)
+        )
+        with patch.object(assembler, "_ensure_soffice_daemon", return_value=desktop), \
+                patch(f"{_VA}._make_output_sink"), \
+                patch.object(assembler, "close", side_effect=released.set) as mock_close:
+            with pytest.raises(RuntimeError, match="timed out"):
+                assembler._export_pdf_bytes(MagicMock(), sample_pptx)
+
+        mock_close.assert_called_once()
+
+    def test_close_terminates_daemon(self, assembler: VideoAssembler) -> None:
+        """close() stops a running soffice daemon and forgets it."""
+        proc = MagicMock()
+        proc.poll.return_value = None
+        assembler._soffice_daemon = proc
+        assembler._uno_desktop = MagicMock()
+
+        assembler.close()
+
+        proc.terminate.assert_called_once()
+        assert assembler._soffice_daemon is None
+        assert assembler._uno_desktop is None
+
+    @pytest.mark.asyncio
+    async def test_convert_many_async(self, assembler: VideoAssembler, tmp_path: Path) -> None:
+        """convert_many_async runs soffice per deck and returns PDFs in input order."""
+        decks = [tmp_path / "a" / "deck.pptx", tmp_path / "b" / "deck.pptx", tmp_path / "c.pptx"]
+
+        async def fake_exec(*args: str, **_kw: Any) -> MagicMock:
+            # Emulate soffice: write <stem>.pdf into the requested --outdir.
+            outdir = Path(args[args.index("--outdir") + 1])
+            (outdir / f"{Path(args[-1]).stem}.pdf").write_bytes(b"%PDF-1.4 fake")
+
+            async def communicate() -> tuple[bytes, bytes]:
+                await asyncio.sleep(0)  # yield so the slots are really contended
+                return b"", b""
+
+            return MagicMock(returncode=0, communicate=communicate)
+
+        with patch("asyncio.create_subprocess_exec", AsyncMock(side_effect=fake_exec)) as mock_exec:
+            result = await assembler.convert_many_async(decks, max_concurrency=2)
+
+        assert [p.stem for p in result] == ["deck", "deck", "c"]
+        assert len(set(result)) == 3  # same-stem decks do not share an output file
+        assert all(p.exists() for p in result)
+        assert mock_exec.await_count == 3
+        profiles = {call.args[1] for call in mock_exec.await_args_list}
+        assert len(profiles) == 2  # one LibreOffice profile per concurrency slot
+
+    @pytest.mark.asyncio
+    async def test_convert_many_async_raises_on_failure(
+        self, assembler: VideoAssembler, sample_pptx: Path,
+    ) -> None:
+        """RuntimeError when any soffice run returns non-zero."""
+        proc = MagicMock(returncode=1)
+        proc.communicate = AsyncMock(return_value=(b"", b"error"))
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
+            with pytest.raises(RuntimeError, match="soffice failed"):
+                await assembler.convert_many_async([sample_pptx])
+
+    @pytest.mark.asyncio
+    async def test_convert_many_async_ignores_stale_pdf(
+        self, assembler: VideoAssembler, sample_pptx: Path,
+    ) -> None:
+        """A run that exits 0 without writing does not return an earlier PDF."""
+        stale = assembler.temp_dir / "pdf_0" / f"{sample_pptx.stem}.pdf"
+        stale.parent.mkdir()
+        stale.write_bytes(b"%PDF-1.4 from an earlier call")
+        proc = MagicMock(returncode=0)
+        proc.communicate = AsyncMock(return_value=(b"", b""))
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
+            with pytest.raises(FileNotFoundError, match="Expected PDF not found"):
+                await assembler.convert_many_async([sample_pptx])
+
+    @pytest.mark.asyncio
+    async def test_convert_many_async_kills_siblings_on_failure(
+        self, assembler: VideoAssembler, sample_pptx: Path,
+    ) -> None:
+        """When one conversion fails, still-running soffice processes are killed."""
+        failed = MagicMock(returncode=1)
+        failed.communicate = AsyncMock(return_value=(b"", b"error"))
+
+        async def never_finish() -> tuple[bytes, bytes]:
+            await asyncio.Event().wait()
+            return b"", b""
+
+        hung = MagicMock(returncode=None, communicate=never_finish)
+        hung.wait = AsyncMock()
+
+        with patch("asyncio.create_subprocess_exec", AsyncMock(side_effect=[hung, failed])):
+            with pytest.raises(RuntimeError, match="soffice failed"):
+                await assembler.convert_many_async([sample_pptx, sample_pptx])
+
+        hung.kill.assert_called_once()
+        hung.wait.assert_awaited_once()
+
     def test_convert_pdf_to_pngs(self, assembler: VideoAssembler) -> None:
         """_convert_pdf_to_pngs invokes pdftoppm and finds generated PNGs."""
-        # Pre-create fake output PNGs
-        for i in range(1, 4):
-            (assembler.temp_dir / f"slide-{i}.png").write_bytes(b"PNG")
-
         fake_pdf = assembler.temp_dir / "deck.pdf"
         fake_pdf.write_bytes(b"%PDF")
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0, stderr="")
+        with patch("subprocess.run", side_effect=_fake_pdftoppm(3)):
             result = assembler._convert_pdf_to_pngs(fake_pdf)
 
         assert len(result) == 3
         assert all(p.name.startswith("slide-") for p in result)
 
+    def test_convert_pdf_to_pngs_honours_last_page(self, assembler: VideoAssembler) -> None:
+        """last_page is passed to pdftoppm and stale PNGs are not returned."""
+        for i in range(1, 6):  # a previous 5-slide render left these behind
+            (assembler.temp_dir / f"slide-{i}.png").write_bytes(b"PNG")
+
+        with patch("subprocess.run", side_effect=_fake_pdftoppm(2)) as mock_run:
+            result = assembler._convert_pdf_to_pngs(b"%PDF-1.4 fake", last_page=2)
+
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("-l") + 1] == "2"
+        assert [p.name for p in result] == ["slide-1.png", "slide-2.png"]
+
+    def test_convert_pdf_to_pngs_drops_differently_padded_leftovers(
+        self, assembler: VideoAssembler,
+    ) -> None:
+        """Zero-padded PNGs from a longer earlier render are cleared first."""
+        for i in range(1, 13):  # a previous 12-slide render: slide-01 … slide-12
+            (assembler.temp_dir / f"slide-{i:02d}.png").write_bytes(b"PNG")
+
+        with patch("subprocess.run", side_effect=_fake_pdftoppm(3)):
+            result = assembler._convert_pdf_to_pngs(b"%PDF-1.4 fake")
+
+        assert [p.name for p in result] == ["slide-1.png", "slide-2.png", "slide-3.png"]
+
+    def test_convert_pdf_bytes_to_pngs_via_stdin(self, assembler: VideoAssembler) -> None:
+        """PDF bytes are piped to pdftoppm on stdin; no PDF file is written."""
+        with patch("subprocess.run", side_effect=_fake_pdftoppm(2)) as mock_run:
+            result = assembler._convert_pdf_to_pngs(b"%PDF-1.4 fake")
+
+        assert len(result) == 2
+        assert "-" in mock_run.call_args[0][0]
+        assert mock_run.call_args.kwargs["input"] == b"%PDF-1.4 fake"
+        assert not list(assembler.temp_dir.glob("*.pdf"))
+
     def test_convert_pdf_to_pngs_raises_on_failure(self, assembler: VideoAssembler) -> None:
         """RuntimeError when pdftoppm returns non-zero."""
         fake_pdf = assembler.temp_dir / "deck.pdf"
         fake_pdf.write_bytes(b"%PDF")
 
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=1, stderr="bad PDF")
+            mock_run.return_value = MagicMock(returncode=1, stderr=b"bad PDF")
             with pytest.raises(RuntimeError, match="pdftoppm failed"):
                 assembler._convert_pdf_to_pngs(fake_pdf)
 
@@ -214,12 +477,50 @@ class TestPptxToImages:
         with pytest.raises(FileNotFoundError):
             assembler.pptx_to_images("/nonexistent/deck.pptx")
 
+    @pytest.mark.parametrize("method", ["pillow", "cairo", "libreoffice"])
+    def test_rejects_non_positive_max_slides(
+        self, assembler: VideoAssembler, sample_pptx: Path, method: str,
+    ) -> None:
+        """max_slides=0 is an error for every method, not 'nothing' or 'everything'."""
+        assembler.method = method
+        with pytest.raises(ValueError, match="max_slides"):
+            assembler.pptx_to_images(sample_pptx, max_slides=0)
+
     def test_dispatches_to_pillow(self, assembler: VideoAssembler, sample_pptx: Path) -> None:
         """Uses Pillow path when method == 'pillow'."""
         assembler.method = "pillow"
         images = assembler.pptx_to_images(sample_pptx)
         assert len(images) == 3
 
+    def test_dispatches_to_cairo(self, assembler: VideoAssembler, sample_pptx: Path) -> None:
+        """Uses the cairo renderer when method == 'cairo'."""
+        assembler.method = "cairo"
+        with patch.object(
+            assembler, "_pptx_to_images_cairo", return_value=[Path("slide_000.png")],
+        ) as mock_cairo:
+            images = assembler.pptx_to_images(sample_pptx)
+        mock_cairo.assert_called_once_with(sample_pptx, None)
+        assert images == [Path("slide_000.png")]
+
+    def test_cairo_falls_back_without_cairocffi(
+        self, assembler: VideoAssembler, sample_pptx: Path,
+    ) -> None:
+        """Falls back to Pillow when cairocffi cannot be imported."""
+        assembler.method = "cairo"
+        with patch.object(assembler, "_pptx_to_images_cairo", side_effect=ImportError):
+            images = assembler.pptx_to_images(sample_pptx)
+        assert len(images) == 3
+
+    def test_renders_with_cairo(self, assembler: VideoAssembler, sample_pptx: Path) -> None:
+        """cairo renderer produces one full-resolution PNG per slide."""
+        pytest.importorskip("cairocffi")
+        from PIL import Image
+
+        images = assembler._pptx_to_images_cairo(sample_pptx)
+        assert len(images) == 3
+        with Image.open(images[0]) as img:
+            assert img.size == assembler.resolution
+
     def test_falls_back_on_libreoffice_error(
         self, assembler: VideoAssembler, sample_pptx: Path,
     ) -> None:
@@ -233,6 +534,102 @@ class TestPptxToImages:
         assert len(images) == 3
 
 
+# ---------------------------------------------------------------------------
+# create_video — raw frames piped to ffmpeg
+# ---------------------------------------------------------------------------
+
+def _write_silence(path: Path, seconds: float, rate: int = 8000) -> Path:
+    """Write a mono 16-bit silent WAV."""
+    import wave
+
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(b"\x00\x00" * int(seconds * rate))
+    return path
+
+
+class TestPipedVideo:
+    """Tests for create_video(keep_intermediate_pngs=False)."""
+
+    def test_streams_raw_frames_without_pngs(
+        self, assembler: VideoAssembler, sample_pptx: Path, tmp_path: Path,
+    ) -> None:
+        """Each slide is written to ffmpeg's stdin for its audio duration; no PNGs hit disk."""
+        assembler.resolution = (64, 36)
+        assembler.fps = 10
+        proc = MagicMock(returncode=0)
+        proc.communicate.return_value = (b"", b"")
+        with patch(f"{_VA}._ffmpeg_exe", return_value="ffmpeg"), \
+                patch("subprocess.Popen", return_value=proc) as mock_popen, \
+                patch.object(VideoAssembler, "_audio_duration", return_value=0.5):
+            result = assembler.create_video(
+                sample_pptx, ["a.mp3", "b.mp3", "c.mp3"], tmp_path / "out.mp4",
+                keep_intermediate_pngs=False,
+            )
+
+        cmd = mock_popen.call_args[0][0]
+        assert cmd[cmd.index("-f") + 1] == "rawvideo"
+        assert cmd[cmd.index("-s") + 1] == "64x36"
+        frame_bytes = 64 * 36 * 3
+        writes = [c.args[0] for c in proc.stdin.write.call_args_list]
+        assert len(writes) == 3 * 5  # 3 slides × 0.5 s × 10 fps
+        assert all(len(w) == frame_bytes for w in writes)
+        assert result.segment_count == 3
+        assert list(assembler.temp_dir.glob("*.png")) == []
+
+    def test_raises_on_ffmpeg_failure(
+        self, assembler: VideoAssembler, sample_pptx: Path, tmp_path: Path,
+    ) -> None:
+        """RuntimeError when ffmpeg exits non-zero."""
+        assembler.resolution = (64, 36)
+        proc = MagicMock(returncode=1)
+        proc.communicate.return_value = (b"", b"bad codec")
+        with patch(f"{_VA}._ffmpeg_exe", return_value="ffmpeg"), \
+                patch("subprocess.Popen", return_value=proc), \
+                patch.object(VideoAssembler, "_audio_duration", return_value=0.1):
+            with pytest.raises(RuntimeError, match="ffmpeg failed"):
+                assembler.create_video(
+                    sample_pptx, ["a.mp3"], tmp_path / "out.mp4",
+                    keep_intermediate_pngs=False,
+                )
+
+    def test_kills_ffmpeg_when_rendering_fails(
+        self, assembler: VideoAssembler, sample_pptx: Path, tmp_path: Path,
+    ) -> None:
+        """A render error kills ffmpeg, removes the partial output and propagates."""
+        out = tmp_path / "out.mp4"
+        out.write_bytes(b"partial")  # stands in for ffmpeg's truncated file
+        proc = MagicMock()
+        with patch(f"{_VA}._ffmpeg_exe", return_value="ffmpeg"), \
+                patch("subprocess.Popen", return_value=proc), \
+                patch.object(VideoAssembler, "_audio_duration", return_value=0.1), \
+                patch.object(assembler, "_render_text_image", side_effect=OSError("bad font")):
+            with pytest.raises(OSError, match="bad font"):
+                assembler.create_video(
+                    sample_pptx, ["a.mp3"], out, keep_intermediate_pngs=False,
+                )
+
+        proc.stdin.close.assert_called_once()
+        proc.kill.assert_called_once()
+        proc.wait.assert_called_once()
+        proc.communicate.assert_not_called()
+        assert not out.exists()
+
+    @pytest.mark.slow
+    def test_real_ffmpeg_encode(self, sample_pptx: Path, tmp_path: Path) -> None:
+        """End-to-end encode through the real ffmpeg binary (unpatched which())."""
+        asm = VideoAssembler(resolution=(320, 180), method="pillow")
+        asm.temp_dir = tmp_path
+        audio = [_write_silence(tmp_path / f"a{i}.wav", 0.5) for i in range(3)]
+        result = asm.create_video(
+            sample_pptx, audio, tmp_path / "out.mp4", keep_intermediate_pngs=False,
+        )
+        assert result.file_size_bytes > 0
+        assert result.total_duration_seconds == pytest.approx(1.5, abs=0.05)
+
+
 # ---------------------------------------------------------------------------
 # Cleanup
 # ---------------------------------------------------------------------------
@@ -241,12 +638,15 @@ class TestCleanup:
     """Tests for temp-file cleanup."""
 
     def test_cleanup_removes_png_and_pdf(self, assembler: VideoAssembler) -> None:
-        """cleanup() deletes *.png and *.pdf from temp_dir."""
+        """cleanup() deletes *.png and *.pdf, including per-deck pdf_<n> dirs."""
         (assembler.temp_dir / "slide_000.png").write_bytes(b"PNG")
         (assembler.temp_dir / "deck.pdf").write_bytes(b"PDF")
+        (assembler.temp_dir / "pdf_0").mkdir()
+        (assembler.temp_dir / "pdf_0" / "deck.pdf").write_bytes(b"PDF")
         assembler.cleanup()
         assert list(assembler.temp_dir.glob("*.png")) == []
         assert list(assembler.temp_dir.glob("*.pdf")) == []
+        assert not (assembler.temp_dir / "pdf_0").exists()
 
     def test_cleanup_skipped_in_debug(
         self, assembler: VideoAssembler, monkeypatch: pytest.MonkeyPatch,
@@ -1,5 +1,5 @@
 """
-NeuroSync AI — Blink signal tests (5 tests).
+NeuroSync AI — Blink signal tests (6 tests).
 
 All tests use synthetic landmarks — no real camera required.
 """
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import time
 
-import pytest
+import numpy as np
 
 from neurosync.webcam.signals.blink import BlinkSignal
 from tests.conftest_webcam import (
@@ -17,6 +17,12 @@ from tests.conftest_webcam import (
 )
 
 
+def _seed_blinks(blink: BlinkSignal, times: np.ndarray) -> None:
+    """Register ascending blink timestamps as if they had been detected."""
+    for t in times:
+        blink._register_blink(float(t))
+
+
 class TestBlinkSignal:
     """Tests for the BlinkSignal processor."""
 
@@ -31,10 +37,10 @@ class TestBlinkSignal:
         blink.process(closed)
         blink.process(closed)
         blink.process(closed)
-        result = blink.process(neutral)
+        blink.process(neutral)
 
         # At least one blink should be registered
-        assert len(blink._blink_times) >= 1
+        assert blink._bt_count >= 1
 
     def test_normal_blink_rate_not_fatigue(self) -> None:
         """15 blinks/min → fatigue_indicator = False."""
@@ -42,8 +48,7 @@ class TestBlinkSignal:
         blink._first_frame_time = time.time() - 60.0  # pretend 60s elapsed
         # Inject 15 blinks over 60 seconds
         now = time.time()
-        for i in range(15):
-            blink._blink_times.append(now - 60 + i * 4)
+        _seed_blinks(blink, now - 60 + np.arange(15) * 4.0)
         result = blink.process(make_neutral_landmarks())
         assert result.fatigue_indicator is False
 
@@ -52,8 +57,7 @@ class TestBlinkSignal:
         blink = BlinkSignal()
         blink._first_frame_time = time.time() - 60.0
         now = time.time()
-        for i in range(28):
-            blink._blink_times.append(now - 60 + i * 2)
+        _seed_blinks(blink, now - 60 + np.arange(28) * 2.0)
         result = blink.process(make_neutral_landmarks())
         assert result.fatigue_indicator is True
         assert result.blink_rate_per_minute > 25
@@ -63,8 +67,7 @@ class TestBlinkSignal:
         blink = BlinkSignal()
         blink._first_frame_time = time.time() - 60.0
         now = time.time()
-        for i in range(6):
-            blink._blink_times.append(now - 60 + i * 10)
+        _seed_blinks(blink, now - 60 + np.arange(6) * 10.0)
         result = blink.process(make_neutral_landmarks())
         assert result.flow_indicator is True
         assert result.blink_rate_per_minute < 8
@@ -75,3 +78,16 @@ class TestBlinkSignal:
         blink._first_frame_time = time.time() - 10.0  # only 10s
         result = blink.process(make_neutral_landmarks())
         assert result.confidence < 1.0
+
+    def test_blink_buffer_wraps_in_order(self) -> None:
+        """Ring buffer keeps the newest timestamps and trims oldest-first once it wraps."""
+        blink = BlinkSignal()
+        capacity = len(blink._blink_times)
+        for t in range(capacity + 10):
+            blink._register_blink(float(t))
+        assert blink._bt_count == capacity
+        # Oldest surviving blink is t=10, so a cutoff of 20 drops exactly 10
+        blink._trim_blinks(20.0)
+        assert blink._bt_count == capacity - 10
+        blink._trim_blinks(capacity + 10.0)
+        assert blink._bt_count == 0
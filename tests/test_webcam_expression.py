@@ -6,15 +6,11 @@ All tests use synthetic landmarks — no real camera required.
 
 from __future__ import annotations
 
-import pytest
-import numpy as np
-
 from neurosync.webcam.signals.expression import ExpressionSignal
 from neurosync.webcam.mediapipe_processor import RawLandmarks
 from tests.conftest_webcam import (
     make_neutral_landmarks,
     make_frustrated_landmarks,
-    make_bored_landmarks,
     _default_landmarks,
 )
 
@@ -9,9 +9,6 @@ from __future__ import annotations
 import time
 from pathlib import Path
 
-import numpy as np
-import pytest
-
 from neurosync.webcam.fusion import WebcamFusionEngine, WebcamMomentScores
 from neurosync.webcam.injector import WebcamSignalInjector
 from neurosync.webcam.signals.blink import BlinkSignal
@@ -25,10 +22,7 @@ from neurosync.database.repositories.sessions import SessionRepository
 from neurosync.core.events import SessionConfig
 
 from tests.conftest_webcam import (
-    make_neutral_landmarks,
     make_no_face_landmarks,
-    make_bored_landmarks,
-    make_looking_left_landmarks,
     make_frustrated_landmarks,
 )
 
@@ -51,9 +45,8 @@ class TestWebcamFusion:
         engine = _make_engine()
 
         # Set gaze off-screen for a long time
-        engine._gaze._off_screen_start = time.time() - 5.0
+        engine._gaze._off_screen_start = time.monotonic() - 5.0
 
-        bored_lm = make_bored_landmarks()
         # Shift iris left to also be off-screen
         from tests.conftest_webcam import _shift_iris_left, _make_bored, _default_landmarks
         combined_lm_list = _shift_iris_left(_make_bored(_default_landmarks()))
@@ -10,11 +10,12 @@ import time
 
 import pytest
 
+from neurosync.webcam.signals import gaze as gaze_module
 from neurosync.webcam.signals.gaze import GazeSignal
+from tests.conftest_graph import FakeClock
 from tests.conftest_webcam import (
     make_neutral_landmarks,
     make_looking_left_landmarks,
-    make_no_face_landmarks,
 )
 
 
@@ -36,21 +37,23 @@ class TestGazeSignal:
         assert result.gaze_direction in ("left", "away")
         assert result.confidence > 0.0
 
-    def test_gaze_off_screen_duration_accumulates(self) -> None:
+    def test_gaze_off_screen_duration_accumulates(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Consecutive off-screen frames accumulate duration."""
+        clock = FakeClock(1000.0)
+        monkeypatch.setattr(gaze_module, "time", clock)
         gaze = GazeSignal()
         lm = make_looking_left_landmarks()
-        # Process several off-screen frames
+        # Process several off-screen frames, 10 ms apart
         for _ in range(5):
             result = gaze.process(lm)
-            time.sleep(0.01)
+            clock.advance(0.01)
         assert result.off_screen_duration_ms > 0
 
     def test_gaze_off_screen_trigger_fires_at_threshold(self) -> None:
         """Off-screen for > GAZE_OFF_SCREEN_TRIGGER_MS → triggered = True."""
         gaze = GazeSignal()
         # Manually set the off-screen start in the past
-        gaze._off_screen_start = time.time() - 5.0  # 5 seconds ago
+        gaze._off_screen_start = time.monotonic() - 5.0  # 5 seconds ago
         lm = make_looking_left_landmarks()
         result = gaze.process(lm)
         assert result.off_screen_triggered is True